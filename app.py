@@ -1,14 +1,20 @@
 import os
 import json
-import asyncio
+import concurrent.futures
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import streamlit as st
-from helper import AIAssistant, get_current_year, text_to_speech, fetch_news_data
+from helper import AIAssistant, get_current_year
+from logger.app_logger import trace
+from resources import get_metrics_server, get_session_assistant, get_speech_service, reset_session, stream_news, submit_llm
+
+AUDIO_TIMEOUT_SECONDS: int = 60
+SUMMARY_AFTER_RESULTS: int = 3  # Start the LLM summary once this many articles have arrived
 
 # ============================ UI CONFIGURATION ============================
 
 st.set_page_config(layout="wide")  # Configure page layout for better visibility
+get_metrics_server()  # Prometheus /metrics endpoint, started once per process
 st.title("IntelliSearch AI 🤖")  # Application header
 
 # ============================ CONFIGURATION PANEL ============================
@@ -78,7 +84,7 @@ with st.sidebar:
 
     # Session reset option
     if st.button("🧹 Reset Session"):
-        st.session_state.messages = []
+        reset_session()
         st.rerun()
 
     # Dynamic copyright footer
@@ -98,109 +104,145 @@ if not isinstance(st.session_state.messages, list) or not all(isinstance(msg, di
 for msg in st.session_state.messages:
     with st.chat_message(msg["role"]):
         st.markdown(msg["content"])
+        if msg.get("audio"):
+            st.audio(msg["audio"], format="audio/mpeg")
 
-# ============================ QUERY PROCESSING ============================
+# ============================ RESULT FORMATTING ============================
 
-# Handle user input
-if query := st.chat_input("What would you like to know?"):
-    st.chat_message("user").markdown(query)
-    st.session_state.messages.append({"role": "user", "content": query})
+def sanitize_title(raw_title: str) -> str:
+    """
+    Formats title for proper display by replacing delimiter characters.
+
+    Args:
+        raw_title (str): Original title text.
+
+    Returns:
+        str: Formatted title suitable for display.
+    """
+    return raw_title.replace("|", " - ").strip()
 
-    # Initialize results table
-    results_table: str = "**No matching results found.**"
 
+def format_rating(raw_rating: str) -> str:
+    """
+    Creates visual star rating representation.
+
+    Args:
+        raw_rating (str): Numerical rating value.
+
+    Returns:
+        str: Star-based rating display (⭐ and ⭐½).
+    """
     try:
-        with st.spinner("Processing request..."):
-            if ai_only_mode:
-                search_response: str = "<empty>"
-            else:
-                # Execute search query
-                search_output: Dict[str, Any] = asyncio.run(
-                    fetch_news_data(query=query, region=region_code, count=result_count, time_filter=temporal_filter)
-                )
-
-                if search_output["status"] == "success":
-                    markdown_results: List[Dict[str, Any]] = search_output["results"]
-                    search_response = f"Search results:\n{markdown_results}"
-
-                    def sanitize_title(raw_title: str) -> str:
-                        """
-                        Formats title for proper display by replacing delimiter characters.
-
-                        Args:
-                            raw_title (str): Original title text.
-
-                        Returns:
-                            str: Formatted title suitable for display.
-                        """
-                        return raw_title.replace("|", " - ").strip()
-
-                    def format_rating(raw_rating: str) -> str:
-                        """
-                        Creates visual star rating representation.
-
-                        Args:
-                            raw_rating (str): Numerical rating value.
-
-                        Returns:
-                            str: Star-based rating display (⭐ and ⭐½).
-                        """
-                        try:
-                            rating_val: float = float(raw_rating)
-                            full_count: int = int(rating_val)
-                            has_half: str = "⭐½" if (rating_val - full_count) >= 0.5 else ""
-                            return "⭐" * full_count + has_half
-                        except ValueError:
-                            return "⭐"
-
-                    # Construct results table
-                    results_table = "| # | Title | Rating | Summary |\n|---|------|--------|---------|\n"
-
-                    for item in markdown_results:
-                        clean_title = sanitize_title(item['title'])
-                        raw_rating = str(item.get('rating', '⭐')).strip()
-
-                        if raw_rating.replace('.', '', 1).isdigit():
-                            rating_display = format_rating(raw_rating)
-                        else:
-                            rating_display = "⭐"
-
-                        if item.get('link', '').startswith("http"):
-                            title_display = f"[{clean_title}]({item['link']})"
-                        else:
-                            title_display = clean_title
-
-                        summary_text = item.get('summary', '').strip()
-                        truncated_summary = summary_text[:100] + "..." if len(summary_text) > 100 else summary_text
-
-                        results_table += f"| {item['num']} | {title_display} | {rating_display} | {truncated_summary} |\n"
-            
-            # Generate AI response
-            assistant = AIAssistant()
-            assistant.history = st.session_state.messages.copy()
-            response = assistant.generate_response(
-                f"""
+        rating_val: float = float(raw_rating)
+        full_count: int = int(rating_val)
+        has_half: str = "⭐½" if (rating_val - full_count) >= 0.5 else ""
+        return "⭐" * full_count + has_half
+    except ValueError:
+        return "⭐"
+
+
+def build_results_table(articles: List[Dict[str, Any]]) -> str:
+    """
+    Render the articles received so far as a markdown table in search-rank order.
+
+    Args:
+        articles (List[Dict[str, Any]]): Processed articles, in any order.
+
+    Returns:
+        str: Markdown table.
+    """
+    results_table = "| # | Title | Rating | Summary |\n|---|------|--------|---------|\n"
+
+    for item in sorted(articles, key=lambda article: article["num"]):
+        clean_title = sanitize_title(item['title'])
+        raw_rating = str(item.get('rating', '⭐')).strip()
+
+        if raw_rating.replace('.', '', 1).isdigit():
+            rating_display = format_rating(raw_rating)
+        else:
+            rating_display = "⭐"
+
+        if item.get('link', '').startswith("http"):
+            title_display = f"[{clean_title}]({item['link']})"
+        else:
+            title_display = clean_title
+
+        summary_text = item.get('summary', '').strip()
+        truncated_summary = summary_text[:100] + "..." if len(summary_text) > 100 else summary_text
+
+        results_table += f"| {item['num']} | {title_display} | {rating_display} | {truncated_summary} |\n"
+    return results_table
+
+
+def build_summary_prompt(query: str, articles: List[Dict[str, Any]]) -> str:
+    """Prompt asking the assistant to answer the query from the articles received so far."""
+    search_response: str = f"Search results:\n{articles}" if articles else "<empty>"
+    return f"""
                 Query: {query}
                 Results: {search_response}
-                Context: {[item['summary'] for item in search_output.get("results", [])]}
+                Context: {[item['summary'] for item in articles]}
                 Use search results if available, otherwise base response on conversation history.
                 """
-            )
-
-    except Exception as e:
-        st.warning(f"Search error occurred: {e}")
-        response = "Service temporarily unavailable. Please try again."
-
-    # Generate audio response
-    text_to_speech(response)
 
-    # Display response
-    with st.chat_message("assistant"):
-        st.markdown(response, unsafe_allow_html=True)
-        st.audio("output.mp3", format="audio/mpeg", loop=True)
-        with st.expander("Source References:", expanded=True):
-            st.markdown(results_table, unsafe_allow_html=True)
+# ============================ QUERY PROCESSING ============================
 
-    # Update conversation log
-    complete_response: str = f"{response}\n\n{results_table}"
-    st.session_state.messages.append({"role": "assistant", "content": complete_response})
\ No newline at end of file
+# Handle user input
+if query := st.chat_input("What would you like to know?"):
+    # Tag every log line and timing span of this query with one trace id
+    with trace():
+        st.chat_message("user").markdown(query)
+        st.session_state.messages.append({"role": "user", "content": query})
+
+        # Initialize results table
+        results_table: str = "**No matching results found.**"
+        articles: List[Dict[str, Any]] = []
+        summary_future: Optional[concurrent.futures.Future] = None
+
+        with st.chat_message("assistant"):
+            # Placeholders keep the final layout while content streams in
+            response_slot = st.empty()
+            audio_slot = st.empty()
+            with st.expander("Source References:", expanded=True):
+                table_slot = st.empty()
+
+            try:
+                with st.spinner("Processing request..."):
+                    # Answer with this session's conversation log
+                    assistant: AIAssistant = get_session_assistant()
+
+                    if not ai_only_mode:
+                        # Render each article as soon as it has been fetched and rated
+                        for article in stream_news(query=query, region=region_code, count=result_count, time_filter=temporal_filter):
+                            articles.append(article)
+                            results_table = build_results_table(articles)
+                            table_slot.markdown(results_table, unsafe_allow_html=True)
+
+                            # Start the LLM summary once the first few results are in
+                            if summary_future is None and len(articles) >= SUMMARY_AFTER_RESULTS:
+                                summary_future = submit_llm(assistant.generate_response, build_summary_prompt(query, articles))
+
+                    if summary_future is None:
+                        summary_future = submit_llm(assistant.generate_response, build_summary_prompt(query, articles))
+                    response = summary_future.result()
+
+            except Exception as e:
+                st.warning(f"Search error occurred: {e}")
+                response = "Service temporarily unavailable. Please try again."
+
+            response_slot.markdown(response, unsafe_allow_html=True)
+            table_slot.markdown(results_table, unsafe_allow_html=True)
+
+        # Update conversation log
+        complete_response: str = f"{response}\n\n{results_table}"
+        st.session_state.messages.append({"role": "assistant", "content": complete_response})
+
+        # Synthesise audio in the background; the text is already on screen
+        audio_future = get_speech_service().submit(response)
+
+        # Attach the audio to the answer once it is ready
+        try:
+            audio_bytes: bytes = audio_future.result(timeout=AUDIO_TIMEOUT_SECONDS)
+            audio_slot.audio(audio_bytes, format="audio/mpeg", loop=True)
+            st.session_state.messages[-1]["audio"] = audio_bytes
+        except Exception:
+            audio_slot.caption("🔇 Audio unavailable for this answer.")
\ No newline at end of file
@@ -0,0 +1,138 @@
+import argparse
+import json
+import os
+import time
+from typing import Dict, List, Any
+import numpy as np
+import pandas as pd
+from keras.utils import to_categorical
+from credibility_model import MODEL_CONFIGS, build_model_from_config
+from text_encoder import TextEncoder
+
+
+def load_training_data(csv_paths: List[str], vocab_path: str) -> Dict[str, Any]:
+    """
+    Load rating CSVs and encode them with the shipped tokenizer.
+
+    Args:
+        csv_paths (List[str]): CSV files with user_prompt, func_rating and custom_rating columns.
+        vocab_path (str): Tokenizer vocabulary served alongside the model.
+
+    Returns:
+        Dict[str, Any]: Encoded inputs, one-hot targets and the vocabulary/sequence sizes.
+    """
+    df = pd.concat([pd.read_csv(path) for path in csv_paths], ignore_index=True)
+    df = df.dropna(subset=["user_prompt", "func_rating", "custom_rating"])
+    df[["func_rating", "custom_rating"]] = df[["func_rating", "custom_rating"]].round().astype(int)
+
+    encoder = TextEncoder.from_json(vocab_path)
+
+    vocab_size = len(encoder.word_index) + 1
+    max_length = max(len(x.split()) for x in df["user_prompt"])
+
+    X_text = encoder.encode(list(df["user_prompt"]), maxlen=max_length, padding='post')
+    X_func_rating = np.array(df["func_rating"]).reshape(-1, 1)
+    y_one_hot = to_categorical(np.clip(df["custom_rating"], 0, 5), num_classes=6)
+
+    return {
+        "X_text": X_text,
+        "X_func_rating": X_func_rating,
+        "y": y_one_hot,
+        "vocab_size": vocab_size,
+        "max_length": max_length,
+    }
+
+
+def split_data(data: Dict[str, Any], validation_split: float, seed: int) -> Dict[str, Any]:
+    """Shuffle once with a fixed seed so every configuration sees the same train/validation rows."""
+    indices = np.random.default_rng(seed).permutation(len(data["y"]))
+    n_val = max(1, int(len(indices) * validation_split))
+    val_idx, train_idx = indices[:n_val], indices[n_val:]
+    return {
+        "train": ({"text_input": data["X_text"][train_idx], "func_rating_input": data["X_func_rating"][train_idx]}, data["y"][train_idx]),
+        "val": ({"text_input": data["X_text"][val_idx], "func_rating_input": data["X_func_rating"][val_idx]}, data["y"][val_idx]),
+    }
+
+
+def measure_predict_latency(model, inputs: Dict[str, np.ndarray], repeats: int) -> Dict[str, float]:
+    """
+    Time single-row predictions the way rate_article_credibility issues them.
+
+    Returns:
+        Dict[str, float]: p50 and p99 latency in milliseconds.
+    """
+    row = {name: values[:1] for name, values in inputs.items()}
+    model.predict(row, verbose=0)  # Warm-up builds the predict function
+
+    timings: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        model.predict(row, verbose=0)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return {"p50_ms": float(np.percentile(timings, 50)), "p99_ms": float(np.percentile(timings, 99))}
+
+
+def benchmark_config(name: str, data: Dict[str, Any], splits: Dict[str, Any], repeats: int) -> Dict[str, Any]:
+    """Train one configuration and collect its size, cost and accuracy."""
+    config = MODEL_CONFIGS[name]
+    model = build_model_from_config(name, data["vocab_size"], data["max_length"])
+    train_x, train_y = splits["train"]
+    val_x, val_y = splits["val"]
+
+    start = time.perf_counter()
+    model.fit(train_x, train_y, epochs=config["epochs"], batch_size=config["batch_size"], verbose=0)
+    train_seconds = time.perf_counter() - start
+
+    _, val_accuracy = model.evaluate(val_x, val_y, verbose=0)
+    latency = measure_predict_latency(model, val_x, repeats)
+
+    return {
+        "config": name,
+        "params": int(model.count_params()),
+        "train_seconds": round(train_seconds, 3),
+        "p50_ms": round(latency["p50_ms"], 3),
+        "p99_ms": round(latency["p99_ms"], 3),
+        "val_accuracy": round(float(val_accuracy), 4),
+        "accuracy_per_ms": round(float(val_accuracy) / latency["p50_ms"], 4),
+        "model": model,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Train and benchmark the credibility model family.")
+    parser.add_argument("--csv", nargs="+", default=["sample.csv"], help="Rating CSVs to train on")
+    parser.add_argument("--vocab", default="tokenizer_vocab.json", help="Tokenizer vocabulary shipped with the model")
+    parser.add_argument("--configs", nargs="+", default=list(MODEL_CONFIGS), choices=list(MODEL_CONFIGS))
+    parser.add_argument("--validation-split", type=float, default=0.1)
+    parser.add_argument("--repeats", type=int, default=200, help="Single-row predictions timed per model")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="bench_models.json", help="Where to write the benchmark report")
+    parser.add_argument("--model-out", default=os.path.join("saved_model", "model.keras"), help="Where to save the selected model")
+    args = parser.parse_args()
+
+    data = load_training_data(args.csv, args.vocab)
+    splits = split_data(data, args.validation_split, args.seed)
+
+    results: List[Dict[str, Any]] = []
+    for name in args.configs:
+        result = benchmark_config(name, data, splits, args.repeats)
+        print(f"{name:<12} params={result['params']:<10} train={result['train_seconds']:.1f}s "
+              f"p50={result['p50_ms']:.2f}ms p99={result['p99_ms']:.2f}ms "
+              f"val_acc={result['val_accuracy']:.3f} acc/ms={result['accuracy_per_ms']:.4f}")
+        results.append(result)
+
+    # Ship the configuration with the best accuracy per millisecond of predict latency
+    best = max(results, key=lambda r: r["accuracy_per_ms"])
+    os.makedirs(os.path.dirname(args.model_out) or ".", exist_ok=True)
+    best["model"].save(args.model_out)
+    print(f"Selected '{best['config']}' -> {args.model_out}")
+
+    report = {"selected": best["config"], "results": [{k: v for k, v in r.items() if k != "model"} for r in results]}
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Benchmark report saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
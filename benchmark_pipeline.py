@@ -0,0 +1,396 @@
+import argparse
+import asyncio
+import csv
+import importlib.util
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+from benchmarks.replay_server import FixtureStore, ReplayServer
+
+# End-to-end benchmarks for the three user-facing entry points, run offline
+# against the fixtures in benchmarks/fixtures:
+#
+#   python benchmark_pipeline.py run      # any time, no network needed
+#   python benchmark_pipeline.py record   # refresh the fixtures (network and Chrome needed)
+#
+# Search pages and articles are served by a local replay server, LLM calls go
+# to benchmarks/stub_ollama.py (answering from fixtures/llm.json) and models
+# load from the local Hugging Face cache, so two runs on the same machine are
+# comparable.
+
+ROOT: str = os.path.dirname(os.path.abspath(__file__))
+FIXTURES_DIR: str = os.path.join(ROOT, "benchmarks", "fixtures")
+STUB_OLLAMA: str = os.path.join(ROOT, "benchmarks", "stub_ollama.py")
+SAMPLE_CSV: str = os.path.join(ROOT, "sample.csv")
+DEFAULT_QUERIES: List[str] = ["climate change policy", "artificial intelligence regulation", "vaccine research"]
+UNTHROTTLED_RATE: int = 1_000_000  # Requests per second (and burst) for the benchmark's HostThrottle
+VALIDITY_MODELS: List[str] = ["sentence-transformers/all-mpnet-base-v2", "cardiffnlp/twitter-roberta-base-sentiment"]
+
+# ============================ STATISTICS ============================
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Linear-interpolated percentile (q in 0-100) of a non-empty list."""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(latencies: List[float], wall_seconds: float, errors: int, items: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Summarise per-call latencies.
+
+    Args:
+        latencies (List[float]): Seconds per successful call.
+        wall_seconds (float): Total time spent in the measured loop.
+        errors (int): Calls that failed.
+        items (Optional[int]): Units of work processed (e.g. articles), if different from calls.
+
+    Returns:
+        Dict[str, Any]: Counts, throughput and latency percentiles in milliseconds.
+    """
+    calls = len(latencies) + errors
+    report: Dict[str, Any] = {
+        "calls": calls,
+        "errors": errors,
+        "throughput_per_s": round(calls / wall_seconds, 3) if wall_seconds else 0.0,
+    }
+    if items is not None:
+        report["items"] = items
+        report["items_per_s"] = round(items / wall_seconds, 3) if wall_seconds else 0.0
+    if latencies:
+        report.update({
+            f"p{q}_ms": round(percentile(latencies, q) * 1000, 1) for q in (50, 95, 99)
+        })
+        report["mean_ms"] = round(sum(latencies) / len(latencies) * 1000, 1)
+        report["max_ms"] = round(max(latencies) * 1000, 1)
+    return report
+
+
+def load_sample_rows(path: str = SAMPLE_CSV) -> List[Dict[str, str]]:
+    """(user_prompt, url_to_check) pairs from sample.csv, in file order."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return [row for row in csv.DictReader(f) if row.get("url_to_check")]
+
+# ============================ RECORDING ============================
+
+
+def record(args: argparse.Namespace) -> None:
+    """
+    Record search pages, articles and sample.csv pages for offline runs, and cache the models.
+
+    Pages are captured through the app's own fetch path: the results page is
+    rendered by headless Chrome (helper.load_search_page) and articles are
+    downloaded with fetcher.fetch_with_backoff and the app's browser headers,
+    so the fixtures match what the pipeline sees in production.
+    """
+    from helper import BROWSER_HEADERS, BrowserPool, create_http_session, load_search_page, parse_search_results, result_link
+    from fetcher import fetch_with_backoff
+
+    store = FixtureStore(args.fixtures)
+    store.clear()  # A recording replaces the whole set, including any synthetic pages
+    session = create_http_session()
+
+    async def record_pages(urls: List[str]) -> None:
+        async def record_page(url: str) -> None:
+            try:
+                response = await fetch_with_backoff(url, session, headers=BROWSER_HEADERS)
+            except Exception as e:
+                print(f"  skipped {url}: {e}")
+                return
+            store.save_page(url, response.status_code, response.content)
+            print(f"  {response.status_code} {url}")
+
+        # Pages already recorded in this run (e.g. a search result also in sample.csv) are not fetched twice
+        await asyncio.gather(*(record_page(url) for url in dict.fromkeys(urls) if url not in store.manifest["pages"]))
+
+    browser_pool = BrowserPool(size=1)
+    try:
+        for query in args.queries:
+            print(f"search: {query}")
+            page_source = load_search_page(query, args.region, args.time_filter, browser_pool)
+            store.save_search_page(query, page_source.encode("utf-8"))
+            links = [result_link(result) for result in parse_search_results(page_source)[:args.count]]
+            asyncio.run(record_pages([link for link in links if link and link.startswith("http")]))
+    finally:
+        browser_pool.close()
+
+    print("sample.csv pages")
+    asyncio.run(record_pages([row["url_to_check"] for row in load_sample_rows()]))
+    store.save()
+
+    # Populate the local Hugging Face cache; `run` loads models offline. The
+    # cache path is machine-specific, so it is not written into the manifest.
+    from huggingface_hub import hf_hub_download
+    from helper import CREDIBILITY_MODEL_REPO
+
+    hf_hub_download(repo_id=CREDIBILITY_MODEL_REPO, filename="model.keras")
+    from sentence_transformers import SentenceTransformer
+    from transformers import pipeline
+
+    SentenceTransformer(VALIDITY_MODELS[0])
+    pipeline("text-classification", model=VALIDITY_MODELS[1])
+    print(f"Fixtures written to {args.fixtures}")
+
+# ============================ BENCHMARKS ============================
+
+
+def bench_fetch_news(server: ReplayServer, store: FixtureStore, args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Search + fetch + score through stream_news_data; reports total latency and time to first result.
+
+    Every replayed article comes from one host (the replay server), so the
+    process-wide politeness limiter would cap the run at its per-host rate and
+    carry its adaptive state across repeats. Each search gets its own
+    unthrottled HostThrottle instead, so the pipeline is what gets measured.
+    """
+    import helper
+    from fetcher import HostThrottle
+    from helper import AIAssistant, BrowserPool, ModelRegistry, OllamaClient, create_http_session, stream_news_data
+
+    helper.DUCKDUCKGO_HTML_URL = f"{server.url}/html/"
+    browser_pool = BrowserPool(size=1)
+    assistant = AIAssistant(
+        llm=OllamaClient(command=[sys.executable, STUB_OLLAMA]),
+        model_registry=ModelRegistry(model_path=store.manifest["models"].get("credibility")),
+    )
+    http_session = create_http_session()
+
+    async def one_search(query: str) -> Dict[str, Any]:
+        start = time.perf_counter()
+        first: Optional[float] = None
+        articles = 0
+        throttle = HostThrottle(rate=UNTHROTTLED_RATE, burst=UNTHROTTLED_RATE, max_concurrency=max(args.count, 1))
+        async for _ in stream_news_data(query, args.count, args.region, args.time_filter,
+                                        browser_pool=browser_pool, http_session=http_session, assistant=assistant,
+                                        throttle=throttle):
+            first = first if first is not None else time.perf_counter() - start
+            articles += 1
+        return {"seconds": time.perf_counter() - start, "first": first, "articles": articles}
+
+    try:
+        for _ in range(args.warmup):
+            asyncio.run(one_search(args.queries[0]))
+
+        latencies: List[float] = []
+        first_result: List[float] = []
+        errors = articles = 0
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            for query in args.queries:
+                run = asyncio.run(one_search(query))
+                if run["articles"] == 0:
+                    errors += 1
+                    continue
+                latencies.append(run["seconds"])
+                first_result.append(run["first"])
+                articles += run["articles"]
+        wall_seconds = time.perf_counter() - start
+    finally:
+        browser_pool.close()
+
+    report = summarize(latencies, wall_seconds, errors, items=articles)
+    if first_result:
+        report["first_result"] = {f"p{q}_ms": round(percentile(first_result, q) * 1000, 1) for q in (50, 95, 99)}
+    return report
+
+
+def bench_rate_url_validity(server: ReplayServer, store: FixtureStore, args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    rate_url_validity over every (user_prompt, url_to_check) pair in sample.csv.
+
+    Runs against an empty result cache: the first pass is reported as "cold",
+    later passes (served from the cache) as "warm".
+    """
+    import scoring_config
+    import test as validity
+    from validity_cache import ValidityCache
+
+    validity.FACT_CHECK_API_URL = f"{server.url}/factcheck"
+    validity.SERPAPI_URL = f"{server.url}/scholar"
+    rows = [row for row in load_sample_rows() if row["url_to_check"] in store.manifest["pages"]]
+    if args.limit:
+        rows = rows[:args.limit]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        scoring_config._result_cache = ValidityCache(os.path.join(cache_dir, "warmup.sqlite3"))
+        for row in rows[:args.warmup]:
+            validity.rate_url_validity(row["user_prompt"], server.local_url(row["url_to_check"]))
+        scoring_config._result_cache = ValidityCache(os.path.join(cache_dir, "bench.sqlite3"))
+
+        report: Dict[str, Any] = {"pairs": len(rows)}
+        for phase, passes in (("cold", 1), ("warm", max(args.repeats - 1, 1))):
+            latencies: List[float] = []
+            errors = 0
+            start = time.perf_counter()
+            for _ in range(passes):
+                for row in rows:
+                    call_start = time.perf_counter()
+                    result = validity.rate_url_validity(row["user_prompt"], server.local_url(row["url_to_check"]))
+                    if "error" in result:
+                        errors += 1
+                    else:
+                        latencies.append(time.perf_counter() - call_start)
+            report[phase] = summarize(latencies, time.perf_counter() - start, errors)
+        scoring_config._result_cache = None
+    return report
+
+
+def bench_summarize(server: ReplayServer, store: FixtureStore, args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    summarize_and_visualize_data on the metadata.json sample payload and on sample.csv,
+    with every chart drawn inline.
+
+    Runs against a private, initially empty EDA result cache: "cold" calls clear
+    it first, so they measure profiling and rendering; "warm" calls repeat the
+    last cold call and are served from the cache.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    sys.path.insert(0, os.path.join(ROOT, "project3"))
+    spec = importlib.util.spec_from_file_location("project3_main", os.path.join(ROOT, "project3", "main.py"))
+    project3_main = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(project3_main)
+    import result_cache
+    with open(os.path.join(ROOT, "project3", "metadata.json"), encoding="utf-8") as f:
+        metadata = json.load(f)
+
+    payloads: Dict[str, Dict[str, Any]] = {
+        "metadata_sample": metadata["summarize_and_visualize_data"]["sample_payload"],
+        "sample_csv": {"data": [dict(row) for row in load_sample_rows()]},
+    }
+
+    def measure(payload: Dict[str, Any], calls: int, clear: Callable[[], None]) -> Dict[str, Any]:
+        latencies: List[float] = []
+        errors = 0
+        start = time.perf_counter()
+        for _ in range(calls):
+            clear()
+            call_start = time.perf_counter()
+            result = project3_main.summarize_and_visualize_data(payload, {}, [])
+            if result.get("status") == "error":
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - call_start)
+        return summarize(latencies, time.perf_counter() - start, errors)
+
+    shared_cache = result_cache.get_cache
+    reports: Dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Keep the app's own project3/.eda_cache out of the measurement (and untouched)
+        cache = result_cache.BlobCache(cache_dir)
+        result_cache.get_cache = lambda: cache
+        try:
+            for name, payload in payloads.items():
+                payload = {**payload, "inline_charts": True}
+                for _ in range(args.warmup):
+                    cache.clear()
+                    project3_main.summarize_and_visualize_data(payload, {}, [])
+                reports[name] = {
+                    "cold": measure(payload, args.repeats, cache.clear),
+                    "warm": measure(payload, args.repeats, lambda: None),
+                    "rows": len(payload["data"]),
+                }
+        finally:
+            result_cache.get_cache = shared_cache
+    return reports
+
+
+BENCHMARKS: Dict[str, Callable[[ReplayServer, FixtureStore, argparse.Namespace], Dict[str, Any]]] = {
+    "fetch_news_data": bench_fetch_news,
+    "rate_url_validity": bench_rate_url_validity,
+    "summarize_and_visualize_data": bench_summarize,
+}
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=ROOT, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args: argparse.Namespace) -> None:
+    """Run the selected benchmarks against the fixtures and write a JSON report."""
+    if not args.online:
+        os.environ["HF_HUB_OFFLINE"] = "1"
+        os.environ["TRANSFORMERS_OFFLINE"] = "1"
+    os.environ["OLLAMA_STUB_DELAY_MS"] = str(args.llm_delay_ms)
+    llm_responses = os.path.join(args.fixtures, "llm.json")
+    if os.path.exists(llm_responses):
+        os.environ["OLLAMA_STUB_RESPONSES"] = llm_responses
+
+    store = FixtureStore(args.fixtures)
+    if not store.manifest["searches"] and not store.manifest["pages"]:
+        print(f"No fixtures in {args.fixtures}; run `python benchmark_pipeline.py record` first.")
+        sys.exit(2)
+    if store.manifest.get("synthetic"):
+        print(f"WARNING: the fixtures in {args.fixtures} are synthetic. Their pages were written offline, not "
+              "recorded, so rate_url_validity scores do not reflect the real sites. Run `record` for real pages.")
+
+    results: Dict[str, Any] = {}
+    with ReplayServer(store, latency_ms=args.latency_ms) as server:
+        for name in args.only or list(BENCHMARKS):
+            print(f"{name} ...", flush=True)
+            try:
+                results[name] = BENCHMARKS[name](server, store, args)
+            except Exception as e:
+                # One unavailable dependency (e.g. Chrome) should not hide the other results
+                results[name] = {"error": f"{type(e).__name__}: {e}"}
+            print(json.dumps(results[name], indent=2, sort_keys=True))
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "queries": args.queries, "count": args.count, "repeats": args.repeats, "warmup": args.warmup,
+            "latency_ms": args.latency_ms, "llm_delay_ms": args.llm_delay_ms, "limit": args.limit,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
+    print(f"Report written to {args.output}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="End-to-end pipeline benchmarks against recorded fixtures.")
+    parser.add_argument("--fixtures", default=FIXTURES_DIR, help="Fixture directory")
+    parser.add_argument("--queries", nargs="+", default=DEFAULT_QUERIES)
+    parser.add_argument("--count", type=int, default=5, help="Articles per search")
+    parser.add_argument("--region", default="us-en")
+    parser.add_argument("--time-filter", default="w")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("record", help="Record fixtures and cache models (needs network access)")
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks offline")
+    run_parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="Subset of benchmarks to run")
+    run_parser.add_argument("--repeats", type=int, default=3, help="Measured passes over the workload")
+    run_parser.add_argument("--warmup", type=int, default=1, help="Unmeasured calls first (model loading, JIT caches)")
+    run_parser.add_argument("--limit", type=int, default=0, help="Only use the first N sample.csv pairs (0 = all)")
+    run_parser.add_argument("--latency-ms", type=float, default=0, help="Simulated network delay per response")
+    run_parser.add_argument("--llm-delay-ms", type=float, default=50, help="Stub Ollama response delay")
+    run_parser.add_argument("--online", action="store_true", help="Allow model downloads instead of cache-only loading")
+    run_parser.add_argument("--output", default="bench_pipeline.json", help="Path for the JSON report")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        record(args)
+    else:
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from typing import Dict, List, Any
+
+# Packages helper.py must only import on first use of the feature that needs them
+HEAVY_MODULES: List[str] = [
+    "keras", "tensorflow", "selenium", "webdriver_manager", "gtts",
+    "httpx", "bs4", "huggingface_hub", "requests", "numpy",
+]
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure_import(module: str) -> Dict[str, Any]:
+    """
+    Import a module in a fresh interpreter under `python -X importtime`.
+
+    Args:
+        module (str): Module to import.
+
+    Returns:
+        Dict[str, Any]: Wall time, per-module cumulative import times and the heavy modules that got loaded.
+    """
+    snippet = f"import sys, json; import {module}; print(json.dumps(sorted(sys.modules)))"
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", snippet],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    )
+    wall_seconds = time.perf_counter() - start
+
+    if completed.returncode != 0:
+        error_lines = [line for line in completed.stderr.splitlines() if not line.startswith("import time:")]
+        return {"module": module, "error": "\n".join(error_lines[-5:])}
+
+    cumulative_us: Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            cumulative_us[match.group(4)] = int(match.group(2))
+
+    loaded = set(json.loads(completed.stdout.strip().splitlines()[-1]))
+    return {
+        "module": module,
+        "wall_seconds": round(wall_seconds, 4),
+        "import_seconds": round(cumulative_us.get(module, 0) / 1e6, 4),
+        "slowest": sorted(cumulative_us.items(), key=lambda item: item[1], reverse=True)[:10],
+        "heavy_loaded": sorted(name for name in HEAVY_MODULES if name in loaded),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure and bound the import time of helper.py.")
+    parser.add_argument("--module", default="helper")
+    parser.add_argument("--max-seconds", type=float, default=0.5, help="Budget for the module's cumulative import time")
+    parser.add_argument("--repeats", type=int, default=3, help="Fresh interpreters to launch; the fastest run is reported")
+    parser.add_argument("--output", default=None, help="Optional path for a JSON report")
+    args = parser.parse_args()
+
+    runs = [measure_import(args.module) for _ in range(args.repeats)]
+    failed = [run for run in runs if "error" in run]
+    if failed:
+        print(f"Importing {args.module} failed:\n{failed[0]['error']}")
+        sys.exit(2)
+
+    best = min(runs, key=lambda run: run["import_seconds"])
+    print(f"{args.module}: import {best['import_seconds'] * 1000:.1f} ms, interpreter wall {best['wall_seconds'] * 1000:.1f} ms")
+    for name, micros in best["slowest"]:
+        print(f"  {micros / 1000:8.1f} ms  {name}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(best, f, indent=2)
+
+    problems: List[str] = []
+    if best["heavy_loaded"]:
+        problems.append(f"heavy modules imported eagerly: {', '.join(best['heavy_loaded'])}")
+    if best["import_seconds"] > args.max_seconds:
+        problems.append(f"import took {best['import_seconds']:.3f}s, budget is {args.max_seconds:.3f}s")
+
+    if problems:
+        for problem in problems:
+            print(f"FAIL: {problem}")
+        sys.exit(1)
+    print("OK: startup within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+# ============================ FIXTURE STORE ============================
+# Layout of a fixture directory:
+#   manifest.json        {"searches": {query: file}, "pages": {url: {"file": file, "status": code}},
+#                         "models": {...}, "synthetic": bool}
+#                        "synthetic" marks pages written offline rather than recorded from their origin
+#   search/<sha1>.html   DuckDuckGo HTML results page for one query
+#   pages/<sha1>.html    article or sample.csv page, as served by the origin
+#   llm.json             {"rating": ..., "summary": ...} answers of benchmarks/stub_ollama.py
+
+DUCKDUCKGO_LINK = re.compile(r"uddg=(https?%3A%2F%2F[^&\"']+)")
+
+
+def _fixture_name(key: str) -> str:
+    return hashlib.sha1(key.encode("utf-8")).hexdigest() + ".html"
+
+
+class FixtureStore:
+    """Recorded search pages and articles on disk, indexed by query and URL."""
+
+    def __init__(self, root: str) -> None:
+        """
+        Args:
+            root (str): Fixture directory; created on the first save.
+        """
+        self.root = root
+        self.manifest_path = os.path.join(root, "manifest.json")
+        self.manifest: Dict[str, Any] = {"searches": {}, "pages": {}, "models": {}, "synthetic": False}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding="utf-8") as f:
+                self.manifest.update(json.load(f))
+
+    def _read(self, relative_path: str) -> bytes:
+        with open(os.path.join(self.root, relative_path), "rb") as f:
+            return f.read()
+
+    def _write(self, relative_path: str, body: bytes) -> None:
+        path = os.path.join(self.root, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(body)
+
+    def search_page(self, query: str) -> Optional[bytes]:
+        """Recorded results page for a query, or None."""
+        relative_path = self.manifest["searches"].get(query)
+        return self._read(relative_path) if relative_path else None
+
+    def page(self, url: str) -> Optional[Tuple[int, bytes]]:
+        """Recorded (status, body) for a URL, or None if it was never recorded."""
+        entry = self.manifest["pages"].get(url)
+        if entry is None:
+            return None
+        return entry["status"], self._read(entry["file"]) if entry.get("file") else b""
+
+    def save_search_page(self, query: str, body: bytes) -> None:
+        relative_path = f"search/{_fixture_name(query)}"
+        self._write(relative_path, body)
+        self.manifest["searches"][query] = relative_path
+
+    def save_page(self, url: str, status: int, body: bytes) -> None:
+        relative_path = f"pages/{_fixture_name(url)}"
+        self._write(relative_path, body)
+        self.manifest["pages"][url] = {"file": relative_path, "status": status}
+
+    def clear(self) -> None:
+        """Forget every search and page and delete their files, for a fresh recording."""
+        for directory in ("search", "pages"):
+            shutil.rmtree(os.path.join(self.root, directory), ignore_errors=True)
+        self.manifest.update({"searches": {}, "pages": {}, "synthetic": False})
+
+    def save(self) -> None:
+        """Write the manifest with sorted keys so re-recordings diff cleanly."""
+        os.makedirs(self.root, exist_ok=True)
+        with open(self.manifest_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+# ============================ REPLAY SERVER ============================
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    """
+    Routes:
+        /html/?q=...     recorded DuckDuckGo page, result links rewritten to /page
+        /page?url=...    recorded article (404 if it was never recorded)
+        /factcheck       Google Fact Check stub, no matching claims
+        /scholar         SerpAPI Google Scholar stub, no citations
+    """
+
+    server: "_ReplayHTTPServer"
+
+    def do_GET(self) -> None:
+        parsed = urllib.parse.urlparse(self.path)
+        params = urllib.parse.parse_qs(parsed.query)
+        replay: ReplayServer = self.server.replay
+        if replay.latency_ms:
+            time.sleep(replay.latency_ms / 1000)
+
+        if parsed.path.rstrip("/") == "/html":
+            body = replay.store.search_page(params.get("q", [""])[0])
+            if body is None:
+                self._send(404, b"no recorded search for this query")
+            else:
+                self._send(200, replay.rewrite_links(body))
+        elif parsed.path == "/page":
+            recorded = replay.store.page(params.get("url", [""])[0])
+            self._send(*(recorded or (404, b"not recorded")))
+        elif parsed.path == "/factcheck":
+            self._send(200, b'{"claims": []}', "application/json")
+        elif parsed.path == "/scholar":
+            self._send(200, b'{"organic_results": []}', "application/json")
+        else:
+            self._send(404, b"unknown route")
+
+    def _send(self, status: int, body: bytes, content_type: str = "text/html; charset=utf-8") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass  # Keep benchmark output readable
+
+
+class _ReplayHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    replay: "ReplayServer"
+
+
+class ReplayServer:
+    """
+    Local HTTP server replaying recorded fixtures, so benchmarks measure the
+    pipeline rather than the network. Use as a context manager.
+    """
+
+    def __init__(self, store: FixtureStore, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0) -> None:
+        """
+        Args:
+            store (FixtureStore): Recorded fixtures to serve.
+            host (str): Interface to bind.
+            port (int): Port to bind; 0 picks a free one.
+            latency_ms (float): Delay added to every response to simulate the network.
+        """
+        self.store = store
+        self.latency_ms = latency_ms
+        self._httpd = _ReplayHTTPServer((host, port), _ReplayHandler)
+        self._httpd.replay = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def local_url(self, original_url: str) -> str:
+        """Replay address of a recorded page."""
+        return f"{self.url}/page?url={urllib.parse.quote(original_url, safe='')}"
+
+    def rewrite_links(self, body: bytes) -> bytes:
+        """Point DuckDuckGo redirect links (uddg=...) at the replayed pages."""
+        def replace(match: re.Match) -> str:
+            original = urllib.parse.unquote(match.group(1))
+            return "uddg=" + urllib.parse.quote(self.local_url(original), safe="")
+
+        return DUCKDUCKGO_LINK.sub(replace, body.decode("utf-8", errors="replace")).encode("utf-8")
+
+    def start(self) -> "ReplayServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="replay-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
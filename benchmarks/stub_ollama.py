@@ -0,0 +1,28 @@
+"""
+Stand-in for `ollama run <model>` used by the end-to-end benchmarks.
+
+Reads the prompt on stdin and answers after a fixed delay, so LLM calls cost a
+predictable amount of time without a model server. Answers come from a fixture
+file: rating prompts get its "rating", everything else its "summary".
+
+    OLLAMA_STUB_DELAY_MS   response delay in milliseconds (default 50)
+    OLLAMA_STUB_RESPONSES  response fixture (default fixtures/llm.json next to this file)
+"""
+import json
+import os
+import sys
+import time
+
+DEFAULT_RESPONSES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "llm.json")
+
+
+def main() -> None:
+    prompt = sys.stdin.read()
+    with open(os.environ.get("OLLAMA_STUB_RESPONSES", DEFAULT_RESPONSES), encoding="utf-8") as f:
+        responses = json.load(f)
+    time.sleep(float(os.environ.get("OLLAMA_STUB_DELAY_MS", "50")) / 1000)
+    print(responses["rating"] if "rate this article" in prompt.lower() else responses["summary"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+from typing import Dict, Any
+from keras.layers import Input, Embedding, Dense, Concatenate, Flatten, GlobalAveragePooling1D, GlobalMaxPooling1D
+from keras.models import Model
+
+# ============================ MODEL FAMILY ============================
+
+# Candidate architectures for the credibility model. "baseline" reproduces the
+# notebook model (flattened embedding into a 2048/1024/512 dense stack trained
+# with batch_size=2 for 80 epochs); the others are compact variants sized for a
+# dataset of a few hundred prompts.
+MODEL_CONFIGS: Dict[str, Dict[str, Any]] = {
+    "baseline": {"embedding_dim": 16, "pooling": "flatten", "num_of_dense": 3, "start_neurons": 4096, "epochs": 80, "batch_size": 2},
+    "flatten-64": {"embedding_dim": 16, "pooling": "flatten", "num_of_dense": 2, "start_neurons": 128, "epochs": 40, "batch_size": 16},
+    "avgpool-32": {"embedding_dim": 32, "pooling": "average", "num_of_dense": 1, "start_neurons": 64, "epochs": 60, "batch_size": 16},
+    "avgpool-16": {"embedding_dim": 16, "pooling": "average", "num_of_dense": 1, "start_neurons": 32, "epochs": 60, "batch_size": 16},
+    "maxpool-32": {"embedding_dim": 32, "pooling": "max", "num_of_dense": 1, "start_neurons": 64, "epochs": 60, "batch_size": 16},
+}
+
+POOLING_LAYERS = {
+    "flatten": Flatten,
+    "average": GlobalAveragePooling1D,
+    "max": GlobalMaxPooling1D,
+}
+
+
+def create_nn_model(
+    vocab_size: int,
+    embedding_dim: int,
+    max_length: int,
+    num_of_dense: int,
+    start_neurons: int = 4096,
+    pooling: str = "flatten",
+    num_classes: int = 6,
+) -> Model:
+    """
+    Creates a neural network model that processes user prompts using an embedding layer,
+    concatenates it with function ratings, and passes through dense layers.
+
+    Args:
+        vocab_size (int): Size of the vocabulary for embedding.
+        embedding_dim (int): Dimensionality of the embedding layer.
+        max_length (int): Maximum length of input sequences.
+        num_of_dense (int): Number of dense layers before concatenation.
+        start_neurons (int): Width the dense stack halves down from (the first layer has start_neurons / 2 units).
+        pooling (str): How token embeddings are reduced to one vector ('flatten', 'average' or 'max').
+        num_classes (int): Number of rating classes in the softmax output.
+
+    Returns:
+        Model: A compiled Keras model.
+    """
+    if pooling not in POOLING_LAYERS:
+        raise ValueError(f"Unknown pooling '{pooling}', expected one of {sorted(POOLING_LAYERS)}")
+
+    # Text input (user prompt)
+    text_input = Input(shape=(max_length,), name="text_input")
+    embedding = Embedding(input_dim=vocab_size, output_dim=embedding_dim)(text_input)
+    x = POOLING_LAYERS[pooling]()(embedding)
+
+    # Dense layers for text input
+    num_neurons = start_neurons
+    for _ in range(num_of_dense):
+        num_neurons = max(1, int(num_neurons / 2))  # Ensure integer neurons, minimum of 1
+        x = Dense(num_neurons, activation='relu')(x)
+
+    # Numeric input (func_rating)
+    func_rating_input = Input(shape=(1,), name="func_rating_input")
+    y = Dense(32, activation='relu')(func_rating_input)
+
+    # Concatenate both paths
+    concatenated = Concatenate()([x, y])
+    output = Dense(num_classes, activation='softmax', name="output")(concatenated)
+
+    # Define and compile the model
+    model = Model(inputs=[text_input, func_rating_input], outputs=output)
+    model.compile(optimizer='adam', loss='categorical_crossentropy', metrics=['accuracy'])
+
+    return model
+
+
+def build_model_from_config(name: str, vocab_size: int, max_length: int) -> Model:
+    """
+    Build one of the named architectures in MODEL_CONFIGS.
+
+    Args:
+        name (str): Key into MODEL_CONFIGS.
+        vocab_size (int): Size of the vocabulary for embedding.
+        max_length (int): Maximum length of input sequences.
+
+    Returns:
+        Model: A compiled Keras model.
+    """
+    config = MODEL_CONFIGS[name]
+    return create_nn_model(
+        vocab_size,
+        config["embedding_dim"],
+        max_length,
+        config["num_of_dense"],
+        start_neurons=config["start_neurons"],
+        pooling=config["pooling"],
+    )
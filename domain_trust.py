@@ -0,0 +1,227 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+import numpy as np
+import pandas as pd
+
+# ============================ DOMAIN TRUST INDEX ============================
+# Offline replacement for a per-request domain authority API. Scores are built
+# into a sorted array of registrable domains (one .npy file of fixed-width
+# records), memory-mapped at load, and searched with np.searchsorted. Nothing on
+# the lookup path touches the network, and repeated hosts are answered from an
+# in-process LRU cache.
+#
+#   python domain_trust.py build --csv domain_scores.csv    # domain,score columns
+#   python domain_trust.py lookup https://www.cdc.gov/...
+
+DEFAULT_INDEX_PATH: str = os.environ.get(
+    "DOMAIN_TRUST_INDEX",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "domain_trust.npy"),
+)
+DEFAULT_TRUST: float = 60.0  # Score for domains missing from the index (the old placeholder)
+
+# Public suffixes with two labels, so "nhs.uk" or "bbc.co.uk" are kept whole.
+# Not the full Public Suffix List; extend when scores for other ccTLDs are added.
+MULTI_LABEL_SUFFIXES = frozenset({
+    "co.uk", "org.uk", "ac.uk", "gov.uk", "com.au", "org.au", "gov.au", "edu.au",
+    "co.nz", "org.nz", "co.in", "gov.in", "ac.in", "co.jp", "ac.jp", "com.br", "gov.br", "com.cn",
+    "co.za", "gc.ca",
+})
+
+# Label separators IDNA treats like "." (ideographic and full-width full stops)
+IDNA_DOTS = ("\u3002", "\uff0e", "\uff61")
+
+
+def host_of(url: str) -> str:
+    """Host part of a URL (or the string itself if it has no scheme); cheaper than urlsplit."""
+    rest = url.partition("//")[2] or url
+    return rest.split("/", 1)[0].rpartition("@")[2].split(":", 1)[0].lower()
+
+
+def to_ascii_host(host: str) -> str:
+    """
+    IDNA (punycode) form of a host name, e.g. "bücher.de" -> "xn--bcher-kva.de".
+
+    Index keys and lookups both go through this, so an internationalised domain
+    matches however it was written. Hosts that are not valid IDNA give "".
+    """
+    if host.isascii():
+        return host
+    for dot in IDNA_DOTS:
+        host = host.replace(dot, ".")
+    try:
+        return ".".join(label if label.isascii() else label.encode("idna").decode("ascii")
+                        for label in host.split("."))
+    except UnicodeError:
+        return ""
+
+
+def registrable_domain(url_or_host: str) -> str:
+    """
+    Registrable domain of a URL or host name, e.g. "blogs.cdc.gov" -> "cdc.gov".
+
+    Args:
+        url_or_host (str): Full URL or bare host name.
+
+    Returns:
+        str: Lower-cased ASCII (IDNA) registrable domain ("" if none can be found).
+    """
+    labels = to_ascii_host(host_of(url_or_host.strip())).rstrip(".").split(".")
+    labels = [label for label in labels if label]
+    if len(labels) >= 3 and ".".join(labels[-2:]) in MULTI_LABEL_SUFFIXES:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+class DomainTrustIndex:
+    """Read-only, memory-mapped domain -> trust score table."""
+
+    def __init__(self, path: str = DEFAULT_INDEX_PATH, default: float = DEFAULT_TRUST) -> None:
+        """
+        Args:
+            path (str): Index built by build_index(); a missing file gives an empty index.
+            default (float): Score returned for unknown domains.
+        """
+        self.path = path
+        self.default = default
+        self.version = "none"
+        if os.path.exists(path):
+            records = np.load(path, mmap_mode="r")
+            self._domains = records["domain"]
+            self._scores = records["score"]
+            with open(_metadata_path(path), encoding="utf-8") as f:
+                self.version = json.load(f)["version"]
+        else:
+            self._domains = np.array([], dtype="S1")
+            self._scores = np.array([], dtype=np.float32)
+        self._key_width = self._domains.dtype.itemsize
+
+    def __len__(self) -> int:
+        return len(self._domains)
+
+    def lookup(self, domain: str) -> Optional[float]:
+        """Score of an exact registrable domain (Unicode or IDNA form), or None if it is not indexed."""
+        key = to_ascii_host(domain.lower()).encode("ascii")
+        if not key or len(key) > self._key_width:
+            return None
+        position = int(np.searchsorted(self._domains, key))
+        if position < len(self._domains) and self._domains[position] == key:
+            return float(self._scores[position])
+        return None
+
+    def score(self, url: str) -> float:
+        """Trust score (0-100) for any URL on the domain, or the default."""
+        found = self.lookup(registrable_domain(url))
+        return self.default if found is None else found
+
+    def scores(self, urls: Iterable[str]) -> np.ndarray:
+        """Vectorised score() for many URLs: one searchsorted call for the whole batch."""
+        keys = np.array([registrable_domain(url).encode("ascii") for url in urls],
+                        dtype=f"S{max(self._key_width, 1) + 1}")
+        result = np.full(len(keys), self.default, dtype=np.float64)
+        if not len(self._domains) or not len(keys):
+            return result
+        positions = np.minimum(np.searchsorted(self._domains, keys), len(self._domains) - 1)
+        found = self._domains[positions] == keys
+        result[found] = self._scores[positions[found]]
+        return result
+
+
+def _metadata_path(index_path: str) -> str:
+    return os.path.splitext(index_path)[0] + ".json"
+
+
+def build_index(scores: pd.DataFrame, path: str = DEFAULT_INDEX_PATH,
+                domain_column: str = "domain", score_column: str = "score") -> Dict[str, object]:
+    """
+    Build the index file from a table of domain scores.
+
+    Domains are normalised to their registrable domain in IDNA form; if several
+    rows map to the same domain the highest score wins. Rows whose domain is not
+    valid IDNA are dropped. Scores are clipped to 0-100.
+
+    Args:
+        scores (pd.DataFrame): One row per domain.
+        path (str): Output .npy file; metadata is written next to it as .json.
+        domain_column (str): Column holding domains or URLs.
+        score_column (str): Column holding scores.
+
+    Returns:
+        Dict[str, object]: The metadata written (version, count, key width).
+    """
+    table = pd.DataFrame({
+        "domain": scores[domain_column].astype(str).map(registrable_domain),
+        "score": pd.to_numeric(scores[score_column], errors="coerce").clip(0, 100),
+    }).dropna()
+    table = table[table["domain"] != ""].groupby("domain", sort=True)["score"].max()
+
+    key_width = max(1, int(table.index.str.len().max())) if len(table) else 1
+    records = np.empty(len(table), dtype=[("domain", f"S{key_width}"), ("score", np.float32)])
+    records["domain"] = table.index.to_numpy(dtype=f"S{key_width}")
+    records["score"] = table.to_numpy(dtype=np.float32)
+
+    temporary = f"{path}.tmp.npy"
+    np.save(temporary, records)
+    os.replace(temporary, path)
+    metadata = {
+        "version": hashlib.sha256(records.tobytes()).hexdigest()[:16],
+        "count": len(records),
+        "key_width": key_width,
+    }
+    with open(_metadata_path(path), "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2)
+    return metadata
+
+
+@lru_cache(maxsize=1)
+def default_index() -> DomainTrustIndex:
+    """Process-wide index loaded from DEFAULT_INDEX_PATH."""
+    return DomainTrustIndex()
+
+
+def domain_trust_score(url: str) -> float:
+    """Trust score (0-100) of a URL's domain from the default index."""
+    return _host_score(host_of(url))
+
+
+@lru_cache(maxsize=65536)
+def _host_score(host: str) -> float:
+    return default_index().score(host)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build or query the domain trust index.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="Build the index from a CSV of domain scores")
+    build_parser.add_argument("--csv", required=True)
+    build_parser.add_argument("--output", default=DEFAULT_INDEX_PATH)
+    build_parser.add_argument("--domain-column", default="domain")
+    build_parser.add_argument("--score-column", default="score")
+
+    lookup_parser = commands.add_parser("lookup", help="Print the score of URLs or domains")
+    lookup_parser.add_argument("targets", nargs="+")
+    lookup_parser.add_argument("--index", default=DEFAULT_INDEX_PATH)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        metadata = build_index(pd.read_csv(args.csv), args.output, args.domain_column, args.score_column)
+        print(f"Indexed {metadata['count']} domains into {args.output} (version {metadata['version']})")
+        return
+
+    index = DomainTrustIndex(args.index)
+    if not len(index):
+        print(f"No index at {args.index}; unknown domains score {index.default}", file=sys.stderr)
+    for target in args.targets:
+        start = time.perf_counter()
+        score = index.score(target)
+        print(f"{registrable_domain(target)}\t{score:g}\t{(time.perf_counter() - start) * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import random
+import threading
+import time
+import urllib.parse
+from collections import deque
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncIterator, Deque, Dict, Mapping, Optional, Tuple
+from logger.app_logger import application_logger
+
+if TYPE_CHECKING:
+    import requests
+
+# ============================ POLICY ============================
+
+# Statuses that mean "slow down": the host's rate is halved and Retry-After honoured.
+# Some news sites answer 403 rather than 429 when a client is too fast.
+THROTTLE_STATUSES = frozenset({403, 429, 503})
+RETRY_STATUSES = THROTTLE_STATUSES | {500, 502, 504}
+
+DEFAULT_HOST_RATE: float = 2.0        # requests per second per host
+DEFAULT_HOST_BURST: int = 4
+DEFAULT_HOST_CONCURRENCY: int = 2
+MIN_HOST_RATE: float = 0.2
+MAX_RETRY_AFTER_SECONDS: float = 30.0  # Longer requested pauses are treated as a refusal
+FORBIDDEN_RETRIES: int = 1             # A 403 that survives one slower retry is a real refusal
+
+
+def host_key(url: str) -> str:
+    """Politeness key for a URL: its host name without a leading www."""
+    host = (urllib.parse.urlsplit(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Seconds to wait according to a Retry-After header.
+
+    Args:
+        value (Optional[str]): Header value, either delta-seconds or an HTTP date.
+        now (Optional[float]): Current Unix time, for testing.
+
+    Returns:
+        Optional[float]: Non-negative delay, or None if the header is missing or malformed.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - (time.time() if now is None else now))
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 10.0) -> float:
+    """Exponential backoff with full jitter for the given zero-based attempt."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+# ============================ HOST THROTTLE ============================
+
+
+class _HostState:
+    __slots__ = ("rate", "tokens", "updated", "paused_until", "in_flight", "waiters")
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.in_flight = 0
+        self.waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+
+
+class HostThrottle:
+    """
+    Per-host token buckets and concurrency caps shared by every fetch in the process.
+
+    Each host gets its own bucket, so a slow or strict site never holds back
+    requests to other sites. The bucket rate adapts (AIMD): it is halved when the
+    host answers with a throttling status and creeps back up on success. A
+    Retry-After header pauses the host until the given time.
+
+    Streamlit sessions drive fetches from separate event loops on separate
+    threads, so state is guarded by a threading lock and waiters are woken on
+    their own loop.
+    """
+
+    def __init__(self, rate: float = DEFAULT_HOST_RATE, burst: int = DEFAULT_HOST_BURST,
+                 max_concurrency: int = DEFAULT_HOST_CONCURRENCY, min_rate: float = MIN_HOST_RATE) -> None:
+        """
+        Args:
+            rate (float): Starting and maximum requests per second per host.
+            burst (int): Requests a host may receive back to back after being idle.
+            max_concurrency (int): Requests in flight per host.
+            min_rate (float): Floor for the adaptive rate.
+        """
+        self.max_rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.min_rate = min_rate
+        self._hosts: Dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.max_rate, self.burst)
+        return state
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently holding a slot, across all hosts."""
+        with self._lock:
+            return sum(state.in_flight for state in self._hosts.values())
+
+    def host_rate(self, url: str) -> float:
+        """Current adaptive rate for the URL's host."""
+        with self._lock:
+            return self._state(host_key(url)).rate
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Wait for a concurrency slot and a token for the URL's host, and hold the slot."""
+        host = host_key(url)
+        await self._acquire(host)
+        try:
+            delay = self._reserve_token(host)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield
+        finally:
+            self._release(host)
+
+    async def _acquire(self, host: str) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            state = self._state(host)
+            if state.in_flight < self.max_concurrency:
+                state.in_flight += 1
+                return
+            waiter: asyncio.Future = loop.create_future()
+            state.waiters.append((loop, waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    state.waiters.remove((loop, waiter))
+                    handed_over = False
+                except ValueError:
+                    handed_over = True
+            # A slot handed over before the cancellation landed must be given back;
+            # if _wake has not run yet it sees the cancelled waiter and does so itself
+            if handed_over and waiter.done() and not waiter.cancelled():
+                self._release(host)
+            raise
+
+    def _release(self, host: str) -> None:
+        with self._lock:
+            state = self._hosts[host]
+            if not state.waiters:
+                state.in_flight -= 1
+                return
+            # Hand the slot straight to the next waiter (in_flight is unchanged)
+            loop, waiter = state.waiters.popleft()
+        loop.call_soon_threadsafe(self._wake, host, waiter)
+
+    def _wake(self, host: str, waiter: asyncio.Future) -> None:
+        if waiter.done():
+            self._release(host)
+        else:
+            waiter.set_result(None)
+
+    def _reserve_token(self, host: str) -> float:
+        """Take a token, possibly borrowing from the future; returns the seconds to wait for it."""
+        with self._lock:
+            state = self._state(host)
+            now = time.monotonic()
+            state.tokens = min(float(self.burst), state.tokens + (now - state.updated) * state.rate)
+            state.updated = now
+            state.tokens -= 1
+            wait = -state.tokens / state.rate if state.tokens < 0 else 0.0
+            return max(wait, state.paused_until - now)
+
+    def record_throttled(self, url: str, retry_after: Optional[float] = None) -> None:
+        """The host pushed back: halve its rate and honour Retry-After."""
+        with self._lock:
+            state = self._state(host_key(url))
+            state.rate = max(self.min_rate, state.rate / 2)
+            state.tokens = min(state.tokens, 0.0)
+            if retry_after:
+                state.paused_until = max(state.paused_until, time.monotonic() + retry_after)
+
+    def record_success(self, url: str) -> None:
+        """The host answered normally: raise its rate a step towards the maximum."""
+        with self._lock:
+            state = self._state(host_key(url))
+            state.rate = min(self.max_rate, state.rate + self.max_rate / 10)
+
+
+@lru_cache(maxsize=1)
+def default_throttle() -> HostThrottle:
+    """Process-wide throttle, so politeness holds across sessions and searches."""
+    return HostThrottle()
+
+# ============================ FETCHING ============================
+
+
+async def fetch_with_backoff(
+    url: str,
+    http_session: Optional[requests.Session] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    throttle: Optional[HostThrottle] = None,
+    timeout: float = 10,
+    retries: int = 4,
+    base_delay: float = 0.5,
+    max_delay: float = 10.0,
+) -> requests.Response:
+    """
+    GET a URL under the host's rate limit, retrying transient failures.
+
+    Timeouts, connection errors and RETRY_STATUSES are retried with exponential
+    backoff and full jitter; a Retry-After header extends the wait (up to
+    MAX_RETRY_AFTER_SECONDS). Waiting happens on the event loop, and only the
+    blocking request itself runs in a worker thread.
+
+    Args:
+        url (str): Page to fetch.
+        http_session (Optional[requests.Session]): Pooled session; plain requests is used if omitted.
+        headers (Optional[Mapping[str, str]]): Request headers.
+        throttle (Optional[HostThrottle]): Rate limiter; the process-wide one is used if omitted.
+        timeout (float): Per-attempt timeout in seconds.
+        retries (int): Total attempts.
+        base_delay (float): Backoff before the second attempt (before jitter).
+        max_delay (float): Upper bound on the backoff between attempts.
+
+    Returns:
+        requests.Response: The final response, which may still carry an error status.
+
+    Raises:
+        requests.exceptions.RequestException: If the last attempt timed out or could not connect.
+    """
+    import requests
+
+    throttle = throttle or default_throttle()
+    client = http_session or requests
+    retries = max(1, retries)
+    for attempt in range(retries):
+        response: Optional[requests.Response] = None
+        async with throttle.slot(url):
+            with application_logger.span("fetch", url=url, attempt=attempt + 1) as span:
+                try:
+                    response = await asyncio.to_thread(client.get, url, headers=headers, timeout=timeout)
+                    span["http_status"] = response.status_code
+                except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                    span.update(status="error", error=type(e).__name__)
+                    if attempt == retries - 1:
+                        raise
+
+        if response is not None and response.status_code not in RETRY_STATUSES:
+            throttle.record_success(url)
+            return response
+
+        delay = backoff_delay(attempt, base_delay, max_delay)
+        if response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if response.status_code in THROTTLE_STATUSES:
+                throttle.record_throttled(url, retry_after)
+            if (attempt == retries - 1 or (retry_after or 0) > MAX_RETRY_AFTER_SECONDS
+                    or (response.status_code == 403 and attempt >= FORBIDDEN_RETRIES)):
+                return response
+            delay = max(delay, retry_after or 0)
+        application_logger.log_warning(
+            f"Retrying {url} in {delay:.2f}s", url=url, attempt=attempt + 1,
+            http_status=response.status_code if response is not None else None,
+        )
+        await asyncio.sleep(delay)
@@ -1,30 +1,226 @@
+from __future__ import annotations
+
 import asyncio
 import json
 import os
-import pickle
 import subprocess
-import time
 import urllib.parse
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-import httpx
-import keras
-import numpy as np
-import requests
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Any, Optional
 import re
-from bs4 import BeautifulSoup
-from gtts import gTTS
-from huggingface_hub import hf_hub_download
-from keras.utils import pad_sequences
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import concurrent.futures
+import queue
+import threading
+from contextlib import contextmanager
+from fetcher import HostThrottle, fetch_with_backoff
 from logger.app_logger import application_logger
+from singleflight import SingleFlight
+
+# Heavy third-party packages (keras, selenium, bs4, gtts, huggingface_hub, requests)
+# are imported inside the functions that use them, so importing this module stays
+# cheap for callers that only need part of it (e.g. AI-only mode in app.py).
+# See benchmark_startup.py for the import-time budget.
+if TYPE_CHECKING:
+    import numpy as np
+    import requests
+    from bs4 import BeautifulSoup
+    from selenium import webdriver
+    from speech import SpeechService
+    from text_encoder import TextEncoder
+
+# ============================ TOKENIZER VOCABULARY ============================
+
+CREDIBILITY_MODEL_REPO: str = "SanjanaAmaravathi/deliverable3"
+LLM_MODEL_NAME: str = "llama3.2:latest"
+DUCKDUCKGO_HTML_URL: str = "https://duckduckgo.com/html/"
+TOKENIZER_VOCAB_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tokenizer_vocab.json")
+
+
+@lru_cache(maxsize=1)
+def load_text_encoder() -> TextEncoder:
+    """
+    Load the credibility model's tokenizer vocabulary without importing the Keras Tokenizer.
+
+    The vocabulary is read from tokenizer_vocab.json; if it is missing it is exported
+    once from the tokenizer.pkl published next to the model.
+
+    Returns:
+        TextEncoder: Encoder producing the same ids as the pickled Tokenizer.
+    """
+    from text_encoder import TextEncoder, export_vocabulary
+
+    if not os.path.exists(TOKENIZER_VOCAB_PATH):
+        from huggingface_hub import hf_hub_download
+
+        tokenizer_path: str = hf_hub_download(repo_id=CREDIBILITY_MODEL_REPO, filename="tokenizer.pkl")
+        export_vocabulary(tokenizer_path, TOKENIZER_VOCAB_PATH)
+        application_logger.log_info("Tokenizer vocabulary exported from tokenizer.pkl", level="INFO")
+    return TextEncoder.from_json(TOKENIZER_VOCAB_PATH)
+
+# ============================ SHARED RESOURCES ============================
+# Process-wide resources that are expensive to build. Each one is cheap to construct
+# and loads lazily, so callers (app.py via Streamlit's cache_resource, or scripts)
+# can create one instance and share it across sessions and threads.
+
+# Concurrent scoring of the same title with the same model runs inference once
+credibility_scores = SingleFlight()
+
+
+class ModelRegistry:
+    """Loads the credibility model and its tokenizer vocabulary once and shares them."""
+
+    def __init__(self, repo_id: str = CREDIBILITY_MODEL_REPO, model_path: Optional[str] = None) -> None:
+        """
+        Args:
+            repo_id (str): Hugging Face repo the model is downloaded from.
+            model_path (Optional[str]): Local model.keras to load instead of downloading.
+        """
+        self.repo_id = repo_id
+        self.model_path = model_path
+        self._model = None
+        self._lock = threading.Lock()
+
+    def credibility_model(self):
+        """Return the Keras credibility model, downloading and loading it on first use."""
+        with self._lock:
+            if self._model is None:
+                import keras
+                from huggingface_hub import hf_hub_download
+
+                with application_logger.span("model_load", repo_id=self.repo_id):
+                    model_path: str = self.model_path or hf_hub_download(repo_id=self.repo_id, filename="model.keras")
+                    self._model = keras.models.load_model(model_path)
+                application_logger.log_info("Credibility model loaded", level="INFO")
+        return self._model
+
+    def text_encoder(self) -> TextEncoder:
+        """Return the tokenizer vocabulary encoder for the credibility model."""
+        return load_text_encoder()
+
+
+class OllamaClient:
+    """Thin client for a local Ollama model; stateless, so one instance serves every session."""
+
+    def __init__(self, model_name: str = LLM_MODEL_NAME, command: Optional[List[str]] = None) -> None:
+        """
+        Args:
+            model_name (str): Ollama model tag.
+            command (Optional[List[str]]): Command that reads a prompt on stdin and prints the reply;
+                defaults to `ollama run <model_name>` (benchmarks substitute a stub).
+        """
+        self.model_name = model_name
+        self.command: List[str] = command or ["ollama", "run", model_name]
+
+    def run(self, prompt: str) -> subprocess.CompletedProcess:
+        """Run a single prompt through `ollama run` and return the completed process."""
+        with application_logger.span("llm", model=self.model_name, prompt_chars=len(prompt)) as span:
+            completed = subprocess.run(
+                self.command,
+                input=prompt,
+                capture_output=True,
+                text=True,
+                encoding="utf-8"
+            )
+            span["returncode"] = completed.returncode
+        return completed
+
+
+def create_http_session(pool_size: int = 20) -> requests.Session:
+    """
+    Create a requests session with a connection pool large enough for concurrent article fetches.
+
+    Args:
+        pool_size (int): Maximum connections kept per host.
+
+    Returns:
+        requests.Session: Session reusing TCP/TLS connections across requests.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def create_chrome_driver() -> webdriver.Chrome:
+    """Start a headless Chrome instance configured for scraping search results."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")  # Run without UI
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-notifications")  # Disable push notifications
+    chrome_options.add_argument("--disable-popup-blocking") # Prevent popups interfering
+
+    
+    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36")
+    #chrome_options.add_argument("--user-data-dir=C:\\temp\\selenium_profile")
+
+    return webdriver.Chrome(options=chrome_options)
+
+
+class BrowserPool:
+    """A bounded pool of headless Chrome drivers reused across searches."""
+
+    def __init__(self, size: int = 2) -> None:
+        self.size = size
+        self._idle: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    @property
+    def in_use(self) -> int:
+        """Number of drivers currently borrowed."""
+        return self._created - self._idle.qsize()
+
+    @contextmanager
+    def acquire(self):
+        """Borrow a driver, starting one if the pool is below its size; blocks when all are in use."""
+        driver = None
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                try:
+                    driver = create_chrome_driver()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            else:
+                driver = self._idle.get()
+
+        try:
+            yield driver
+        except Exception:
+            # A failed page load can leave the browser in a bad state; replace it
+            driver.quit()
+            with self._lock:
+                self._created -= 1
+            raise
+        else:
+            self._idle.put(driver)
+
+    def close(self) -> None:
+        """Quit every idle driver."""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            driver.quit()
+            with self._lock:
+                self._created -= 1
 
 # ============================ AI ASSISTANT CLASS ============================
 class AIAssistant:
@@ -32,9 +228,17 @@ class AIAssistant:
     An AI assistant class that interfaces with a local Llama model via Ollama.
     """
 
-    def __init__(self) -> None:
-        """Initialize the AIAssistant instance with conversation memory."""
+    def __init__(self, llm: Optional[OllamaClient] = None, model_registry: Optional[ModelRegistry] = None) -> None:
+        """
+        Initialize the AIAssistant instance with conversation memory.
+
+        Args:
+            llm (Optional[OllamaClient]): Shared LLM client; a new one is created if omitted.
+            model_registry (Optional[ModelRegistry]): Shared credibility model registry; a new one is created if omitted.
+        """
         self.conversation_log: List[Dict[str, str]] = [{"role": "system", "content": "You are a helpful assistant."}]
+        self.llm: OllamaClient = llm or OllamaClient()
+        self.model_registry: ModelRegistry = model_registry or ModelRegistry()
         application_logger.log_info("AI Assistant initialized", level="INFO")
 
     def generate_response(self, user_input: str) -> str:
@@ -50,13 +254,7 @@ class AIAssistant:
         )
 
         try:
-            model_response = subprocess.run(
-                ["ollama", "run", "llama3.2:latest"],
-                input=dialogue_history,
-                capture_output=True,
-                text=True,
-                encoding="utf-8"
-            )
+            model_response = self.llm.run(dialogue_history)
 
             if model_response.returncode != 0:
                 application_logger.log_error(f"Model execution error: {model_response.stderr}")
@@ -89,12 +287,7 @@ class AIAssistant:
             """
 
             try:
-                model_response = subprocess.run(
-                    ["ollama", "run", "llama3.2:latest"],
-                    input=evaluation_prompt,
-                    capture_output=True,
-                    text=True,
-                )
+                model_response = self.llm.run(evaluation_prompt)
 
                 if model_response.returncode != 0:
                     application_logger.log_error(f"Model execution error: {model_response.stderr}")
@@ -128,23 +321,38 @@ class AIAssistant:
         Returns:
             str: A credibility rating based on the model's prediction.
         """
+        # Model loading and predict are blocking; keep them off the event loop so
+        # other articles keep downloading while this one is scored. The same title
+        # scored concurrently (e.g. by several sessions) runs the model once.
+        return await credibility_scores.do(
+            (id(self.model_registry), article_title), asyncio.to_thread, self._predict_credibility, article_title,
+        )
+
+    def _predict_credibility(self, article_title: str) -> str:
+        """Blocking part of rate_article_credibility."""
+        with application_logger.span("score") as span:
+            rating: str = self._score_title(article_title)
+            if rating == "Error":
+                span.update(status="error", reason="rating_error")
+        return rating
+
+    def _score_title(self, article_title: str) -> str:
+        """Run the credibility model on one title; returns "Error" on failure."""
         try:
-            # Load the model and tokenizer
-            model_path: str = hf_hub_download(repo_id="SanjanaAmaravathi/deliverable3", filename="model.keras")
-            tokenizer_path: str = hf_hub_download(repo_id="SanjanaAmaravathi/deliverable3", filename="tokenizer.pkl")
+            import numpy as np
 
-            new_model = keras.models.load_model(model_path)
-            with open(tokenizer_path, "rb") as f:
-                tokenizer = pickle.load(f)
+            # Shared model and tokenizer vocabulary (loaded once per registry)
+            new_model = self.model_registry.credibility_model()
+            encoder: TextEncoder = self.model_registry.text_encoder()
 
             # Preprocess the input data
             max_length: int = new_model.input_shape[0][1]
-            X_text: List[List[int]] = tokenizer.texts_to_sequences([article_title])
-            X_text = pad_sequences(X_text, maxlen=max_length, padding='post')
+            X_text: np.ndarray = encoder.encode([article_title], maxlen=max_length, padding='post')
             X_func_rating: np.ndarray = np.array([5]).reshape(-1, 1)  # Dummy rating for example
 
             # Make predictions
-            predictions: np.ndarray = new_model.predict({"text_input": X_text, "func_rating_input": X_func_rating})
+            with application_logger.span("inference"):
+                predictions: np.ndarray = new_model.predict({"text_input": X_text, "func_rating_input": X_func_rating}, verbose=0)
             prediction: int = np.argmax(predictions, axis=1)[0]
 
             application_logger.log_info(f"Article credibility rated: {prediction}", level="INFO")
@@ -156,144 +364,254 @@ class AIAssistant:
 
 # ============================ CONTENT EXTRACTION ============================
 
-def extract_article_content(article_url: str) -> str:
+# Concurrent requests for the same URL (across searches and sessions) share one download
+article_fetches = SingleFlight()
+
+BROWSER_HEADERS: Dict[str, str] = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/89.0.4389.114 Safari/537.36",
+    "Referer": "https://www.google.com"  # Simulate referring from a search engine
+}
+
+
+@application_logger.timed("extract")
+async def extract_article_content(article_url: str, http_session: Optional[requests.Session] = None,
+                                  throttle: Optional[HostThrottle] = None) -> str:
     """
     Extract the main content from a news article URL.
 
+    The download goes through fetcher.fetch_with_backoff, which applies the
+    per-host rate limit and retries throttled or failed requests with jittered
+    exponential backoff, without blocking a worker thread while it waits.
+    Callers asking for a URL that is already being extracted share that result.
+
     Args:
         article_url (str): The URL of the target article.
+        http_session (Optional[requests.Session]): Shared pooled session; plain requests.get is used if omitted.
+        throttle (Optional[HostThrottle]): Per-host rate limiter; the process-wide one is used if omitted.
 
     Returns:
         str: Extracted article text content.
     """
-    try:
-        browser_headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/89.0.4389.114 Safari/537.36",
-            "Referer": "https://www.google.com"  # Simulate referring from a search engine
-        }
-        retries: int = 3
-        for attempt in range(retries):
-            try:
-                response: requests.Response = requests.get(article_url, headers=browser_headers, timeout=10)
-                if response.status_code == 403:
-                    application_logger.log_error(f"Access forbidden to article: {response.status_code}")
-                    return "Access forbidden to article."
-                if response.status_code != 200:
-                    application_logger.log_error(f"Failed to fetch article: {response.status_code}")
-                    return "Failed to fetch article."
-
-                soup: BeautifulSoup = BeautifulSoup(response.text, "html.parser")
-                paragraphs: List[BeautifulSoup] = soup.find_all("p")
-
-                # Extract and return cleaned text
-                article_content: str = "\n".join([p.text.strip() for p in paragraphs if p.text.strip()])
-                application_logger.log_info(f"Article content extracted from {article_url}", level="INFO")
-                return article_content
-
-            except requests.exceptions.Timeout:
-                application_logger.log_warning(f"Timeout occurred while fetching article: {article_url}, attempt {attempt + 1}")
-                if attempt < retries - 1:
-                    time.sleep(2)  # Wait before retrying
-                    continue
-                return "Error: Timeout occurred while fetching article."
+    return await article_fetches.do(article_url, _download_article, article_url, http_session, throttle)
 
+
+async def _download_article(article_url: str, http_session: Optional[requests.Session],
+                            throttle: Optional[HostThrottle]) -> str:
+    """Uncoalesced body of extract_article_content."""
+    import requests
+
+    try:
+        response: requests.Response = await fetch_with_backoff(
+            article_url, http_session, headers=BROWSER_HEADERS, throttle=throttle,
+        )
+    except requests.exceptions.Timeout:
+        application_logger.log_warning(f"Timeout occurred while fetching article: {article_url}")
+        return "Error: Timeout occurred while fetching article."
     except Exception as e:
         application_logger.log_error(f"Error extracting article content: {e}")
         return f"Error extracting article content: {e}"
 
-        return "Failed to fetch article after multiple attempts."
+    if response.status_code == 403:
+        application_logger.log_error(f"Access forbidden to article: {response.status_code}")
+        return "Access forbidden to article."
+    if response.status_code != 200:
+        application_logger.log_error(f"Failed to fetch article: {response.status_code}")
+        return "Failed to fetch article."
+
+    # HTML parsing is CPU-bound; keep it off the event loop
+    article_content: str = await asyncio.to_thread(parse_article_text, article_url, response.text)
+    application_logger.log_info(f"Article content extracted from {article_url}", level="INFO")
+    return article_content
+
+
+def parse_article_text(article_url: str, html: str) -> str:
+    """Join the non-empty paragraph texts of an article page."""
+    from bs4 import BeautifulSoup
+
+    with application_logger.span("parse", url=article_url, html_chars=len(html)):
+        soup: BeautifulSoup = BeautifulSoup(html, "html.parser")
+        paragraphs: List[BeautifulSoup] = soup.find_all("p")
+        return "\n".join([p.text.strip() for p in paragraphs if p.text.strip()])
 
 # ============================ NEWS SEARCH ============================
 
-async def fetch_news_data(query: str, count: int = 5, region: str = "us-en", time_filter: str = "w") -> Dict[str, Any]:
+def search_duckduckgo(query: str, region: str, time_filter: str, browser_pool: Optional[BrowserPool] = None) -> List[BeautifulSoup]:
     """
-    Search and analyze news articles using DuckDuckGo with parallel processing.
+    Load the DuckDuckGo results page in headless Chrome and return the result blocks.
 
     Args:
         query (str): Search terms.
-        count (int): Number of articles to retrieve.
         region (str): Geographic region code (e.g., 'us-en', 'in-en').
         time_filter (str): Time range filter ('d'=day, 'w'=week, 'm'=month, 'y'=year).
+        browser_pool (Optional[BrowserPool]): Shared Chrome drivers; a single-use driver is started if omitted.
 
     Returns:
-        Dict[str, Any]: Processed news article data.
+        List[BeautifulSoup]: One element per search result.
     """
-    application_logger.log_info(f"Initiating news search for: {query}", level="INFO")
+    return parse_search_results(load_search_page(query, region, time_filter, browser_pool))
 
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")  # Run without UI
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-notifications")  # Disable push notifications
-    chrome_options.add_argument("--disable-popup-blocking") # Prevent popups interfering
 
-    
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36")
-    #chrome_options.add_argument("--user-data-dir=C:\\temp\\selenium_profile")
+def load_search_page(query: str, region: str, time_filter: str, browser_pool: Optional[BrowserPool] = None) -> str:
+    """Page source of the DuckDuckGo news results, as rendered by headless Chrome (see search_duckduckgo)."""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    owns_pool: bool = browser_pool is None
+    if owns_pool:
+        browser_pool = BrowserPool(size=1)
 
-    driver: webdriver.Chrome = webdriver.Chrome(options=chrome_options)
+    duckduckgo_news_url: str = f"{DUCKDUCKGO_HTML_URL}?q={query.replace(' ', '+')}&kl={region}&df={time_filter}&ia=news"
+    try:
+        with application_logger.span("search", query=query, region=region), browser_pool.acquire() as driver:
+            driver.get(duckduckgo_news_url)
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CLASS_NAME, "result__body")))
+            return driver.page_source
+    finally:
+        if owns_pool:
+            browser_pool.close()
 
-    duckduckgo_news_url: str = f"https://duckduckgo.com/html/?q={query.replace(' ', '+')}&kl={region}&df={time_filter}&ia=news"
-    driver.get(duckduckgo_news_url)
-    WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CLASS_NAME, "result__body")))
-    soup: BeautifulSoup = BeautifulSoup(driver.page_source, "html.parser")
-    search_results: List[BeautifulSoup] = soup.find_all("div", class_="result__body")
 
-    async def process_article(result: BeautifulSoup, index: int) -> Optional[Dict[str, Any]]:
-        """
-        Process a single search result and extract relevant information.
+def parse_search_results(page_source: str) -> List[BeautifulSoup]:
+    """Result blocks of a DuckDuckGo results page."""
+    from bs4 import BeautifulSoup
 
-        Args:
-            result (BeautifulSoup): The search result to process.
-            index (int): The index of the search result.
+    with application_logger.span("parse", source="duckduckgo"):
+        soup: BeautifulSoup = BeautifulSoup(page_source, "html.parser")
+        return soup.find_all("div", class_="result__body")
 
-        Returns:
-            Optional[Dict[str, Any]]: A dictionary containing the extracted information, or None if an error occurs.
-        """
-        try:
-            title_tag: Optional[BeautifulSoup] = result.find("a", class_="result__a")
-            if not title_tag:
-                application_logger.log_warning(f"Title tag not found for result index {index}")
-                return None
 
-            title: str = title_tag.text.strip()
-            raw_link: str = title_tag["href"]
+def result_link(result: BeautifulSoup) -> Optional[str]:
+    """Article URL of a search result block (unwrapped from DuckDuckGo's redirect), or None."""
+    title_tag: Optional[BeautifulSoup] = result.find("a", class_="result__a")
+    if not title_tag:
+        return None
+    match: Optional[re.Match] = re.search(r"uddg=(https?%3A%2F%2F[^&]+)", title_tag["href"])
+    return urllib.parse.unquote(match.group(1)) if match else "Unknown Link"
+
+
+async def process_article(result: BeautifulSoup, index: int, bot: AIAssistant,
+                          http_session: Optional[requests.Session] = None,
+                          throttle: Optional[HostThrottle] = None) -> Optional[Dict[str, Any]]:
+    """
+    Process a single search result and extract relevant information.
+
+    Args:
+        result (BeautifulSoup): The search result to process.
+        index (int): The index of the search result.
+        bot (AIAssistant): Assistant used to rate the article.
+        http_session (Optional[requests.Session]): Shared pooled session for the article download.
+        throttle (Optional[HostThrottle]): Per-host rate limiter; the process-wide one is used if omitted.
 
-            match: Optional[re.Match] = re.search(r"uddg=(https?%3A%2F%2F[^&]+)", raw_link)
-            link: str = urllib.parse.unquote(match.group(1)) if match else "Unknown Link"
+    Returns:
+        Optional[Dict[str, Any]]: A dictionary containing the extracted information, or None if an error occurs.
+    """
+    try:
+        title_tag: Optional[BeautifulSoup] = result.find("a", class_="result__a")
+        if not title_tag:
+            application_logger.log_warning(f"Title tag not found for result index {index}")
+            return None
 
-            snippet_tag: Optional[BeautifulSoup] = result.find("a", class_="result__snippet")
-            summary: str = snippet_tag.text.strip() if snippet_tag else "No summary available."
+        title: str = title_tag.text.strip()
+        link: str = result_link(result)
 
-            article_content: str = extract_article_content(link)
+        snippet_tag: Optional[BeautifulSoup] = result.find("a", class_="result__snippet")
+        summary: str = snippet_tag.text.strip() if snippet_tag else "No summary available."
 
-            bot: AIAssistant = AIAssistant()
+        # Downloads of different articles overlap; per-host limits are applied inside
+        article_content: str = await extract_article_content(link, http_session, throttle)
 
-            # Rate the credibility of the article
-            rating: str = await bot.rate_article_credibility(title, article_content)
+        # Rate the credibility of the article
+        rating: str = await bot.rate_article_credibility(title, article_content)
 
-            application_logger.log_info(f"Processed article: {title}", level="INFO")
+        application_logger.log_info(f"Processed article: {title}", level="INFO")
 
-            return {
-                "num": index + 1,
-                "link": link,
-                "title": title,
-                "summary": summary,
-                "body": article_content,
-                "rating": rating
-            }
-        except Exception as e:
-            application_logger.log_error(f"Error processing article: {e}")
-            return None
+        return {
+            "num": index + 1,
+            "link": link,
+            "title": title,
+            "summary": summary,
+            "body": article_content,
+            "rating": rating
+        }
+    except Exception as e:
+        application_logger.log_error(f"Error processing article: {e}")
+        return None
+
+
+async def stream_news_data(
+    query: str,
+    count: int = 5,
+    region: str = "us-en",
+    time_filter: str = "w",
+    browser_pool: Optional[BrowserPool] = None,
+    http_session: Optional[requests.Session] = None,
+    assistant: Optional[AIAssistant] = None,
+    throttle: Optional[HostThrottle] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Search DuckDuckGo and yield each processed article as soon as it is ready.
 
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        tasks: List[concurrent.futures.Future] = [executor.submit(process_article, result, index) for index, result in enumerate(search_results[:count])]
-        extracted_results: List[Optional[Dict[str, Any]]] = [task.result() for task in concurrent.futures.as_completed(tasks)]
+    Articles are fetched and rated concurrently and yielded in completion order,
+    so the first result arrives after the fastest article rather than the slowest.
+    Results that fail to process are skipped. Arguments are as for fetch_news_data.
 
-    driver.quit()
+    Yields:
+        Dict[str, Any]: One processed article (see process_article).
+    """
+    application_logger.log_info(f"Initiating news search for: {query}", level="INFO")
 
-    extracted_results = [res for res in extracted_results if res is not None]
+    bot: AIAssistant = assistant or AIAssistant()
+    search_results: List[BeautifulSoup] = await asyncio.to_thread(search_duckduckgo, query, region, time_filter, browser_pool)
+
+    tasks: List[asyncio.Task] = [
+        asyncio.ensure_future(process_article(result, index, bot, http_session, throttle))
+        for index, result in enumerate(search_results[:count])
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            article: Optional[Dict[str, Any]] = await next_done
+            if article is not None:
+                yield article
+    finally:
+        # The consumer may stop early; do not leave orphaned work behind
+        for task in tasks:
+            task.cancel()
+
+
+async def fetch_news_data(
+    query: str,
+    count: int = 5,
+    region: str = "us-en",
+    time_filter: str = "w",
+    browser_pool: Optional[BrowserPool] = None,
+    http_session: Optional[requests.Session] = None,
+    assistant: Optional[AIAssistant] = None,
+    throttle: Optional[HostThrottle] = None,
+) -> Dict[str, Any]:
+    """
+    Search and analyze news articles using DuckDuckGo with parallel processing.
+
+    Args:
+        query (str): Search terms.
+        count (int): Number of articles to retrieve.
+        region (str): Geographic region code (e.g., 'us-en', 'in-en').
+        time_filter (str): Time range filter ('d'=day, 'w'=week, 'm'=month, 'y'=year).
+        browser_pool (Optional[BrowserPool]): Shared Chrome drivers; a single-use driver is started if omitted.
+        http_session (Optional[requests.Session]): Shared pooled session for article downloads.
+        assistant (Optional[AIAssistant]): Assistant (and its model registry) used to rate articles.
+        throttle (Optional[HostThrottle]): Per-host rate limiter for article downloads; the
+            process-wide one is used if omitted.
+
+    Returns:
+        Dict[str, Any]: Processed news article data.
+    """
+    extracted_results: List[Dict[str, Any]] = [
+        article async for article in stream_news_data(
+            query, count, region, time_filter,
+            browser_pool=browser_pool, http_session=http_session, assistant=assistant, throttle=throttle,
+        )
+    ]
 
     if extracted_results:
         application_logger.log_info(f"News search completed successfully with {len(extracted_results)} results", level="INFO")
@@ -310,11 +628,27 @@ def get_current_year() -> int:
     return datetime.now().year
 
 
-def text_to_speech(input_text: str) -> None:
-    """Convert text to speech and save as audio file."""
+@lru_cache(maxsize=1)
+def default_speech_service() -> SpeechService:
+    """Process-wide speech service used when callers do not supply their own."""
+    from speech import SpeechService
+
+    return SpeechService()
+
+
+def text_to_speech(input_text: str, speech_service: Optional[SpeechService] = None) -> bytes:
+    """
+    Convert text to speech and return the MP3 audio as bytes.
+
+    Args:
+        input_text (str): Text to speak.
+        speech_service (Optional[SpeechService]): Shared service to synthesise with.
+
+    Returns:
+        bytes: MP3 audio, or empty bytes if synthesis failed.
+    """
     try:
-        speech_generator = gTTS(text=input_text, lang="en")
-        speech_generator.save("output.mp3")
-        application_logger.log_info("Text successfully converted to audio", level="INFO")
+        return (speech_service or default_speech_service()).synthesize_now(input_text)
     except Exception as e:
-        application_logger.log_error(f"Audio conversion error: {e}")
\ No newline at end of file
+        application_logger.log_error(f"Audio conversion error: {e}")
+        return b""
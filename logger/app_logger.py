@@ -0,0 +1,199 @@
+import atexit
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# ============================ TRACE CONTEXT ============================
+
+# Trace id of the request being served. contextvars follow asyncio tasks and
+# asyncio.to_thread calls, so every log line of one query shares the same id.
+_trace_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("trace_id", default=None)
+
+
+def new_trace_id() -> str:
+    """Generate a short random trace id."""
+    return uuid.uuid4().hex[:16]
+
+
+def get_trace_id() -> Optional[str]:
+    """Return the trace id of the current context, if any."""
+    return _trace_id.get()
+
+
+@contextmanager
+def trace(trace_id: Optional[str] = None) -> Iterator[str]:
+    """
+    Tag every log line and span emitted inside the block with one trace id.
+
+    Args:
+        trace_id (Optional[str]): Id to use; a new one is generated if omitted.
+
+    Yields:
+        str: The active trace id.
+    """
+    token = _trace_id.set(trace_id or new_trace_id())
+    try:
+        yield _trace_id.get()
+    finally:
+        _trace_id.reset(token)
+
+# ============================ JSON FORMATTING ============================
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        trace_id = getattr(record, "trace_id", None)
+        if trace_id:
+            entry["trace_id"] = trace_id
+        entry.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+# ============================ APPLICATION LOGGER ============================
+
+
+class ApplicationLogger:
+    """
+    Structured application logger with timing spans.
+
+    Records are handed to a QueueHandler, and a QueueListener thread formats
+    and writes them. Logging from the event loop or a worker thread is
+    therefore only a queue put and never waits on I/O.
+    """
+
+    def __init__(self, name: str = "intellisearch", level: str = "INFO", log_file: Optional[str] = None) -> None:
+        """
+        Args:
+            name (str): Name of the underlying logging.Logger.
+            level (str): Minimum level to emit.
+            log_file (Optional[str]): Also append JSON lines to this file.
+        """
+        self.logger = logging.getLogger(name)
+        self.logger.setLevel(level)
+        self.logger.propagate = False
+
+        formatter = JsonFormatter()
+        handlers = [logging.StreamHandler(sys.stderr)]
+        if log_file:
+            handlers.append(logging.FileHandler(log_file, encoding="utf-8"))
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        self.logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+        self._listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self._span_listeners: List[Callable[[str, float, str, Dict[str, Any]], None]] = []
+        self._listener.start()
+        atexit.register(self.close)
+
+    def _log(self, level: int, message: str, fields: Dict[str, Any], exc_info: bool = False) -> None:
+        self.logger.log(level, message, exc_info=exc_info, extra={"trace_id": _trace_id.get(), "fields": fields})
+
+    def log_debug(self, message: str, **fields: Any) -> None:
+        self._log(logging.DEBUG, message, fields)
+
+    def log_info(self, message: str, level: str = "INFO", **fields: Any) -> None:
+        self._log(logging.getLevelName(level.upper()), message, fields)
+
+    def log_warning(self, message: str, **fields: Any) -> None:
+        self._log(logging.WARNING, message, fields)
+
+    def log_error(self, message: str, exc_info: bool = False, **fields: Any) -> None:
+        self._log(logging.ERROR, message, fields, exc_info=exc_info)
+
+    @contextmanager
+    def span(self, name: str, **fields: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Time a pipeline stage and log its duration when it ends.
+
+        The yielded dict can be updated inside the block to attach results
+        (e.g. an HTTP status) to the span record.
+
+        Args:
+            name (str): Stage name, e.g. "search", "fetch", "inference".
+            **fields: Extra attributes recorded with the span.
+
+        Yields:
+            Dict[str, Any]: Mutable span attributes.
+        """
+        attributes: Dict[str, Any] = dict(fields)
+        start = time.perf_counter()
+        status = "ok"
+        try:
+            yield attributes
+        except BaseException as e:
+            status = "error"
+            attributes.setdefault("error", type(e).__name__)
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            status = attributes.pop("status", status)
+            self._log(logging.INFO, f"span {name}", {
+                "span": name,
+                "duration_ms": round(duration * 1000, 3),
+                "status": status,
+                **attributes,
+            })
+            for listener in self._span_listeners:
+                try:
+                    listener(name, duration, status, attributes)
+                except Exception:
+                    pass  # Instrumentation must never break the pipeline
+
+    def add_span_listener(self, listener: Callable[[str, float, str, Dict[str, Any]], None]) -> None:
+        """
+        Call listener(name, duration_seconds, status, attributes) whenever a span ends.
+
+        Used to feed span timings into metrics without the pipeline code knowing
+        about the metrics backend.
+        """
+        self._span_listeners.append(listener)
+
+    def timed(self, name: str, **fields: Any) -> Callable:
+        """Decorator form of span() for sync and async functions."""
+        def decorator(func: Callable) -> Callable:
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(name, **fields):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name, **fields):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def close(self) -> None:
+        """Flush queued records and stop the listener thread."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+
+application_logger = ApplicationLogger(
+    level=os.environ.get("LOG_LEVEL", "INFO"),
+    log_file=os.environ.get("LOG_FILE"),
+)
@@ -0,0 +1,152 @@
+import os
+import threading
+from typing import Any, Callable, Dict, Iterator, Tuple
+from prometheus_client import REGISTRY, Counter, Gauge, Histogram, start_http_server
+from prometheus_client.core import CounterMetricFamily
+from prometheus_client.registry import Collector
+from logger.app_logger import application_logger
+
+# ============================ METRIC DEFINITIONS ============================
+
+METRICS_PORT: int = int(os.environ.get("METRICS_PORT", "9100"))
+
+# Stage latencies come from the timing spans in helper.py/speech.py: search
+# (DuckDuckGo), extract (extract_article_content, split into fetch and parse),
+# score (credibility model incl. model_load/inference), llm and tts.
+STAGE_SECONDS = Histogram(
+    "pipeline_stage_seconds",
+    "Latency of each search-and-rate pipeline stage",
+    ["stage"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+STAGE_TOTAL = Counter(
+    "pipeline_stage_total",
+    "Completed pipeline stages by outcome",
+    ["stage", "status"],
+)
+ERRORS_TOTAL = Counter(
+    "pipeline_errors_total",
+    "Pipeline errors by stage and reason (HTTP status, timeout, rating_error, exception type)",
+    ["stage", "reason"],
+)
+POOL_IN_USE = Gauge(
+    "pool_in_use",
+    "Workers or connections currently busy in a shared pool",
+    ["pool"],
+)
+POOL_SIZE = Gauge(
+    "pool_size",
+    "Capacity of a shared pool",
+    ["pool"],
+)
+
+
+def error_reason(status: str, attributes: Dict[str, Any]) -> str:
+    """Classify a finished span as an error reason, or "" if it succeeded."""
+    http_status = attributes.get("http_status")
+    if isinstance(http_status, int) and http_status >= 400:
+        return str(http_status)
+    if status != "error":
+        return ""
+    if "reason" in attributes:
+        return str(attributes["reason"])
+    error = str(attributes.get("error", "error"))
+    return "timeout" if "Timeout" in error else error
+
+
+def record_span(name: str, duration: float, status: str, attributes: Dict[str, Any]) -> None:
+    """Span listener feeding stage latencies, outcomes and errors into Prometheus."""
+    STAGE_SECONDS.labels(stage=name).observe(duration)
+    STAGE_TOTAL.labels(stage=name, status=status).inc()
+    reason = error_reason(status, attributes)
+    if reason:
+        ERRORS_TOTAL.labels(stage=name, reason=reason).inc()
+
+# ============================ CACHES AND POOLS ============================
+
+
+class CacheStatsCollector(Collector):
+    """
+    Exposes hit/miss counters of registered caches at scrape time.
+
+    Caches keep plain integer counters and do not depend on prometheus_client;
+    the hit ratio is rate(cache_hits_total) / (rate(cache_hits_total) + rate(cache_misses_total)).
+    """
+
+    def __init__(self) -> None:
+        self._caches: Dict[str, Callable[[], Tuple[int, int]]] = {}
+
+    def register(self, name: str, stats: Callable[[], Tuple[int, int]]) -> None:
+        self._caches[name] = stats
+
+    def collect(self) -> Iterator[CounterMetricFamily]:
+        hits = CounterMetricFamily("cache_hits", "Cache hits", labels=["cache"])
+        misses = CounterMetricFamily("cache_misses", "Cache misses", labels=["cache"])
+        for name, stats in self._caches.items():
+            hit_count, miss_count = stats()
+            hits.add_metric([name], hit_count)
+            misses.add_metric([name], miss_count)
+        yield hits
+        yield misses
+
+
+CACHE_STATS = CacheStatsCollector()
+REGISTRY.register(CACHE_STATS)
+
+
+def register_cache(name: str, stats: Callable[[], Tuple[int, int]]) -> None:
+    """
+    Report a cache's (hits, misses) on every scrape.
+
+    Args:
+        name (str): Cache label, e.g. "speech" or "search".
+        stats (Callable[[], Tuple[int, int]]): Returns the cumulative hit and miss counts.
+    """
+    CACHE_STATS.register(name, stats)
+
+
+def register_pool(name: str, in_use: Callable[[], int], size: int) -> None:
+    """
+    Report how saturated a shared pool is on every scrape.
+
+    Args:
+        name (str): Pool label, e.g. "browser" or "tts".
+        in_use (Callable[[], int]): Returns the number of busy slots.
+        size (int): Pool capacity.
+    """
+    POOL_IN_USE.labels(pool=name).set_function(in_use)
+    POOL_SIZE.labels(pool=name).set(size)
+
+# ============================ HTTP ENDPOINT ============================
+
+_server_lock = threading.Lock()
+_server_started = False
+
+
+def start_metrics_server(port: int = METRICS_PORT) -> bool:
+    """
+    Serve /metrics on a local port next to the Streamlit app and start
+    recording pipeline spans. Safe to call on every rerun; only the first
+    call has an effect.
+
+    If the port cannot be bound (another app instance, node_exporter on 9100),
+    a warning is logged and the app runs without metrics.
+
+    Returns:
+        bool: Whether the endpoint is being served.
+    """
+    global _server_started
+    with _server_lock:
+        if _server_started:
+            return True
+        try:
+            start_http_server(port)
+        except OSError as e:
+            application_logger.log_warning(f"Prometheus metrics disabled, cannot bind port {port}: {e}",
+                                           port=port, error=str(e))
+            return False
+        # Only once the endpoint is up, so a failed start never leaves a listener behind
+        application_logger.add_span_listener(record_span)
+        _server_started = True
+    application_logger.log_info(f"Prometheus metrics served on port {port}", level="INFO", port=port)
+    return True
@@ -1,9 +1,8 @@
 import streamlit as st
 from tinytroupe.agent import TinyPerson
 from tinytroupe.environment import TinyWorld
+from simulation import persona_interactions, run_rounds
 import openai
-import io
-import sys
 import json
 import base64
 from typing import List
@@ -32,15 +31,12 @@ def simulate_feedback(feature_description, personas):
     for persona in personas:
         persona.listen(f"Please provide your thoughts on the following product feature: {feature_description}")
 
-    world.run(3)
+    # Personas take each round's turns concurrently; delivery order stays fixed
+    run_rounds(world, 3)
 
     feedback = {}
     for persona in personas:
-        captured_output = io.StringIO()
-        sys.stdout = captured_output
-        persona.pp_current_interactions()
-        sys.stdout = sys.__stdout__
-        feedback[persona.name] = captured_output.getvalue()
+        feedback[persona.name] = persona_interactions(persona)
     return feedback
 
 def save_personas(personas):
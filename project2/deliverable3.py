@@ -1,9 +1,8 @@
 import streamlit as st
 from tinytroupe.agent import TinyPerson
 from tinytroupe.environment import TinyWorld
+from simulation import LiveWorld, append_windowed, persona_interactions, run_rounds
 import openai
-import io
-import sys
 import json
 import base64
 import uuid
@@ -15,6 +14,8 @@ OPENAI_API_KEY = st.secrets.get("OPENAI_API_KEY", "your-api-key-here")
 openai.api_key = OPENAI_API_KEY
 SAVED_PERSONAS_FILE = "personas.json"
 SAVED_CONVERSATIONS_FILE = "conversations.json"
+# Chat messages kept and shown on the Live Conversation page
+CONVERSATION_DISPLAY_LIMIT = 100
 
 # Enhanced Persona Class
 class EnhancedPersona(TinyPerson):
@@ -26,7 +27,8 @@ class EnhancedPersona(TinyPerson):
             self.define(key, value)
     
     def add_to_history(self, speaker, message):
-        self.conversation_history.append({
+        # Windowed by token budget; older messages are compacted into a summary entry
+        append_windowed(self.conversation_history, {
             "timestamp": datetime.now().isoformat(),
             "speaker": speaker,
             "message": message
@@ -44,41 +46,35 @@ class SimulationManager:
             persona.listen(prompt)
             persona.add_to_history("System", prompt)
 
-        world.run(rounds)
+        # Personas take each round's turns concurrently; delivery order stays fixed
+        run_rounds(world, rounds)
 
         feedback = {}
         for persona in personas:
-            captured_output = io.StringIO()
-            sys.stdout = captured_output
-            persona.pp_current_interactions()
-            sys.stdout = sys.__stdout__
-            feedback[persona.name] = captured_output.getvalue()
+            feedback[persona.name] = persona_interactions(persona)
             persona.add_to_history(persona.name, feedback[persona.name])
         
         return feedback
 
+    @staticmethod
+    def get_live_world(personas: List[EnhancedPersona]) -> LiveWorld:
+        """The session's conversation world, rebuilt only when the persona line-up changes."""
+        live_world = st.session_state.get("live_world")
+        if live_world is None or not live_world.is_for(personas):
+            # World names are global in TinyTroupe, so each session gets its own
+            live_world = LiveWorld(personas, name=f"Live Conversation {uuid.uuid4().hex[:8]}")
+            st.session_state.live_world = live_world
+        return live_world
+
     @staticmethod
     def run_live_conversation(personas: List[EnhancedPersona], user_input: str) -> Dict:
-        world = TinyWorld("Live Conversation", personas)
-        world.make_everyone_accessible()
+        # Only the new message is delivered; all personas answer at once
+        responses = SimulationManager.get_live_world(personas).send(user_input)
 
-        # Add user input to all personas
         for persona in personas:
-            persona.listen(f"User says: {user_input}")
             persona.add_to_history("User", user_input)
+            persona.add_to_history(persona.name, responses.get(persona.name, ""))
 
-        # Run 1 round of conversation
-        world.run(1)
-
-        responses = {}
-        for persona in personas:
-            captured_output = io.StringIO()
-            sys.stdout = captured_output
-            persona.pp_current_interactions()
-            sys.stdout = sys.__stdout__
-            responses[persona.name] = captured_output.getvalue()
-            persona.add_to_history(persona.name, responses[persona.name])
-        
         return responses
 
 # Data Persistence
@@ -151,19 +147,15 @@ def live_conversation_page():
     
     # Display conversation history
     for msg in st.session_state.conversation:
-        if msg['role'] == 'user':
-            st.chat_message("user").write(msg['content'])
-        else:
-            cols = st.columns([1, 4])
-            cols[0].write(f"{msg['name']}:")
-            cols[1].write(msg['content'])
+        show_message(msg)
     
-    # User input
+    # User input; new messages are drawn in place rather than by rerunning the page
     if prompt := st.chat_input("Type your message..."):
-        st.session_state.conversation.append({
+        new_messages = [{
             'role': 'user',
             'content': prompt
-        })
+        }]
+        show_message(new_messages[0])
         
         with st.spinner("Getting responses..."):
             responses = SimulationManager.run_live_conversation(
@@ -172,13 +164,23 @@ def live_conversation_page():
             )
         
         for name, response in responses.items():
-            st.session_state.conversation.append({
+            new_messages.append({
                 'role': 'agent',
                 'name': name,
                 'content': response
             })
+            show_message(new_messages[-1])
         
-        st.experimental_rerun()
+        conversation = st.session_state.conversation + new_messages
+        st.session_state.conversation = conversation[-CONVERSATION_DISPLAY_LIMIT:]
+
+def show_message(msg):
+    if msg['role'] == 'user':
+        st.chat_message("user").write(msg['content'])
+    else:
+        cols = st.columns([1, 4])
+        cols[0].write(f"{msg['name']}:")
+        cols[1].write(msg['content'])
 
 def persona_management_page():
     st.header("👥 Persona Management")
@@ -0,0 +1,223 @@
+import concurrent.futures
+import io
+import os
+import re
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
+
+from tinytroupe.environment import TinyWorld
+
+# Most persona turns in flight at once, across every session in the process
+# (each turn is one or more LLM calls, so the limit is really on API concurrency)
+MAX_CONCURRENT_TURNS = int(os.environ.get("SIMULATION_MAX_CONCURRENT_TURNS", "16"))
+
+# Token budgets for a persona's kept conversation history: recent messages
+# verbatim, older ones folded into a bounded summary entry
+HISTORY_TOKEN_BUDGET = 2000
+SUMMARY_TOKEN_BUDGET = 400
+SUMMARY_SPEAKER = "Summary"
+GIST_CHARACTERS = 160
+
+
+@lru_cache(maxsize=1)
+def get_turn_pool() -> concurrent.futures.ThreadPoolExecutor:
+    """Threads shared by all simulations; its size is the global concurrency limit."""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=MAX_CONCURRENT_TURNS,
+                                                 thread_name_prefix="persona-turn")
+
+
+def _take_turn(agent) -> List[Dict[str, Any]]:
+    agent.act()
+    return agent.pop_latest_actions()
+
+
+def run_rounds(world: TinyWorld, rounds: int, timedelta_per_step: Optional[timedelta] = None) -> List[List[tuple]]:
+    """
+    Replacement for world.run(rounds) that runs each round's persona turns concurrently.
+
+    TinyWorld.run lets agents act one after another, so a round takes the sum
+    of every persona's LLM latency. Here every agent in a round acts at the same
+    time on what it had heard when the round started. The round's actions are
+    then delivered (TALK messages to their targets, etc.) in the world's agent
+    order, whatever order the turns finished in. Runs are therefore
+    reproducible, and a message sent in round N is heard in round N + 1 by
+    everyone.
+
+    Args:
+        world: The world to advance.
+        rounds: Number of rounds.
+        timedelta_per_step: Simulated time advanced per round, as in TinyWorld.run.
+
+    Returns:
+        List[List[tuple]]: Per round, (agent name, actions) in agent order.
+    """
+    transcript = []
+    for _ in range(rounds):
+        if timedelta_per_step is not None:
+            world._advance_datetime(timedelta_per_step)
+        pool = get_turn_pool()
+        futures = [pool.submit(_take_turn, agent) for agent in world.agents]
+        # Wait for the whole round first, so a failure leaves no round half-delivered
+        results = [future.result() for future in futures]
+        round_actions = []
+        for agent, actions in zip(world.agents, results):
+            world._handle_actions(agent, actions)
+            round_actions.append((agent.name, actions))
+        transcript.append(round_actions)
+    return transcript
+
+
+# Output capture. TinyTroupe prints interactions to stdout; swapping sys.stdout
+# around the call would catch (or lose) other sessions' and threads' output and
+# stay swapped if the call raised. Instead sys.stdout is replaced once by a proxy
+# that writes to the current context's buffer, if one is set, else to the real
+# stdout. Context variables are per thread and per asyncio task.
+_capture_buffer: ContextVar[Optional[io.StringIO]] = ContextVar("capture_buffer", default=None)
+_install_lock = threading.Lock()
+
+# Terminal escape sequences (colours, cursor movement); see persona_interactions()
+ANSI_ESCAPE = re.compile(r"\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)|[@-Z\\-_])")
+
+
+class _ContextLocalStdout:
+    """
+    sys.stdout stand-in routing writes to the calling context's capture buffer.
+    Everything else (encoding, fileno, ...) is the real stream's.
+    """
+
+    def __init__(self, default) -> None:
+        self._default = default
+
+    def _target(self):
+        buffer = _capture_buffer.get()
+        return buffer if buffer is not None else self._default
+
+    def write(self, text: str) -> int:
+        return self._target().write(text)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def isatty(self) -> bool:
+        return self._target().isatty()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._default, name)
+
+
+@contextmanager
+def capture_stdout() -> Iterator[io.StringIO]:
+    """Collect what this thread or task prints to stdout; other threads are unaffected."""
+    with _install_lock:
+        if not isinstance(sys.stdout, _ContextLocalStdout):
+            sys.stdout = _ContextLocalStdout(sys.stdout)
+    buffer = io.StringIO()
+    token = _capture_buffer.set(buffer)
+    try:
+        yield buffer
+    finally:
+        _capture_buffer.reset(token)
+
+
+def persona_interactions(persona) -> str:
+    """
+    A persona's current interactions as plain text, as pp_current_interactions() prints them.
+
+    TinyTroupe prints through Rich, which chooses its colour system when its
+    Console is created, not per write. Colour codes are therefore stripped here.
+    """
+    with capture_stdout() as buffer:
+        persona.pp_current_interactions()
+    return ANSI_ESCAPE.sub("", buffer.getvalue())
+
+
+def action_text(actions: List[Dict[str, Any]]) -> str:
+    """What a persona said in a list of actions (the content of its TALK actions)."""
+    return "\n".join(action.get("content", "") for action in actions if action.get("type") == "TALK")
+
+
+class LiveWorld:
+    """
+    One TinyWorld kept for a whole live conversation.
+
+    The world is built and made accessible once, instead of on every message,
+    and each message is delivered to the personas' existing memory. send()
+    returns only what was said in reply to it, so the work per message does
+    not depend on how long the conversation is.
+    """
+
+    def __init__(self, personas: List[Any], name: str = "Live Conversation") -> None:
+        self.world = TinyWorld(name, personas)
+        self.world.make_everyone_accessible()
+        self.members = tuple(personas)  # The persona objects themselves; see is_for()
+
+    def is_for(self, personas: List[Any]) -> bool:
+        """
+        Whether this world talks to exactly these persona objects, in this order.
+        Compared by identity: personas rebuilt under the same names are new
+        objects, with their own memory, and need a new world.
+        """
+        return len(self.members) == len(personas) and all(a is b for a, b in zip(self.members, personas))
+
+    def send(self, message: str) -> Dict[str, str]:
+        """Deliver a user message to every persona and return each one's reply."""
+        for persona in self.world.agents:
+            persona.listen(f"User says: {message}")
+        replies = run_rounds(self.world, 1)[0]
+        return {name: action_text(actions) for name, actions in replies}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token for English text)."""
+    return len(text) // 4 + 1
+
+
+def _gist(entry: Dict[str, str]) -> str:
+    text = " ".join(entry["message"].split())
+    sentence = text.split(". ", 1)[0].rstrip(".")
+    if len(sentence) > GIST_CHARACTERS:
+        sentence = sentence[:GIST_CHARACTERS - 3] + "..."
+    return f"{entry['speaker']}: {sentence}"
+
+
+def append_windowed(history: List[Dict[str, str]], entry: Dict[str, str],
+                    token_budget: int = HISTORY_TOKEN_BUDGET, summary_budget: int = SUMMARY_TOKEN_BUDGET) -> None:
+    """
+    Append to a conversation history, keeping it within a token budget.
+
+    The newest messages are kept verbatim up to token_budget. Older ones are
+    folded, one line each, into a leading "Summary" entry that keeps its most
+    recent lines within summary_budget. The history therefore stays bounded,
+    and the cost of an append does not grow with the conversation.
+
+    Args:
+        history: Entries with "timestamp", "speaker" and "message"; modified in place.
+        entry: The entry to add.
+        token_budget: Tokens of verbatim messages to keep.
+        summary_budget: Tokens of the summary entry.
+    """
+    history.append(entry)
+    summary = history[0] if history[0]["speaker"] == SUMMARY_SPEAKER else None
+    start = 1 if summary is not None else 0
+    used = sum(estimate_tokens(item["message"]) for item in history[start:])
+    folded = []
+    while used > token_budget and len(history) - start > 1:
+        oldest = history.pop(start)
+        used -= estimate_tokens(oldest["message"])
+        folded.append(oldest)
+    if not folded:
+        return
+
+    lines = (summary["message"].splitlines() if summary is not None else []) + [_gist(item) for item in folded]
+    while len(lines) > 1 and estimate_tokens("\n".join(lines)) > summary_budget:
+        lines.pop(0)
+    compacted = {"timestamp": folded[-1]["timestamp"], "speaker": SUMMARY_SPEAKER, "message": "\n".join(lines)}
+    if summary is not None:
+        history[0] = compacted
+    else:
+        history.insert(0, compacted)
@@ -1,8 +1,13 @@
 import streamlit as st
 import pandas as pd
 import requests
-import base64
-from main import summarize_and_visualize_data  # make sure this is imported correctly
+from ingest import read_csv_typed
+from render import IMAGE_FORMATS, render_charts_by_id
+from schema import file_digest
+from main import cached_summary, summarize_and_visualize_data, summarize_csv_stream  # make sure this is imported correctly
+
+# Charts shown before the user picks others; the rest are only drawn on request
+DEFAULT_VISIBLE_CHARTS = 6
 
 st.set_page_config(page_title="Smart EDA Visualizer", layout="wide", page_icon="📊")
 
@@ -19,33 +24,49 @@ st.sidebar.title("📁 Upload & Configure")
 uploaded_file = st.sidebar.file_uploader("Upload a CSV file", type=["csv"])
 
 if uploaded_file is not None:
-    df = pd.read_csv(uploaded_file)
+    use_stream = st.sidebar.checkbox("Stream the whole file (for files larger than memory)")
+    image_format = st.sidebar.selectbox("Chart format", list(IMAGE_FORMATS), index=list(IMAGE_FORMATS).index("webp"))
     st.sidebar.success("File successfully uploaded")
-    
-    use_sample = st.sidebar.checkbox("Use only first 100 rows (for large files)")
-    if use_sample and len(df) > 100:
-        df = df.head(100)
-
-    payload = {"data": df.to_dict(orient="records")}
-    secrets = {}  
-    event_stream = []
+    # Re-uploads of the same file reuse the inferred column types
+    source_hash = file_digest(uploaded_file)
 
     st.title("📊 Exploratory Data Analysis Summary")
     st.write("Upload a dataset to get descriptive statistics and smart visualizations.")
 
-    result = summarize_and_visualize_data(payload, secrets, event_stream)
+    # Reruns (any widget change) with the same file and options are served from the cache
+    # Only the chart manifest is computed here; images are drawn when displayed
+    result = cached_summary(source_hash, "stream" if use_stream else "exact", inline_charts=False)
+    if result is None and use_stream:
+        # Every row is read in chunks into sketches; memory stays bounded
+        result = summarize_csv_stream(uploaded_file, source_hash=source_hash, inline_charts=False)
+    elif result is None:
+        # Chunked, typed parse; pass the DataFrame itself rather than a list of records
+        df = read_csv_typed(uploaded_file)
+        payload = {"data": df, "source_hash": source_hash, "inline_charts": False}
+        secrets = {}
+        event_stream = []
+        result = summarize_and_visualize_data(payload, secrets, event_stream)
 
     if result["status"] == "success":
         st.subheader(" Descriptive Statistics")
+        if result.get("approximate"):
+            st.caption(f"Streamed {result['rows']:,} rows; quantiles and distinct counts are approximate.")
         desc_df = pd.DataFrame(result["description"])
         st.dataframe(desc_df.T)
 
-        if result["visualizations"]:
+        charts = {chart["column"]: chart for chart in result["charts"]}
+        if charts:
             st.subheader("📉 Visualizations")
-            for viz in result["visualizations"]:
-                st.markdown(f"<div class='plot-title'>🔹 {viz['column']}</div>", unsafe_allow_html=True)
-                img_bytes = base64.b64decode(viz["plot"])
-                st.image(img_bytes, use_column_width=True)
+            visible = st.multiselect("Charts", list(charts), default=list(charts)[:DEFAULT_VISIBLE_CHARTS])
+            # Charts not drawn yet are rendered together, across the process pool
+            images = render_charts_by_id([charts[column]["id"] for column in visible], image_format)
+            for column, image in zip(visible, images):
+                st.markdown(f"<div class='plot-title'>🔹 {column}</div>", unsafe_allow_html=True)
+                if image is None:
+                    st.error("This chart could not be drawn. Upload the file again to recompute it.")
+                    continue
+                # st.image takes SVG as markup text
+                st.image(image.decode("utf-8") if image_format == "svg" else image, use_column_width=True)
         else:
             st.warning("No visualizations could be generated.")
 
@@ -0,0 +1,111 @@
+from typing import Any, BinaryIO, Iterator, Optional, Union
+import pandas as pd
+
+# Bytes of CSV text parsed per chunk
+DEFAULT_BLOCK_SIZE = 4 << 20
+
+CsvSource = Union[str, BinaryIO]
+
+
+def read_csv_typed(source: CsvSource, max_rows: Optional[int] = None, block_size: int = DEFAULT_BLOCK_SIZE) -> pd.DataFrame:
+    """
+    Read a CSV in chunks into a typed DataFrame, keeping memory near one copy of the data.
+
+    With pyarrow (installed with Streamlit) the file is parsed block by block into
+    typed Arrow batches. Repetitive text columns are dictionary-encoded and become
+    pandas categoricals. The batches are combined without copying and handed to
+    pandas with self_destruct, which frees each Arrow column as it is converted.
+    Without pyarrow, or if a later block contradicts the types inferred from the
+    first one, pandas' chunked reader is used instead.
+
+    Args:
+        source: Path or binary file object (e.g. a Streamlit UploadedFile).
+        max_rows: Stop after this many rows; only those rows are parsed.
+        block_size: Approximate bytes of CSV per chunk.
+
+    Returns:
+        pd.DataFrame: The parsed data.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return _read_csv_pandas(source, max_rows, block_size)
+
+    start = source.tell() if hasattr(source, "tell") else None
+    try:
+        reader = pacsv.open_csv(
+            source,
+            read_options=pacsv.ReadOptions(block_size=block_size),
+            convert_options=pacsv.ConvertOptions(auto_dict_encode=True),
+        )
+        batches = []
+        rows = 0
+        for batch in reader:
+            if max_rows is not None and rows + batch.num_rows >= max_rows:
+                batches.append(batch.slice(0, max_rows - rows))
+                break
+            batches.append(batch)
+            rows += batch.num_rows
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+    except pa.ArrowInvalid:
+        # Types inferred from the first block did not hold for a later one
+        if start is not None:
+            source.seek(start)
+        return _read_csv_pandas(source, max_rows, block_size)
+
+    del batches
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+
+def _read_csv_pandas(source: CsvSource, max_rows: Optional[int], block_size: int) -> pd.DataFrame:
+    """Fallback reader: pandas' C parser, chunk by chunk."""
+    chunks = pd.read_csv(source, nrows=max_rows, chunksize=max(1, block_size // 256))
+    return pd.concat(chunks, ignore_index=True)
+
+
+def iter_csv_chunks(source: CsvSource, block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Yield a CSV as DataFrame chunks of about block_size bytes each, never holding the whole file.
+
+    Uses the same typed pyarrow reader as read_csv_typed(). If a later block
+    contradicts the inferred types, reading continues with pandas from the first
+    row not yet yielded (this needs a seekable source).
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        yield from pd.read_csv(source, chunksize=max(1, block_size // 256))
+        return
+
+    start = source.tell() if hasattr(source, "tell") else None
+    rows = 0
+    try:
+        reader = pacsv.open_csv(
+            source,
+            read_options=pacsv.ReadOptions(block_size=block_size),
+            convert_options=pacsv.ConvertOptions(auto_dict_encode=True),
+        )
+        for batch in reader:
+            rows += batch.num_rows
+            yield batch.to_pandas(split_blocks=True)
+    except pa.ArrowInvalid:
+        if start is None:
+            raise
+        source.seek(start)
+        yield from pd.read_csv(source, skiprows=range(1, rows + 1), chunksize=max(1, block_size // 256))
+
+
+def to_dataframe(data: Any) -> pd.DataFrame:
+    """
+    Accept a DataFrame, a pyarrow Table or list-of-dict records as payload data.
+
+    DataFrames are used as they are, so callers that already hold one skip the
+    records round trip.
+    """
+    if isinstance(data, pd.DataFrame):
+        return data
+    if hasattr(data, "to_pandas"):
+        return data.to_pandas()
+    return pd.DataFrame(data)
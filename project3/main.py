@@ -1,9 +1,11 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import io
 import base64
+from ingest import DEFAULT_BLOCK_SIZE, CsvSource, iter_csv_chunks, to_dataframe
+from profiling import describe_from_profile, profile_chunks, profile_dataframe
+from render import chart_manifest, chart_specs, render_charts_cached
+from result_cache import frame_digest, get_result, put_result, result_key
+from schema import apply_schema, cached_schema, file_digest
 
 # Decorator 
 def register_function(name: str):
@@ -16,80 +18,111 @@ def register_function(name: str):
 def summarize_and_visualize_data(payload: Dict[str, Any], secrets: Dict[str, str], event_stream: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Accepts a dataset and returns basic descriptive statistics and visualizations.
+
+    payload["data"] may be list-of-dict records, a DataFrame or a pyarrow Table;
+    DataFrames are analysed without being converted to records and back.
+    An optional payload["source_hash"] (e.g. schema.file_digest() of the uploaded
+    file) lets the inferred column types be reused when the same file is sent again.
+
+    The result always lists the available charts under "charts" (id, column,
+    kind). With payload["inline_charts"] set to False no image is drawn up front;
+    fetch the ones needed with render.render_chart_by_id(id, "png" | "webp" | "svg").
     """
     try:
-        df = pd.DataFrame(payload.get("data"))
+        return summarize_dataframe(to_dataframe(payload.get("data")), payload.get("source_hash"),
+                                   payload.get("inline_charts", True))
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+
+def summarize_dataframe(df: pd.DataFrame, source_hash: Optional[str] = None, inline_charts: bool = True) -> Dict[str, Any]:
+    """
+    DataFrame-native entry point of summarize_and_visualize_data.
+    The caller's DataFrame is not modified. Results are cached by source_hash,
+    or by a hash of the DataFrame's contents when none is given.
+    """
+    try:
+        df = df.copy(deep=False)
 
         if df.empty:
             return {"status": "error", "message": "Dataset is empty"}
 
-        # Convert object columns that are likely dates
-        for col in df.select_dtypes(include=["object"]):
-            try:
-                df[col] = pd.to_datetime(df[col], errors='ignore')
-            except Exception:
-                continue
-
-        # Get descriptive stats
-        description = df.describe(include="all").fillna("").to_dict()
-
-        visualizations = []
-
-        # Correlation Matrix
-        numeric_cols = df.select_dtypes(include=["number"])
-        if numeric_cols.shape[1] >= 2:
-            fig, ax = plt.subplots()
-            sns.heatmap(numeric_cols.corr(), annot=True, cmap="coolwarm", ax=ax)
-            ax.set_title("Correlation Matrix")
-            buf = io.BytesIO()
-            plt.tight_layout()
-            plt.savefig(buf, format="png")
-            buf.seek(0)
-            img_base64 = base64.b64encode(buf.read()).decode("utf-8")
-            visualizations.append({
-                "column": "Correlation Matrix",
-                "plot": img_base64
-            })
-            plt.close(fig)
-
-        # Prepare plots for each column
-        for column in df.columns:
-            fig, ax = plt.subplots()
-            try:
-                if pd.api.types.is_numeric_dtype(df[column]):
-                    sns.histplot(df[column].dropna(), kde=True, ax=ax)
-                    ax.set_title(f"Histogram of {column}")
-                    ax.set_xlabel(column)
-                elif pd.api.types.is_categorical_dtype(df[column]) or df[column].dtype == object:
-                    df[column].value_counts().plot(kind="bar", ax=ax)
-                    ax.set_title(f"Bar Chart of {column}")
-                    ax.set_xlabel(column)
-                elif pd.api.types.is_datetime64_any_dtype(df[column]):
-                    df[column].value_counts().sort_index().plot(ax=ax)
-                    ax.set_title(f"Time Series of {column}")
-                    ax.set_xlabel(column)
-                else:
-                    continue  # Skip unsupported types
-
-                buf = io.BytesIO()
-                plt.tight_layout()
-                plt.savefig(buf, format="png")
-                buf.seek(0)
-                img_base64 = base64.b64encode(buf.read()).decode("utf-8")
-                visualizations.append({
-                    "column": column,
-                    "plot": img_base64
-                })
-            except Exception:
-                plt.close(fig)
-                continue
-            plt.close(fig)
-
-        return {
-            "status": "success",
-            "description": description,
-            "visualizations": visualizations
-        }
+        key = result_key(source_hash or frame_digest(df), mode="exact", inline_charts=inline_charts)
+        cached = get_result(key)
+        if cached is not None:
+            return cached
+
+        # Parse text columns that a sample shows to be dates, with the detected format
+        df = apply_schema(df, cached_schema(df, source_hash))
+
+        # One profiling pass provides the statistics and the chart aggregates
+        result, specs = _summarize_profile(profile_dataframe(df), inline_charts)
+
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+    # Outside the error path: a cache that cannot be written does not fail the analysis
+    put_result(key, result, specs)
+    return result
 
+
+def summarize_csv_stream(source: CsvSource, block_size: int = DEFAULT_BLOCK_SIZE,
+                         source_hash: Optional[str] = None, inline_charts: bool = True) -> Dict[str, Any]:
+    """
+    Streaming variant for CSVs larger than memory: every row is read, chunk by
+    chunk, into mergeable sketches. Statistics are approximate where noted in
+    profiling.profile_chunks().
+    """
+    try:
+        source_hash = source_hash or file_digest(source)
+        key = result_key(source_hash, mode="stream", block_size=block_size, inline_charts=inline_charts)
+        cached = get_result(key)
+        if cached is not None:
+            return cached
+
+        profile = profile_chunks(iter_csv_chunks(source, block_size), schema_key=source_hash)
+        if not profile["rows"]:
+            return {"status": "error", "message": "Dataset is empty"}
+        result, specs = _summarize_profile(profile, inline_charts)
     except Exception as e:
         return {"status": "error", "message": str(e)}
+    put_result(key, result, specs)
+    return result
+
+
+def cached_summary(source_hash: str, mode: str = "exact", block_size: int = DEFAULT_BLOCK_SIZE,
+                   inline_charts: bool = True) -> Optional[Dict[str, Any]]:
+    """The cached result for a file, if any, without reading it ("exact" or "stream" mode)."""
+    options = {"mode": mode, "block_size": block_size} if mode == "stream" else {"mode": mode}
+    return get_result(result_key(source_hash, inline_charts=inline_charts, **options))
+
+
+def summarize_profile(profile: Dict[str, Any], inline_charts: bool = True) -> Dict[str, Any]:
+    """
+    Descriptive statistics and the chart manifest for a profile from profiling.py,
+    plus every chart as base64 PNG under "visualizations" when inline_charts is set.
+    """
+    return _summarize_profile(profile, inline_charts)[0]
+
+
+def _summarize_profile(profile: Dict[str, Any], inline_charts: bool) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """summarize_profile(), plus the chart specs behind the manifest (cached with the result)."""
+    description = describe_from_profile(profile)
+    specs = chart_specs(profile)
+
+    result = {
+        "status": "success",
+        "description": description,
+        "charts": chart_manifest(specs),
+        "rows": profile["rows"],
+        "approximate": profile.get("approximate", False),
+    }
+    if inline_charts:
+        # Charts are drawn with the Figure API in worker processes, returned in column order;
+        # charts whose aggregates are unchanged come from the cache
+        result["visualizations"] = [
+            {"column": spec["column"], "plot": base64.b64encode(png).decode("utf-8")}
+            for spec, png in zip(specs, render_charts_cached(specs))
+            if png is not None
+        ]
+    return result, specs
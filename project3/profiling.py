@@ -0,0 +1,334 @@
+import math
+import warnings
+from typing import Any, Dict, Iterable, List, Optional
+import numpy as np
+import pandas as pd
+from schema import apply_schema, cached_schema
+from sketches import HyperLogLog, KLLSketch, MomentSketch, SpaceSaving
+
+# Quantiles reported for numeric and datetime columns (as in DataFrame.describe)
+QUANTILES = [0.0, 0.25, 0.5, 0.75, 1.0]
+MAX_HISTOGRAM_BINS = 200
+DESCRIBE_ROWS = ["count", "unique", "top", "freq", "mean", "std", "min", "25%", "50%", "75%", "max"]
+
+
+def profile_dataframe(df: pd.DataFrame, top_k: int = 50, kde_points: int = 256) -> Dict[str, Any]:
+    """
+    Profile every column of a DataFrame in one pass per column block.
+
+    Numeric columns are handled together as one float matrix: counts, nulls,
+    moments and quantiles are computed column-wise on it, and the pairwise
+    correlation comes from a few matrix products over the same block.
+    Histogram bins and a binned KDE curve are computed here as well, so the
+    renderers never rescan the data. Other columns get one value_counts each,
+    which yields uniques, top values and top-k counts together.
+
+    Args:
+        df: Data to profile.
+        top_k: Category counts kept per column for bar charts.
+        kde_points: Resolution of the precomputed KDE curve.
+
+    Returns:
+        Dict with "rows", "columns" (name -> column profile, in column order) and
+        "correlation" (DataFrame, or None with fewer than two numeric columns).
+    """
+    columns: Dict[str, Dict[str, Any]] = {}
+    numeric = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c]) and not pd.api.types.is_bool_dtype(df[c])]
+    numeric_profiles = _profile_numeric_block(df[numeric], kde_points) if numeric else {}
+
+    for column in df.columns:
+        if column in numeric_profiles:
+            columns[column] = numeric_profiles[column]
+        elif pd.api.types.is_datetime64_any_dtype(df[column]):
+            columns[column] = _profile_datetime(df[column])
+        else:
+            columns[column] = _profile_categorical(df[column], top_k)
+
+    correlation = numeric_profiles.pop("__correlation__", None) if numeric_profiles else None
+    return {"rows": len(df), "columns": columns, "correlation": correlation}
+
+
+def _profile_numeric_block(block: pd.DataFrame, kde_points: int) -> Dict[str, Any]:
+    values = block.to_numpy(dtype=np.float64, na_value=np.nan)
+    present = ~np.isnan(values)
+    counts = present.sum(axis=0)
+    with warnings.catch_warnings(), np.errstate(invalid="ignore", divide="ignore"):
+        warnings.simplefilter("ignore", RuntimeWarning)
+        means = np.where(present, values, 0.0).sum(axis=0) / counts
+        centered = np.where(present, values - means, 0.0)
+        stds = np.where(counts >= 2, np.sqrt((centered * centered).sum(axis=0) / (counts - 1)), np.nan)
+        quantiles = np.nanquantile(values, QUANTILES, axis=0)
+
+        # Pairwise-complete Pearson correlation (what DataFrame.corr computes), from
+        # sums over the rows where both columns are present. Centring first keeps
+        # the sums small and the subtraction below numerically stable.
+        mask = present.astype(np.float64)
+        n = mask.T @ mask
+        sum_x = centered.T @ mask
+        sum_xx = (centered * centered).T @ mask
+        sum_xy = centered.T @ centered
+        covariance = n * sum_xy - sum_x * sum_x.T
+        variance = (n * sum_xx - sum_x * sum_x) * (n * sum_xx - sum_x * sum_x).T
+        correlation = covariance / np.sqrt(variance)
+        correlation[n < 2] = np.nan
+        np.fill_diagonal(correlation, np.where(counts >= 2, 1.0, np.nan))
+
+    profiles: Dict[str, Any] = {}
+    for index, column in enumerate(block.columns):
+        column_values = values[present[:, index], index]
+        q = quantiles[:, index]
+        profile = {
+            "kind": "numeric",
+            "count": int(counts[index]),
+            "nulls": int(len(values) - counts[index]),
+            "mean": float(means[index]),
+            "std": float(stds[index]),
+            "quantiles": dict(zip(QUANTILES, q.tolist())),
+        }
+        profile.update(_histogram(column_values, q[0], q[1], q[3], q[4], stds[index], kde_points))
+        profiles[column] = profile
+    if len(block.columns) >= 2:
+        profiles["__correlation__"] = pd.DataFrame(correlation, index=block.columns, columns=block.columns)
+    return profiles
+
+
+def _histogram(values: np.ndarray, low: float, q25: float, q75: float, high: float,
+               std: float, kde_points: int, weights: Optional[np.ndarray] = None) -> Dict[str, Any]:
+    """
+    Histogram with numpy's "auto" bin rule and a binned Gaussian KDE scaled to counts.
+    With weights, each value stands for that many rows (sketch samples).
+    """
+    n = int(round(weights.sum())) if weights is not None else len(values)
+    if n == 0:
+        return {"edges": None, "counts": None, "kde_x": None, "kde_y": None}
+    span = high - low
+    if span == 0:
+        edges = np.array([low - 0.5, high + 0.5])
+    else:
+        # numpy "auto": the smaller of the Sturges and Freedman-Diaconis bin widths
+        width = span / (math.log2(n) + 1)
+        fd_width = 2.0 * (q75 - q25) * n ** (-1 / 3)
+        if fd_width > 0:
+            width = min(width, fd_width)
+        bins = int(min(MAX_HISTOGRAM_BINS, max(1, math.ceil(span / width))))
+        edges = np.linspace(low, high, bins + 1)
+    counts, edges = np.histogram(values, bins=edges, weights=weights)
+    counts = np.rint(counts).astype(np.int64)
+
+    kde_x = kde_y = None
+    bandwidth = std * n ** (-1 / 5) if n > 1 and std > 0 else 0.0  # Scott's rule
+    if bandwidth > 0:
+        grid = np.linspace(low - 3 * bandwidth, high + 3 * bandwidth, kde_points)
+        step = grid[1] - grid[0]
+        fine_counts, _ = np.histogram(values, bins=np.append(grid - step / 2, grid[-1] + step / 2), weights=weights)
+        offsets = np.arange(-(kde_points - 1), kde_points) * step
+        kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+        density = np.convolve(fine_counts, kernel, mode="valid") / (n * bandwidth * math.sqrt(2 * math.pi))
+        kde_x = grid
+        kde_y = density * n * (edges[1] - edges[0])  # Same scale as the bar heights
+    return {"edges": edges, "counts": counts, "kde_x": kde_x, "kde_y": kde_y}
+
+
+def _profile_categorical(series: pd.Series, top_k: int) -> Dict[str, Any]:
+    value_counts = series.value_counts(dropna=True)
+    value_counts = value_counts[value_counts > 0]  # Categoricals list unused categories too
+    count = int(value_counts.sum())
+    return {
+        "kind": "categorical",
+        "count": count,
+        "nulls": int(len(series) - count),
+        "unique": int(len(value_counts)),
+        "top": value_counts.index[0] if len(value_counts) else None,
+        "freq": int(value_counts.iloc[0]) if len(value_counts) else None,
+        "top_counts": value_counts.head(top_k),
+    }
+
+
+def _profile_datetime(series: pd.Series) -> Dict[str, Any]:
+    present = series.dropna()
+    value_counts = present.value_counts().sort_index()
+    return {
+        "kind": "datetime",
+        "count": int(len(present)),
+        "nulls": int(len(series) - len(present)),
+        "mean": present.mean() if len(present) else None,
+        "quantiles": dict(zip(QUANTILES, present.quantile(QUANTILES).tolist())) if len(present) else {},
+        "time_counts": value_counts,
+    }
+
+
+def profile_chunks(chunks: Iterable[pd.DataFrame], top_k: int = 50, kde_points: int = 256,
+                   kll_k: int = 200, heavy_hitters: int = 1000, schema_key: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Profile a stream of DataFrame chunks in bounded memory, covering every row.
+
+    Returns the same structure as profile_dataframe(), plus "approximate": True.
+    Counts, nulls, means, standard deviations, min/max and correlations are exact
+    (up to float rounding); quantiles and histograms come from a KLL sketch per
+    column, distinct counts from HyperLogLog once a column has more than
+    heavy_hitters distinct values, and top categories from Space-Saving.
+    Column kinds are fixed by the first chunk; later values that do not parse
+    as that kind are counted as nulls. Date columns stored as text are detected
+    on the first chunk (see schema.py) and parsed in every chunk.
+
+    Args:
+        chunks: DataFrames with the same columns, e.g. from ingest.iter_csv_chunks().
+        top_k: Category counts kept per column for bar charts.
+        kde_points: Resolution of the KDE curve.
+        kll_k: KLL accuracy parameter (rank error about 1.7 / kll_k).
+        heavy_hitters: Counters kept per categorical column.
+        schema_key: Cache key for the inferred schema, e.g. the file's digest.
+    """
+    rows = 0
+    kinds: Dict[str, str] = {}
+    numeric: List[str] = []
+    moments: Optional[MomentSketch] = None
+    quantiles: Dict[str, KLLSketch] = {}
+    distinct: Dict[str, HyperLogLog] = {}
+    frequent: Dict[str, SpaceSaving] = {}
+    nulls: Dict[str, int] = {}
+    times: Dict[str, Dict[str, Any]] = {}
+    schema: Optional[Dict[str, str]] = None
+
+    for chunk in chunks:
+        if schema is None:
+            schema = cached_schema(chunk, schema_key)
+        chunk = apply_schema(chunk, schema)
+        if not kinds:
+            for column in chunk.columns:
+                series = chunk[column]
+                if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                    kinds[column] = "numeric"
+                elif pd.api.types.is_datetime64_any_dtype(series):
+                    kinds[column] = "datetime"
+                else:
+                    kinds[column] = "categorical"
+                nulls[column] = 0
+            numeric = [c for c in chunk.columns if kinds[c] == "numeric"]
+            moments = MomentSketch(numeric)
+            quantiles = {c: KLLSketch(kll_k) for c in numeric}
+            distinct = {c: HyperLogLog() for c in kinds if kinds[c] == "categorical"}
+            frequent = {c: SpaceSaving(heavy_hitters) for c in distinct}
+            times = {c: {"count": 0, "origin": None, "seconds": 0.0, "quantiles": KLLSketch(kll_k),
+                         "counts": pd.Series(dtype=np.int64)} for c in kinds if kinds[c] == "datetime"}
+        rows += len(chunk)
+
+        if numeric:
+            values = np.column_stack([
+                pd.to_numeric(chunk[c], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+                for c in numeric
+            ])
+            moments.update(values)
+            for index, column in enumerate(numeric):
+                quantiles[column].update(values[:, index])
+        for column, sketch in distinct.items():
+            series = chunk[column]
+            nulls[column] += int(series.isna().sum())
+            sketch.update(series)
+            frequent[column].update(series)
+        for column, state in times.items():
+            _update_datetime(state, chunk[column])
+
+    columns: Dict[str, Dict[str, Any]] = {}
+    numeric_index = {column: index for index, column in enumerate(numeric)}
+    for column, kind in kinds.items():
+        if kind == "numeric":
+            index = numeric_index[column]
+            sketch = quantiles[column]
+            count = int(moments.count[index])
+            q = sketch.quantiles(QUANTILES)
+            std = float(moments.stds[index])
+            profile = {
+                "kind": "numeric",
+                "count": count,
+                "nulls": rows - count,
+                "mean": float(moments.means[index]),
+                "std": std,
+                "quantiles": dict(zip(QUANTILES, q)),
+            }
+            items, weights = sketch.weighted_items()
+            profile.update(_histogram(items, q[0], q[1], q[3], q[4], std, kde_points, weights))
+            columns[column] = profile
+        elif kind == "datetime":
+            columns[column] = _datetime_from_state(times[column], rows)
+        else:
+            sketch = frequent[column]
+            top_counts = sketch.top(top_k)
+            count = rows - nulls[column]
+            unique = round(distinct[column].estimate()) if sketch.truncated else len(sketch.counts)
+            columns[column] = {
+                "kind": "categorical",
+                "count": count,
+                "nulls": nulls[column],
+                "unique": int(unique),
+                "top": top_counts.index[0] if len(top_counts) else None,
+                "freq": int(top_counts.iloc[0]) if len(top_counts) else None,
+                "top_counts": top_counts,
+            }
+
+    correlation = None
+    if len(numeric) >= 2:
+        correlation = pd.DataFrame(moments.correlation(), index=numeric, columns=numeric)
+    return {"rows": rows, "columns": columns, "correlation": correlation, "approximate": True}
+
+
+def _update_datetime(state: Dict[str, Any], series: pd.Series) -> None:
+    series = pd.to_datetime(series, errors="coerce")
+    if getattr(series.dt, "tz", None) is not None:
+        series = series.dt.tz_convert(None)
+    present = series.dropna()
+    if not len(present):
+        return
+    nanoseconds = present.astype("datetime64[ns]").to_numpy().view(np.int64)
+    if state["origin"] is None:
+        state["origin"] = int(nanoseconds[0])
+    state["count"] += len(nanoseconds)
+    state["seconds"] += float(((nanoseconds - state["origin"]) / 1e9).sum())
+    state["quantiles"].update(nanoseconds.astype(np.float64))
+    # Daily counts: bounded by the date range rather than the row count
+    state["counts"] = state["counts"].add(present.dt.floor("D").value_counts(), fill_value=0)
+
+
+def _datetime_from_state(state: Dict[str, Any], rows: int) -> Dict[str, Any]:
+    count = state["count"]
+    if not count:
+        return {"kind": "datetime", "count": 0, "nulls": rows, "mean": None, "quantiles": {},
+                "time_counts": state["counts"]}
+    return {
+        "kind": "datetime",
+        "count": count,
+        "nulls": rows - count,
+        "mean": pd.Timestamp(round(state["origin"] + state["seconds"] / count * 1e9)),
+        "quantiles": {q: pd.Timestamp(round(v)) for q, v in zip(QUANTILES, state["quantiles"].quantiles(QUANTILES))},
+        "time_counts": state["counts"].sort_index().astype(np.int64),
+    }
+
+
+def describe_from_profile(profile: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """The profile in the shape of df.describe(include="all").fillna("").to_dict()."""
+    description: Dict[str, Dict[str, Any]] = {}
+    used_rows: List[str] = []
+    for column, stats in profile["columns"].items():
+        row: Dict[str, Any] = {"count": float(stats["count"])}
+        if stats["kind"] == "categorical":
+            row.update(unique=stats["unique"], top=stats["top"], freq=stats["freq"])
+        else:
+            row["mean"] = stats["mean"]
+            if stats["kind"] == "numeric":
+                row["std"] = stats["std"]
+            quantiles = stats["quantiles"]
+            if quantiles:
+                row.update({"min": quantiles[0.0], "25%": quantiles[0.25], "50%": quantiles[0.5],
+                            "75%": quantiles[0.75], "max": quantiles[1.0]})
+        description[column] = row
+        used_rows.extend(key for key in row if key not in used_rows)
+
+    rows = [name for name in DESCRIBE_ROWS if name in used_rows]
+    return {
+        column: {name: ("" if row.get(name) is None or _is_nan(row.get(name)) else row[name]) for name in rows}
+        for column, row in description.items()
+    }
+
+
+def _is_nan(value: Any) -> bool:
+    return isinstance(value, float) and math.isnan(value)
@@ -0,0 +1,268 @@
+import argparse
+import ast
+import concurrent.futures
+import importlib
+import json
+import os
+import re
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+# Routes requests to the functions marked with @register_function, using the
+# trigger words and sample payloads declared in metadata.json. Discovery reads
+# the source files with ast, so no handler module (pandas, matplotlib, ...) is
+# imported until a request for it arrives.
+#
+#   python registry.py --list
+#   python registry.py "please summarize data" --sample
+
+REGISTRY_DIR = os.path.dirname(os.path.abspath(__file__))
+METADATA_PATH = os.path.join(REGISTRY_DIR, "metadata.json")
+DEFAULT_WORKERS = 4
+DECORATOR_NAME = "register_function"
+
+Handler = Callable[[Dict[str, Any], Dict[str, str], List[Dict[str, Any]]], Dict[str, Any]]
+
+
+def normalize_phrase(text: str) -> str:
+    """Lower-case words separated by single spaces, punctuation removed."""
+    return " ".join(re.findall(r"[a-z0-9]+", text.lower()))
+
+
+def discover_functions(directory: str = REGISTRY_DIR) -> Dict[str, str]:
+    """
+    Find @register_function("name") definitions in a directory's modules without importing them.
+
+    Returns:
+        Dict[str, str]: Registered name -> "module:function".
+    """
+    found = {}
+    for file_name in sorted(os.listdir(directory)):
+        if not file_name.endswith(".py"):
+            continue
+        with open(os.path.join(directory, file_name), encoding="utf-8") as f:
+            source = f.read()
+        if DECORATOR_NAME not in source:
+            continue  # Cheap check before parsing
+        for node in ast.walk(ast.parse(source, filename=file_name)):
+            if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            for decorator in node.decorator_list:
+                if (isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Name)
+                        and decorator.func.id == DECORATOR_NAME and decorator.args
+                        and isinstance(decorator.args[0], ast.Constant)):
+                    found[decorator.args[0].value] = f"{file_name[:-3]}:{node.name}"
+    return found
+
+
+def payload_schema(sample: Any) -> Any:
+    """
+    Expected shape of a payload, derived from its sample: dicts require their
+    keys, lists of records accept DataFrame-like tables too, scalars their type.
+    """
+    if isinstance(sample, dict):
+        return {key: payload_schema(value) for key, value in sample.items()}
+    if isinstance(sample, list):
+        if sample and all(isinstance(item, dict) for item in sample):
+            return "records"
+        return "list"
+    if isinstance(sample, bool):
+        return "bool"
+    if isinstance(sample, (int, float)):
+        return "number"
+    if isinstance(sample, str):
+        return "str"
+    return "any"
+
+
+def validate_payload(payload: Any, schema: Any, path: str = "payload") -> List[str]:
+    """Problems with a payload (empty if valid). Keys not in the schema are allowed."""
+    if schema == "any" or schema is None:
+        return []
+    if isinstance(schema, dict):
+        if not isinstance(payload, dict):
+            return [f"{path} must be an object"]
+        errors = []
+        for key, expected in schema.items():
+            if key not in payload:
+                errors.append(f"{path}.{key} is required")
+            else:
+                errors.extend(validate_payload(payload[key], expected, f"{path}.{key}"))
+        return errors
+    if schema == "records":
+        if isinstance(payload, list) and all(isinstance(item, dict) for item in payload):
+            return []
+        if hasattr(payload, "columns") or hasattr(payload, "to_pandas"):  # DataFrame or Arrow table
+            return []
+        return [f"{path} must be a list of records or a table"]
+    if schema == "list":
+        return [] if isinstance(payload, list) else [f"{path} must be a list"]
+    if schema == "bool":
+        return [] if isinstance(payload, bool) else [f"{path} must be a boolean"]
+    if schema == "number":
+        ok = isinstance(payload, (int, float)) and not isinstance(payload, bool)
+        return [] if ok else [f"{path} must be a number"]
+    if schema == "str":
+        return [] if isinstance(payload, str) else [f"{path} must be a string"]
+    return []
+
+
+class RegisteredFunction:
+    """One routable function: where it lives, how it is triggered, what it accepts."""
+
+    def __init__(self, name: str, target: str, metadata: Dict[str, Any]) -> None:
+        self.name = name
+        self.target = target
+        self.trigger_words: List[str] = list(metadata.get("trigger_word") or [])
+        self.sample_payload = metadata.get("sample_payload")
+        self.prerequisite: Optional[str] = metadata.get("prerequisite")
+        self.schema = payload_schema(self.sample_payload) if self.sample_payload is not None else None
+        self._handler: Optional[Handler] = None
+        self._lock = threading.Lock()
+
+    @property
+    def handler(self) -> Handler:
+        """The function itself, imported on first use."""
+        if self._handler is None:
+            with self._lock:
+                if self._handler is None:
+                    module_name, attribute = self.target.split(":")
+                    if REGISTRY_DIR not in sys.path:
+                        sys.path.insert(0, REGISTRY_DIR)  # Modules import each other by bare name
+                    self._handler = getattr(importlib.import_module(module_name), attribute)
+        return self._handler
+
+    def describe(self) -> Dict[str, Any]:
+        return {"name": self.name, "target": self.target, "trigger_words": self.trigger_words,
+                "prerequisite": self.prerequisite, "loaded": self._handler is not None}
+
+
+class FunctionRegistry:
+    """Trigger-word dispatch of registered functions onto a worker pool."""
+
+    def __init__(self, directory: str = REGISTRY_DIR, metadata_path: str = METADATA_PATH,
+                 max_workers: int = DEFAULT_WORKERS) -> None:
+        """
+        Args:
+            directory: Modules scanned for @register_function.
+            metadata_path: JSON of trigger words, sample payloads and prerequisites per function.
+            max_workers: Handler threads. Handlers spend most of their time in
+                pandas/NumPy and the chart process pool, which release the GIL.
+        """
+        with open(metadata_path, encoding="utf-8") as f:
+            metadata = json.load(f)
+        self.functions: Dict[str, RegisteredFunction] = {
+            name: RegisteredFunction(name, target, metadata.get(name, {}))
+            for name, target in discover_functions(directory).items()
+        }
+        # Normalised trigger phrase -> function name; phrase lengths bound the n-gram scan
+        self.triggers: Dict[str, str] = {}
+        for function in self.functions.values():
+            for phrase in function.trigger_words:
+                self.triggers[normalize_phrase(phrase)] = function.name
+        self._phrase_lengths = sorted({len(phrase.split()) for phrase in self.triggers}, reverse=True)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers,
+                                                               thread_name_prefix="registry")
+
+    def match(self, text: str) -> Optional[str]:
+        """
+        Function whose trigger phrase appears in the text, or None.
+
+        Every word window of each trigger-phrase length is looked up in the
+        index, so the cost depends on the text length, not the number of
+        functions. Longer phrases win.
+        """
+        words = normalize_phrase(text).split()
+        for length in self._phrase_lengths:
+            for start in range(len(words) - length + 1):
+                name = self.triggers.get(" ".join(words[start:start + length]))
+                if name is not None:
+                    return name
+        return None
+
+    def validate(self, name: str, payload: Dict[str, Any]) -> List[str]:
+        function = self.functions[name]
+        return validate_payload(payload, function.schema) if function.schema is not None else []
+
+    def submit(self, name: str, payload: Dict[str, Any],
+               secrets: Optional[Dict[str, str]] = None) -> "concurrent.futures.Future[Dict[str, Any]]":
+        """
+        Run a function by name on the worker pool.
+
+        Returns:
+            Future resolving to the handler's result dict, or to an error dict
+            for unknown names and invalid payloads (the handler is not called).
+        """
+        future: "concurrent.futures.Future[Dict[str, Any]]"
+        if name not in self.functions:
+            future = concurrent.futures.Future()
+            future.set_result({"status": "error", "message": f"Unknown function: {name}"})
+            return future
+        errors = self.validate(name, payload)
+        if errors:
+            future = concurrent.futures.Future()
+            future.set_result({"status": "error", "message": "Invalid payload: " + "; ".join(errors)})
+            return future
+        return self._executor.submit(self._run, name, payload, secrets or {})
+
+    def _run(self, name: str, payload: Dict[str, Any], secrets: Dict[str, str]) -> Dict[str, Any]:
+        prerequisite = self.functions[name].prerequisite
+        if prerequisite:
+            # Runs first with the same payload; its failure stops the request
+            if prerequisite not in self.functions:
+                return {"status": "error", "message": f"Unknown prerequisite: {prerequisite}", "function": name}
+            result = self._run(prerequisite, payload, secrets)
+            if result.get("status") == "error":
+                return result
+        event_stream: List[Dict[str, Any]] = []
+        try:
+            result = self.functions[name].handler(payload, secrets, event_stream)
+        except Exception as e:
+            return {"status": "error", "message": str(e), "function": name}
+        return {**result, "function": name}
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Single entry point for all tools.
+
+        Args:
+            request: {"function": name} or {"query": free text matched against
+                trigger words}, plus "payload" and optional "secrets".
+
+        Returns:
+            Dict[str, Any]: The handler's result with the dispatched "function" name added.
+        """
+        name = request.get("function") or self.match(request.get("query", ""))
+        if name is None:
+            return {"status": "error", "message": "No function matches the request"}
+        return self.submit(name, request.get("payload") or {}, request.get("secrets")).result()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="List registered functions or dispatch a request.")
+    parser.add_argument("query", nargs="?", help="Free text matched against trigger words")
+    parser.add_argument("--list", action="store_true", help="Print the registered functions")
+    parser.add_argument("--sample", action="store_true", help="Send the function's sample payload")
+    parser.add_argument("--payload", help="JSON payload")
+    args = parser.parse_args()
+
+    registry = FunctionRegistry()
+    if args.list or not args.query:
+        print(json.dumps([function.describe() for function in registry.functions.values()], indent=2))
+        return
+    name = registry.match(args.query)
+    if name is None:
+        print("No function matches the request", file=sys.stderr)
+        sys.exit(1)
+    payload = registry.functions[name].sample_payload if args.sample else json.loads(args.payload or "{}")
+    result = registry.handle({"function": name, "payload": payload})
+    registry.shutdown()
+    print(json.dumps(result, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
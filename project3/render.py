@@ -0,0 +1,191 @@
+import concurrent.futures
+import functools
+import io
+import multiprocessing
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+from result_cache import get_chart, get_spec, put_chart, put_spec, spec_key
+
+# Below this many charts the pool's dispatch overhead outweighs the parallelism
+MIN_PARALLEL_CHARTS = 4
+
+# Output formats: MIME type and savefig options. Charts are flat-colour line
+# art, so lossless WebP is several times smaller than PNG at identical pixels.
+IMAGE_FORMATS: Dict[str, Dict[str, Any]] = {
+    "png": {"mime": "image/png", "savefig": {"pil_kwargs": {"optimize": True}}},
+    "webp": {"mime": "image/webp", "savefig": {"pil_kwargs": {"lossless": True}}},
+    "svg": {"mime": "image/svg+xml", "savefig": {}},
+}
+
+
+def chart_specs(profile: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Describe every chart to draw from a dataset profile (see profiling.py), in display order.
+
+    Specs carry only precomputed aggregates (correlation matrix, histogram bins,
+    KDE curve, category or time counts), so they are small to send to worker
+    processes and drawing never rescans the data.
+    """
+    specs: List[Dict[str, Any]] = []
+    if profile["correlation"] is not None:
+        specs.append({"column": "Correlation Matrix", "kind": "correlation", "data": profile["correlation"]})
+
+    for column, stats in profile["columns"].items():
+        if stats["kind"] == "numeric" and stats["edges"] is not None:
+            data = {key: stats[key] for key in ("edges", "counts", "kde_x", "kde_y")}
+            specs.append({"column": column, "kind": "histogram", "data": data})
+        elif stats["kind"] == "categorical" and len(stats["top_counts"]):
+            specs.append({"column": column, "kind": "bar", "data": stats["top_counts"]})
+        elif stats["kind"] == "datetime" and len(stats["time_counts"]):
+            specs.append({"column": column, "kind": "timeseries", "data": stats["time_counts"]})
+    return specs
+
+
+def chart_manifest(specs: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """
+    Describe the available charts without drawing any: id, column and kind of each.
+
+    Specs are stored in the result cache under their content key (the id), so
+    render_chart_by_id() can draw any of them later, in this process or another.
+    Cached results carry their specs too (result_cache.put_result), and restore
+    them when served, so a manifest never outlives the specs it refers to.
+    """
+    manifest = []
+    for spec in specs:
+        chart_id = spec_key(spec)
+        put_spec(chart_id, spec)
+        manifest.append({"id": chart_id, "column": spec["column"], "kind": spec["kind"]})
+    return manifest
+
+
+def render_chart_by_id(chart_id: str, image_format: str = "png") -> Optional[bytes]:
+    """
+    Image bytes of one chart from a manifest, drawn on first request and cached.
+
+    Returns:
+        Optional[bytes]: The image, or None if the chart is unknown (its spec is no
+            longer cached) or cannot be drawn. Callers should report, not skip, a None.
+    """
+    return render_charts_by_id([chart_id], image_format)[0]
+
+
+def render_charts_by_id(chart_ids: List[str], image_format: str = "png") -> List[Optional[bytes]]:
+    """
+    render_chart_by_id() for several charts at once, e.g. all those on screen.
+
+    Cached images are returned as they are; the rest are drawn in one batch with
+    render_charts(), so a first view uses the process pool rather than drawing
+    the charts one after another.
+
+    Returns:
+        List[Optional[bytes]]: Images (None as in render_chart_by_id()) in the order of chart_ids.
+    """
+    if image_format not in IMAGE_FORMATS:
+        raise ValueError(f"Unsupported image format: {image_format}")
+    images = [get_chart(f"{chart_id}.{image_format}") for chart_id in chart_ids]
+    missing = []
+    for index, image in enumerate(images):
+        if image is None:
+            spec = get_spec(chart_ids[index])
+            if spec is not None:
+                missing.append((index, spec))
+    drawn = render_charts([spec for _, spec in missing], image_format=image_format)
+    for (index, _), image in zip(missing, drawn):
+        images[index] = image
+        if image is not None:
+            put_chart(f"{chart_ids[index]}.{image_format}", image)
+    return images
+
+
+def render_chart(spec: Dict[str, Any], image_format: str = "png") -> Optional[bytes]:
+    """
+    Draw one chart spec and return the image bytes, or None if it cannot be drawn.
+
+    Uses a standalone matplotlib Figure rather than pyplot, so no global figure
+    state is shared and charts can be drawn concurrently.
+    """
+    from matplotlib.figure import Figure
+    import seaborn as sns
+
+    fig = Figure()
+    ax = fig.subplots()
+    column, kind, data = spec["column"], spec["kind"], spec["data"]
+    try:
+        if kind == "correlation":
+            sns.heatmap(data, annot=True, cmap="coolwarm", ax=ax)
+            ax.set_title("Correlation Matrix")
+        elif kind == "histogram":
+            ax.stairs(data["counts"], data["edges"], fill=True, alpha=0.6, edgecolor="white")
+            if data["kde_x"] is not None:
+                ax.plot(data["kde_x"], data["kde_y"])
+            ax.set_ylabel("Count")
+            ax.set_title(f"Histogram of {column}")
+            ax.set_xlabel(column)
+        elif kind == "bar":
+            data.plot(kind="bar", ax=ax)
+            ax.set_title(f"Bar Chart of {column}")
+            ax.set_xlabel(column)
+        elif kind == "timeseries":
+            data.plot(ax=ax)
+            ax.set_title(f"Time Series of {column}")
+            ax.set_xlabel(column)
+        else:
+            return None
+        fig.tight_layout()
+        buf = io.BytesIO()
+        fig.savefig(buf, format=image_format, **IMAGE_FORMATS[image_format]["savefig"])
+        return buf.getvalue()
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=1)
+def get_render_pool() -> concurrent.futures.ProcessPoolExecutor:
+    """
+    Worker processes shared by every call (and every Streamlit rerun).
+
+    Workers are spawned rather than forked: the Streamlit server is multi-threaded
+    and forking a threaded process is unsafe.
+    """
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def render_charts(specs: List[Dict[str, Any]], parallel: Optional[bool] = None,
+                  image_format: str = "png") -> List[Optional[bytes]]:
+    """
+    Render chart specs, in parallel across processes when worthwhile.
+
+    Args:
+        specs: Output of chart_specs().
+        parallel: Force (True) or disable (False) the process pool; by default it
+            is used for MIN_PARALLEL_CHARTS or more charts on a multi-core machine.
+
+    Returns:
+        Image bytes (or None for charts that failed) in the same order as specs.
+    """
+    if parallel is None:
+        parallel = len(specs) >= MIN_PARALLEL_CHARTS and (os.cpu_count() or 1) > 1
+    if not parallel:
+        return [render_chart(spec, image_format) for spec in specs]
+    return list(get_render_pool().map(functools.partial(render_chart, image_format=image_format), specs))
+
+
+def render_charts_cached(specs: List[Dict[str, Any]], parallel: Optional[bool] = None,
+                         image_format: str = "png") -> List[Optional[bytes]]:
+    """
+    render_charts(), drawing only the charts not already in the result cache.
+    Charts are keyed by their aggregates, so unchanged charts are reused even
+    when other columns of the dataset changed.
+    """
+    keys = [f"{spec_key(spec)}.{image_format}" for spec in specs]
+    images = [get_chart(key) for key in keys]
+    missing = [index for index, image in enumerate(images) if image is None]
+    for index, image in zip(missing, render_charts([specs[index] for index in missing], parallel, image_format)):
+        images[index] = image
+        if image is not None:
+            put_chart(keys[index], image)
+    return images
@@ -0,0 +1,261 @@
+import hashlib
+import json
+import os
+import pickle
+import threading
+import warnings
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+# Content-addressed cache for EDA results and rendered charts. Keys are hashes
+# of the data (and options), never of file names, so the same upload gives the
+# same key and any change to it gives a new one. Entries live in a bounded
+# in-memory LRU in front of a bounded directory on disk. The cache is
+# best-effort: if the directory cannot be created or written (read-only
+# checkout, full disk) entries are kept in memory only, and a cache that
+# cannot be read or written never fails the analysis it is caching.
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "EDA_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".eda_cache"),
+)
+MEMORY_BYTES = 64 << 20
+DISK_BYTES = 512 << 20
+CACHE_VERSION = "3"  # Bump when profiling or rendering output changes
+
+
+class BlobCache:
+    """Bytes by key: an in-memory LRU backed by a directory, each bounded in total size."""
+
+    def __init__(self, directory: Optional[str] = DEFAULT_CACHE_DIR,
+                 memory_bytes: int = MEMORY_BYTES, disk_bytes: int = DISK_BYTES) -> None:
+        """
+        Args:
+            directory: Where entries are written; None keeps the cache in memory only.
+            memory_bytes: Upper bound on the bytes held in memory.
+            disk_bytes: Upper bound on the bytes stored in directory.
+        """
+        self.directory = directory
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_size = 0
+        self._disk_size = 0
+        self._lock = threading.Lock()
+        if directory is not None:
+            try:
+                os.makedirs(directory, exist_ok=True)
+                self._disk_size = sum(entry.stat().st_size for entry in os.scandir(directory) if entry.is_file())
+            except OSError as e:
+                warnings.warn(f"EDA cache directory {directory} is unusable ({e}); caching in memory only")
+                self.directory = None
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return value
+        if self.directory is not None:
+            try:
+                with open(self._path(key), "rb") as f:
+                    value = f.read()
+            except OSError:
+                value = None
+            if value is not None:
+                try:
+                    os.utime(self._path(key))  # Eviction goes by last use
+                except OSError:
+                    pass
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, value)
+        return value
+
+    def put(self, key: str, value: bytes) -> None:
+        with self._lock:
+            self._remember(key, value)
+        if self.directory is None or len(value) > self.disk_bytes:
+            return
+        path = self._path(key)
+        temporary = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temporary, "wb") as f:
+                f.write(value)
+            existing = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(temporary, path)
+        except OSError:
+            # Disk full or directory gone: the entry stays in memory only
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._disk_size += len(value) - existing
+            if self._disk_size > self.disk_bytes:
+                self._evict_disk()
+
+    def remember(self, key: str, value: bytes) -> None:
+        """Hold a value in memory only (e.g. one restored from another entry); kept if already present."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+            else:
+                self._remember(key, value)
+
+    def _remember(self, key: str, value: bytes) -> None:
+        if len(value) > self.memory_bytes:
+            return
+        previous = self._memory.pop(key, None)
+        self._memory_size -= len(previous) if previous is not None else 0
+        self._memory[key] = value
+        self._memory_size += len(value)
+        while self._memory_size > self.memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+
+    def _evict_disk(self) -> None:
+        # Least recently used files first, down to 90% of the bound
+        try:
+            entries = sorted((entry.stat().st_mtime, entry.stat().st_size, entry.path)
+                             for entry in os.scandir(self.directory) if entry.is_file())
+        except OSError:
+            return  # e.g. a file removed by another process mid-scan; retried on the next put
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in entries:
+            if size <= self.disk_bytes * 0.9:
+                break
+            try:
+                os.remove(path)
+                size -= entry_size
+            except OSError:
+                pass
+        self._disk_size = size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            if self.directory is not None:
+                for entry in os.scandir(self.directory):
+                    if entry.is_file():
+                        os.remove(entry.path)
+                self._disk_size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "memory_bytes": self._memory_size,
+                "disk_bytes": self._disk_size, "directory": self.directory}
+
+
+@lru_cache(maxsize=1)
+def get_cache() -> BlobCache:
+    """Process-wide cache, shared by every Streamlit rerun and session."""
+    return BlobCache()
+
+
+def get_result(key: str) -> Optional[Dict[str, Any]]:
+    """
+    A cached result, or None. The chart specs stored with it are put back in
+    memory, so every chart id in its manifest can be drawn even after the
+    separate spec entries were evicted.
+    """
+    cache = get_cache()
+    value = cache.get(f"result-{key}")
+    if value is None:
+        return None
+    try:
+        entry = pickle.loads(value)
+    except Exception:
+        return None  # A damaged entry counts as a miss and is overwritten
+    for chart_id, spec in entry["specs"].items():
+        cache.remember(f"spec-{chart_id}", spec)
+    return entry["result"]
+
+
+def put_result(key: str, result: Dict[str, Any], specs: Optional[List[Dict[str, Any]]] = None) -> None:
+    """
+    Cache a result together with the chart specs behind its manifest
+    (result["charts"], in the same order).
+    """
+    pickled_specs = {
+        chart["id"]: pickle.dumps(spec, protocol=pickle.HIGHEST_PROTOCOL)
+        for chart, spec in zip(result.get("charts", []), specs or [])
+    }
+    entry = {"result": result, "specs": pickled_specs}
+    get_cache().put(f"result-{key}", pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def get_chart(key: str) -> Optional[bytes]:
+    return get_cache().get(f"chart-{key}")
+
+
+def put_chart(key: str, image: bytes) -> None:
+    get_cache().put(f"chart-{key}", image)
+
+
+def get_spec(key: str) -> Optional[Dict[str, Any]]:
+    value = get_cache().get(f"spec-{key}")
+    if value is None:
+        return None
+    try:
+        return pickle.loads(value)
+    except Exception:
+        return None
+
+
+def put_spec(key: str, spec: Dict[str, Any]) -> None:
+    get_cache().put(f"spec-{key}", pickle.dumps(spec, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def result_key(data_hash: str, **options: Any) -> str:
+    """Key of a whole EDA result: the dataset's content hash plus every option that changes it."""
+    payload = json.dumps({"data": data_hash, "options": options, "version": CACHE_VERSION},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def frame_digest(df: pd.DataFrame) -> str:
+    """Content hash of a DataFrame (values, index, column names and dtypes), vectorised."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([[str(column), str(dtype)] for column, dtype in df.dtypes.items()]).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def spec_key(spec: Dict[str, Any]) -> str:
+    """
+    Key of one chart: a hash of its kind, title and aggregates. Charts whose
+    aggregates did not change keep their key and are not drawn again.
+    """
+    digest = hashlib.sha256(f"{CACHE_VERSION}|{spec['kind']}|{spec['column']}".encode("utf-8"))
+    _update_digest(digest, spec["data"])
+    return digest.hexdigest()
+
+
+def _update_digest(digest: Any, data: Any) -> None:
+    if isinstance(data, dict):
+        for name in sorted(data):
+            digest.update(name.encode("utf-8"))
+            _update_digest(digest, data[name])
+    elif isinstance(data, (pd.Series, pd.DataFrame)):
+        if isinstance(data, pd.DataFrame):
+            digest.update(json.dumps([str(column) for column in data.columns]).encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    elif isinstance(data, np.ndarray):
+        digest.update(str(data.dtype).encode("utf-8"))
+        digest.update(np.ascontiguousarray(data).tobytes())
+    else:
+        digest.update(repr(data).encode("utf-8"))
@@ -0,0 +1,145 @@
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+import pandas as pd
+from ingest import CsvSource
+
+# Date formats tried on sampled text values, in order of preference. "ISO8601"
+# covers ISO dates and timestamps with optional fraction and offset. For
+# ambiguous day/month values the first format that parses most values wins, so
+# month-first (pandas' default) precedes day-first.
+DATE_FORMATS: List[str] = [
+    "ISO8601",
+    "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d",
+    "%m/%d/%Y %H:%M", "%d/%m/%Y %H:%M", "%m/%d/%Y %H:%M:%S", "%d/%m/%Y %H:%M:%S",
+    "%d-%m-%Y", "%d.%m.%Y", "%m-%d-%Y",
+    "%d %b %Y", "%d %B %Y", "%b %d, %Y", "%B %d, %Y", "%b %d %Y",
+    "%m/%d/%y", "%d/%m/%y",
+]
+SAMPLE_SIZE = 500
+MIN_PARSED_FRACTION = 0.95  # Of non-null sampled values, for a column to count as dates
+MAX_CACHED_SCHEMAS = 256
+
+# Cheap pre-check before any format is tried: digits with a date separator, or a month name
+DATE_LIKE = re.compile(r"\d{1,4}[-/.]\d{1,2}|\d{1,2}\s+[A-Za-z]{3}|[A-Za-z]{3,9}\.?\s+\d{1,2}")
+
+_schemas: "OrderedDict[str, Dict[str, str]]" = OrderedDict()
+_schemas_lock = threading.Lock()
+
+
+def file_digest(source: CsvSource, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a path or binary file object; file objects are rewound afterwards."""
+    digest = hashlib.sha256()
+    if isinstance(source, str):
+        with open(source, "rb") as f:
+            for block in iter(lambda: f.read(chunk_size), b""):
+                digest.update(block)
+        return digest.hexdigest()
+    start = source.tell()
+    for block in iter(lambda: source.read(chunk_size), b""):
+        digest.update(block)
+    source.seek(start)
+    return digest.hexdigest()
+
+
+def is_text(series: pd.Series) -> bool:
+    """Object, string, or categorical-of-text column (pyarrow reads repetitive text as categorical)."""
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        dtype = dtype.categories.dtype
+    return pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype)
+
+
+def sample_values(series: pd.Series, size: int = SAMPLE_SIZE) -> pd.Series:
+    """Up to `size` distinct non-null values from across the column, as strings."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.unique()
+        values = pd.Series(series.cat.categories[codes[codes >= 0]], dtype=object)
+    else:
+        values = series.dropna()
+    if len(values) > size * 4:
+        # Rows from the whole column rather than the head, as files are often sorted.
+        # Random (seeded) positions, since a fixed stride can alias with periodic data.
+        values = values.sample(n=size * 4, random_state=0)
+    return values.drop_duplicates().head(size).astype(str).str.strip()
+
+
+def detect_date_format(sample: pd.Series) -> Optional[str]:
+    """
+    The format that parses the sampled values, or None if they are not dates.
+
+    Args:
+        sample (pd.Series): Text values (see sample_values()).
+
+    Returns:
+        Optional[str]: A strftime format or "ISO8601", usable as pd.to_datetime(format=...).
+    """
+    if not len(sample) or sample.str.contains(DATE_LIKE).mean() < MIN_PARSED_FRACTION:
+        return None
+    best, best_fraction = None, MIN_PARSED_FRACTION
+    for date_format in DATE_FORMATS:
+        try:
+            parsed = pd.to_datetime(sample, format=date_format, errors="coerce")
+        except (ValueError, TypeError):
+            continue  # e.g. mixed time zones
+        fraction = parsed.notna().mean()
+        if fraction > best_fraction or (best is None and fraction >= best_fraction):
+            best, best_fraction = date_format, fraction
+            if fraction == 1.0:
+                break
+    return best
+
+
+def infer_schema(df: pd.DataFrame, sample_size: int = SAMPLE_SIZE) -> Dict[str, str]:
+    """Date format for every text column whose sampled values are dates (column -> format)."""
+    schema = {}
+    for column in df.columns:
+        if is_text(df[column]):
+            date_format = detect_date_format(sample_values(df[column], sample_size))
+            if date_format is not None:
+                schema[column] = date_format
+    return schema
+
+
+def cached_schema(df: pd.DataFrame, key: Optional[str] = None) -> Dict[str, str]:
+    """
+    infer_schema(), remembered per source (e.g. file_digest() of the upload) so that
+    re-uploading the same file skips inference. Without a key nothing is cached.
+    """
+    if key is None:
+        return infer_schema(df)
+    with _schemas_lock:
+        if key in _schemas:
+            _schemas.move_to_end(key)
+            return _schemas[key]
+    schema = infer_schema(df)
+    with _schemas_lock:
+        _schemas[key] = schema
+        while len(_schemas) > MAX_CACHED_SCHEMAS:
+            _schemas.popitem(last=False)
+    return schema
+
+
+def apply_schema(df: pd.DataFrame, schema: Dict[str, str]) -> pd.DataFrame:
+    """
+    Convert the schema's columns with their fixed format; values that do not match become NaT.
+    Returns a new DataFrame (columns not in the schema are shared, not copied).
+    """
+    columns = [column for column in schema if column in df.columns]
+    if not columns:
+        return df
+    df = df.copy(deep=False)
+    for column in columns:
+        df[column] = parse_dates(df[column], schema[column])
+    return df
+
+
+def parse_dates(series: pd.Series, date_format: str) -> pd.Series:
+    """Vectorised fixed-format parse; categoricals are parsed once per category."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = pd.to_datetime(series.cat.categories.astype(str), format=date_format, errors="coerce")
+        values = categories.take(series.cat.codes.to_numpy(), allow_fill=True, fill_value=pd.NaT)
+        return pd.Series(values, index=series.index, name=series.name)
+    return pd.to_datetime(series, format=date_format, errors="coerce")
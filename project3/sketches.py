@@ -0,0 +1,242 @@
+import math
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+import pandas as pd
+
+# Mergeable summaries for profiling data that does not fit in memory. Each one is
+# updated chunk by chunk, uses memory independent of the number of rows, and two
+# sketches of the same kind can be merged (e.g. from different files or workers).
+
+
+class MomentSketch:
+    """
+    Count, mean, variance and pairwise correlation of numeric columns.
+
+    Chunks are reduced with matrix products (as in profiling.py) and folded into
+    the running totals with Chan's parallel update of Welford's algorithm, so
+    nothing is lost to cancellation however many rows are streamed. Statistics are
+    pairwise-complete, as in DataFrame.corr: entry [i, j] covers the rows where
+    both column i and column j are present; the diagonal holds per-column values.
+    """
+
+    def __init__(self, columns: Sequence[str]) -> None:
+        k = len(columns)
+        self.columns = list(columns)
+        self.n = np.zeros((k, k))
+        self.mean = np.zeros((k, k))  # [i, j]: mean of column i over rows where i and j are present
+        self.m2 = np.zeros((k, k))  # [i, j]: squared deviations of column i over the same rows
+        self.comoment = np.zeros((k, k))
+
+    def update(self, values: np.ndarray) -> None:
+        """Add a chunk: float array of shape (rows, columns), NaN for missing values."""
+        present = ~np.isnan(values)
+        mask = present.astype(np.float64)
+        n = mask.T @ mask
+        counts = present.sum(axis=0)
+        # Shift by the chunk mean so the sums below stay small
+        shift = np.where(present, values, 0.0).sum(axis=0) / np.maximum(counts, 1)
+        x = np.where(present, values - shift, 0.0)
+        sum_x = x.T @ mask
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(n > 0, sum_x / n, 0.0)
+        m2 = (x * x).T @ mask - sum_x * mean
+        comoment = x.T @ x - sum_x * mean.T
+        self._merge(n, mean + shift[:, None], m2, comoment)
+
+    def merge(self, other: "MomentSketch") -> None:
+        self._merge(other.n, other.mean, other.m2, other.comoment)
+
+    def _merge(self, n: np.ndarray, mean: np.ndarray, m2: np.ndarray, comoment: np.ndarray) -> None:
+        total = self.n + n
+        weight = self.n * n / np.maximum(total, 1)
+        delta = mean - self.mean
+        self.mean = self.mean + delta * n / np.maximum(total, 1)
+        self.m2 = self.m2 + m2 + delta * delta * weight
+        self.comoment = self.comoment + comoment + delta * delta.T * weight
+        self.n = total
+
+    @property
+    def count(self) -> np.ndarray:
+        return np.diag(self.n).copy()
+
+    @property
+    def means(self) -> np.ndarray:
+        return np.where(self.count > 0, np.diag(self.mean), np.nan)
+
+    @property
+    def stds(self) -> np.ndarray:
+        count = self.count
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(count >= 2, np.sqrt(np.maximum(np.diag(self.m2), 0) / (count - 1)), np.nan)
+
+    def correlation(self) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            correlation = self.comoment / np.sqrt(self.m2 * self.m2.T)
+        correlation[self.n < 2] = np.nan
+        np.fill_diagonal(correlation, np.where(self.count >= 2, 1.0, np.nan))
+        return np.clip(correlation, -1.0, 1.0)
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch (Karnin, Lang & Liberty) over float values.
+
+    Level h holds items that each stand for 2**h input values. A level over its
+    capacity is sorted and every other item (random offset) is promoted, so the
+    sketch keeps O(k log(n / k)) items and rank error is about 1.7 / k. The exact
+    minimum and maximum are tracked separately.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None) -> None:
+        self.k = k
+        self.count = 0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray) -> None:
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        self.count += len(values)
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+        self.levels[0] = np.concatenate([self.levels[0], values.astype(np.float64)])
+        self._compress()
+
+    def merge(self, other: "KLLSketch") -> None:
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self._compress()
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(8, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self) -> None:
+        compacted = True
+        while compacted:
+            compacted = False
+            for level in range(len(self.levels)):
+                items = self.levels[level]
+                if len(items) <= self._capacity(level):
+                    continue
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays at this level so the total weight is preserved
+                keep, items = items[: len(items) % 2], items[len(items) % 2:]
+                promoted = items[int(self._rng.integers(2))::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+                compacted = True
+
+    def weighted_items(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Retained items (sorted) and the number of input values each represents."""
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind="stable")
+        return items[order], weights[order]
+
+    def quantiles(self, fractions: Sequence[float]) -> List[float]:
+        if not self.count:
+            return [math.nan] * len(fractions)
+        items, weights = self.weighted_items()
+        cumulative = np.cumsum(weights)
+        result = []
+        for fraction in fractions:
+            if fraction <= 0:
+                result.append(self.minimum)
+            elif fraction >= 1:
+                result.append(self.maximum)
+            else:
+                position = np.searchsorted(cumulative, fraction * cumulative[-1])
+                result.append(float(items[min(position, len(items) - 1)]))
+        return result
+
+
+class HyperLogLog:
+    """Distinct-count estimate from 2**precision one-byte registers (about 1.6% error at 12)."""
+
+    def __init__(self, precision: int = 12) -> None:
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, values: pd.Series) -> None:
+        """Add the non-null values of a Series (hashed by value, so dtypes and chunks agree)."""
+        values = values.dropna()
+        if len(values):
+            self.update_hashes(pd.util.hash_pandas_object(values, index=False).to_numpy())
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        tail_bits = 64 - self.precision
+        index = (hashes >> np.uint64(tail_bits)).astype(np.intp)
+        tail = hashes & np.uint64((1 << tail_bits) - 1)
+        # Position of the leading one bit; exact, as tails fit in a float64 mantissa
+        rank = tail_bits + 1 - np.frexp(tail.astype(np.float64))[1]
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+
+    def merge(self, other: "HyperLogLog") -> None:
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)  # Linear counting for small cardinalities
+        return float(raw)
+
+
+class SpaceSaving:
+    """
+    Heavy hitters with at most `capacity` counters (mergeable Space-Saving).
+
+    While no counter has been evicted the counts are exact. Afterwards an item
+    seen for the first time is credited with the smallest retained count, the
+    most it could have had before, so counts are overestimates by at most
+    `errors[item]`.
+    """
+
+    def __init__(self, capacity: int = 1000) -> None:
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.float64)
+        self.errors = pd.Series(dtype=np.float64)
+        self.truncated = False
+
+    def update(self, values: pd.Series) -> None:
+        counts = values.value_counts(dropna=True)
+        self.merge_counts(counts[counts > 0], truncated=False)
+
+    def merge(self, other: "SpaceSaving") -> None:
+        self.merge_counts(other.counts, other.truncated, other.errors)
+
+    def merge_counts(self, counts: pd.Series, truncated: bool, errors: Optional[pd.Series] = None) -> None:
+        counts = pd.Series(counts.to_numpy(dtype=np.float64), index=counts.index.astype(object))
+        errors = pd.Series(0.0, index=counts.index) if errors is None else errors
+        # An item missing from a truncated summary may have had up to its smallest count
+        floor_self = float(self.counts.min()) if self.truncated else 0.0
+        floor_other = float(counts.min()) if truncated and len(counts) else 0.0
+
+        # Hash-based union (no sorting, unlike Series.add)
+        index = self.counts.index.append(counts.index[~counts.index.isin(self.counts.index)])
+        combined = self.counts.reindex(index).fillna(floor_self) + counts.reindex(index).fillna(floor_other)
+        combined_errors = self.errors.reindex(index).fillna(floor_self) + errors.reindex(index).fillna(floor_other)
+
+        self.truncated = self.truncated or truncated
+        if len(combined) > self.capacity:
+            combined = combined.nlargest(self.capacity, keep="first")
+            self.truncated = True
+        self.counts = combined
+        self.errors = combined_errors.reindex(combined.index)
+
+    def top(self, k: int) -> pd.Series:
+        """The k most frequent items and their (estimated) counts, largest first."""
+        return self.counts.nlargest(k, keep="first").round().astype(np.int64)
@@ -0,0 +1,175 @@
+import asyncio
+import concurrent.futures
+import contextvars
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
+import streamlit as st
+from cachetools import TTLCache
+from helper import (
+    AIAssistant, BrowserPool, ModelRegistry, OllamaClient, article_fetches, create_http_session,
+    credibility_scores, stream_news_data,
+)
+from metrics import METRICS_PORT, register_cache, register_pool, start_metrics_server
+from speech import SpeechService
+
+# ============================ SHARED RESOURCES ============================
+# Streamlit re-executes app.py on every interaction. Anything created through
+# st.cache_resource lives for the whole server process and is shared by every
+# session, so the model, connection pools, browsers and the search cache are
+# only built once.
+
+BROWSER_POOL_SIZE: int = 2
+TTS_WORKERS: int = 4
+LLM_WORKERS: int = 4
+HTTP_POOL_SIZE: int = 20
+SEARCH_CACHE_TTL_SECONDS: int = 600
+
+# TTLCache is not thread-safe and Streamlit serves each session on its own thread
+_search_cache_lock = threading.Lock()
+_search_cache_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+_llm_active: Dict[str, int] = {"count": 0}
+_llm_active_lock = threading.Lock()
+
+
+@st.cache_resource(show_spinner=False)
+def get_model_registry() -> ModelRegistry:
+    """Credibility model and tokenizer vocabulary shared by all sessions."""
+    # Scores served by a concurrent identical request count as hits
+    register_cache("score_singleflight", lambda: (credibility_scores.shared, credibility_scores.executed))
+    return ModelRegistry()
+
+
+@st.cache_resource(show_spinner=False)
+def get_llm_client() -> OllamaClient:
+    """Ollama client shared by all sessions."""
+    return OllamaClient()
+
+
+@st.cache_resource(show_spinner=False)
+def get_http_session():
+    """Pooled HTTP session for article downloads."""
+    register_cache("fetch_singleflight", lambda: (article_fetches.shared, article_fetches.executed))
+    return create_http_session(pool_size=HTTP_POOL_SIZE)
+
+
+@st.cache_resource(show_spinner=False)
+def get_browser_pool() -> BrowserPool:
+    """Headless Chrome drivers reused across searches."""
+    pool = BrowserPool(size=BROWSER_POOL_SIZE)
+    register_pool("browser", lambda: pool.in_use, BROWSER_POOL_SIZE)
+    return pool
+
+
+@st.cache_resource(show_spinner=False)
+def get_speech_service() -> SpeechService:
+    """Background text-to-speech workers and audio cache shared by all sessions."""
+    service = SpeechService(max_workers=TTS_WORKERS)
+    register_pool("tts", lambda: service.in_flight, TTS_WORKERS)
+    register_cache("speech", lambda: (service.hits, service.misses))
+    return service
+
+
+def get_rating_assistant() -> AIAssistant:
+    """
+    Assistant used only to rate articles. It never accumulates conversation
+    state worth keeping, so it is built per search on the shared resources.
+    """
+    return AIAssistant(llm=get_llm_client(), model_registry=get_model_registry())
+
+
+@st.cache_resource(show_spinner=False)
+def get_search_cache() -> TTLCache:
+    """Completed searches shared by all sessions for SEARCH_CACHE_TTL_SECONDS."""
+    register_cache("search", lambda: (_search_cache_stats["hits"], _search_cache_stats["misses"]))
+    return TTLCache(maxsize=256, ttl=SEARCH_CACHE_TTL_SECONDS)
+
+
+@st.cache_resource(show_spinner=False)
+def get_llm_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Worker threads that run LLM summaries while results are still streaming in."""
+    register_pool("llm", lambda: _llm_active["count"], LLM_WORKERS)
+    return concurrent.futures.ThreadPoolExecutor(max_workers=LLM_WORKERS, thread_name_prefix="llm")
+
+
+def submit_llm(func: Callable[..., Any], *args: Any) -> concurrent.futures.Future:
+    """
+    Run an LLM call on the shared executor, in a copy of the caller's context
+    so it keeps the query's trace id.
+    """
+    with _llm_active_lock:
+        _llm_active["count"] += 1
+    future = get_llm_executor().submit(contextvars.copy_context().run, func, *args)
+
+    def on_done(_: concurrent.futures.Future) -> None:
+        with _llm_active_lock:
+            _llm_active["count"] -= 1
+
+    future.add_done_callback(on_done)
+    return future
+
+
+@st.cache_resource(show_spinner=False)
+def get_metrics_server() -> Optional[int]:
+    """Start the Prometheus /metrics endpoint once per server process; its port, or None if it could not start."""
+    return METRICS_PORT if start_metrics_server() else None
+
+
+def stream_news(query: str, region: str, count: int, time_filter: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield rated articles as they complete, for rendering from Streamlit's synchronous script.
+
+    Drives helper.stream_news_data on a private event loop. A search that
+    finished within the TTL is replayed from the shared search cache instead.
+    """
+    key = (query, region, count, time_filter)
+    cache = get_search_cache()
+    with _search_cache_lock:
+        cached = cache.get(key)
+        _search_cache_stats["hits" if cached is not None else "misses"] += 1
+    if cached is not None:
+        yield from cached
+        return
+
+    loop = asyncio.new_event_loop()
+    articles = stream_news_data(
+        query=query,
+        count=count,
+        region=region,
+        time_filter=time_filter,
+        browser_pool=get_browser_pool(),
+        http_session=get_http_session(),
+        assistant=get_rating_assistant(),
+    )
+    collected: List[Dict[str, Any]] = []
+    try:
+        while True:
+            try:
+                article = loop.run_until_complete(articles.__anext__())
+            except StopAsyncIteration:
+                break
+            collected.append(article)
+            yield article
+        if collected:
+            with _search_cache_lock:
+                cache[key] = collected
+    finally:
+        loop.run_until_complete(articles.aclose())
+        loop.close()
+
+# ============================ PER-SESSION STATE ============================
+
+
+def get_session_assistant() -> AIAssistant:
+    """
+    Conversation assistant for the current browser session. Its conversation log
+    is private to the session; the LLM client and model behind it are shared.
+    """
+    if "assistant" not in st.session_state:
+        st.session_state.assistant = AIAssistant(llm=get_llm_client(), model_registry=get_model_registry())
+    return st.session_state.assistant
+
+
+def reset_session() -> None:
+    """Forget this session's messages and conversation log."""
+    st.session_state.messages = []
+    st.session_state.pop("assistant", None)
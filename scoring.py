@@ -0,0 +1,193 @@
+import argparse
+import json
+import sys
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+import numpy as np
+import pandas as pd
+
+# ============================ SIGNALS AND WEIGHTS ============================
+# The validity score is a weighted sum of five component signals (each 0-100).
+# Signals are kept as an (n_urls x n_signals) matrix, so scoring any number of
+# URLs under any number of weightings is a single matrix product.
+
+SIGNALS: List[str] = ["domain_trust", "similarity", "fact_check", "bias", "citation"]
+
+# Keys used for each signal in rate_url_validity's result dict
+RESULT_KEYS: Dict[str, str] = {
+    "domain_trust": "Domain Trust",
+    "similarity": "Content Relevance",
+    "fact_check": "Fact-Check Score",
+    "bias": "Bias Score",
+    "citation": "Citation Score",
+}
+FINAL_SCORE_KEY: str = "Final Validity Score"
+
+DEFAULT_WEIGHTS: Dict[str, float] = {"domain_trust": 0.3, "similarity": 0.3, "fact_check": 0.2, "bias": 0.1, "citation": 0.1}
+
+# Final score thresholds between 1-2, 2-3, 3-4 and 4-5 stars
+STAR_THRESHOLDS: np.ndarray = np.array([20.0, 40.0, 60.0, 80.0])
+
+SignalMatrix = Union[pd.DataFrame, np.ndarray]
+
+
+def weight_vector(weights: Optional[Mapping[str, float]] = None) -> np.ndarray:
+    """
+    Weights as a vector aligned with SIGNALS.
+
+    Args:
+        weights (Optional[Mapping[str, float]]): Overrides for DEFAULT_WEIGHTS; unnamed signals keep their default.
+
+    Returns:
+        np.ndarray: Shape (len(SIGNALS),).
+    """
+    merged = {**DEFAULT_WEIGHTS, **(weights or {})}
+    unknown = set(merged) - set(SIGNALS)
+    if unknown:
+        raise ValueError(f"Unknown signals in weights: {', '.join(sorted(unknown))}")
+    return np.array([merged[name] for name in SIGNALS], dtype=np.float64)
+
+
+def parse_weights(spec: str) -> Dict[str, float]:
+    """Parse "domain_trust=0.4,similarity=0.2" into a weights dict."""
+    weights: Dict[str, float] = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, value = item.partition("=")
+        weights[name.strip()] = float(value)
+    return weights
+
+# ============================ VECTORISED SCORING ============================
+
+
+def signal_frame(results: Iterable[Mapping[str, Any]]) -> pd.DataFrame:
+    """Signal matrix from rate_url_validity result dicts (one row per result)."""
+    frame = pd.DataFrame.from_records(list(results))
+    return frame.rename(columns={key: name for name, key in RESULT_KEYS.items()}).reindex(columns=SIGNALS).astype(np.float64)
+
+
+def _matrix(signals: SignalMatrix) -> np.ndarray:
+    if isinstance(signals, pd.DataFrame):
+        return signals[SIGNALS].to_numpy(dtype=np.float64)
+    return np.asarray(signals, dtype=np.float64)
+
+
+def final_scores(signals: SignalMatrix, weights: Optional[Mapping[str, float]] = None) -> np.ndarray:
+    """Weighted validity score of every row."""
+    return _matrix(signals) @ weight_vector(weights)
+
+
+def star_ratings(scores: np.ndarray) -> np.ndarray:
+    """Map 0-100 scores to 1-5 stars; rows without a score (NaN) get 0."""
+    scores = np.asarray(scores, dtype=np.float64)
+    return np.where(np.isnan(scores), 0, np.digitize(scores, STAR_THRESHOLDS) + 1).astype(np.int8)
+
+
+def score_frame(signals: pd.DataFrame, weights: Optional[Mapping[str, float]] = None) -> pd.DataFrame:
+    """Copy of the signal frame with final_score and stars columns added."""
+    scored = signals.copy()
+    scored["final_score"] = final_scores(signals, weights)
+    scored["stars"] = star_ratings(scored["final_score"].to_numpy())
+    return scored
+
+
+def component_distributions(signals: pd.DataFrame) -> pd.DataFrame:
+    """Per-signal distribution (count, mean, std, min, quartiles, max); one row per signal."""
+    return signals[SIGNALS].describe(percentiles=[0.25, 0.5, 0.75]).T
+
+
+def what_if(signals: SignalMatrix, scenarios: Mapping[str, Mapping[str, float]]) -> pd.DataFrame:
+    """
+    Final scores and stars under several weightings at once.
+
+    Args:
+        signals (SignalMatrix): Signal rows, e.g. loaded from the result cache.
+        scenarios (Mapping[str, Mapping[str, float]]): Scenario name to weight overrides.
+
+    Returns:
+        pd.DataFrame: "<scenario>" and "<scenario>_stars" columns, one row per signal row.
+    """
+    names = list(scenarios)
+    weights = np.column_stack([weight_vector(scenarios[name]) for name in names])
+    scores = _matrix(signals) @ weights
+    frame = pd.DataFrame(scores, columns=names, index=signals.index if isinstance(signals, pd.DataFrame) else None)
+    for column, name in enumerate(names):
+        frame[f"{name}_stars"] = star_ratings(scores[:, column])
+    return frame
+
+
+def score_result(result: Dict[str, Any], weights: Optional[Mapping[str, float]] = None) -> Dict[str, Any]:
+    """Set the final score of one rate_url_validity result from its signals."""
+    signals = np.array([result[RESULT_KEYS[name]] for name in SIGNALS], dtype=np.float64)
+    result[FINAL_SCORE_KEY] = float(signals @ weight_vector(weights))
+    return result
+
+# ============================ BATCH REPORT ============================
+
+
+def batch_report(pairs: pd.DataFrame, weights: Optional[Mapping[str, float]] = None, compute_missing: bool = False) -> pd.DataFrame:
+    """
+    Score (user_prompt, url_to_check) pairs from cached signals.
+
+    Signals are read from the rate_url_validity result cache in one query, so
+    changing weights never refetches pages or reruns models.
+
+    Args:
+        pairs (pd.DataFrame): Must have user_prompt and url_to_check columns (e.g. sample.csv).
+        weights (Optional[Mapping[str, float]]): Weight overrides.
+        compute_missing (bool): Run rate_url_validity for pairs not in the cache.
+
+    Returns:
+        pd.DataFrame: The input columns plus signals, final_score and stars.
+    """
+    from scoring_config import SCORING_VERSION, get_result_cache
+    from validity_cache import sha256_text
+
+    cached = get_result_cache().latest_results(SCORING_VERSION)
+    frame = pairs.assign(query_hash=pairs["user_prompt"].map(sha256_text))
+    if cached:
+        signals = signal_frame(result for _, _, result in cached)
+        signals["query_hash"] = [query_hash for query_hash, _, _ in cached]
+        signals["url_to_check"] = [url for _, url, _ in cached]
+        frame = frame.merge(signals, on=["query_hash", "url_to_check"], how="left")
+    else:
+        frame = frame.reindex(columns=[*frame.columns, *SIGNALS])
+
+    missing = frame[SIGNALS].isna().any(axis=1)
+    if compute_missing and missing.any():
+        # Imported only when needed: test.py pulls in the model libraries
+        import test as validity
+
+        for index in frame.index[missing]:
+            result = validity.rate_url_validity(frame.at[index, "user_prompt"], frame.at[index, "url_to_check"])
+            if "error" not in result:
+                for name in SIGNALS:
+                    frame.at[index, name] = result[RESULT_KEYS[name]]
+    return score_frame(frame.drop(columns="query_hash"), weights)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Score cached URL validity signals in one vectorised pass.")
+    parser.add_argument("--csv", default="sample.csv", help="CSV with user_prompt and url_to_check columns")
+    parser.add_argument("--output", default="validity_report.csv")
+    parser.add_argument("--weights", default="", help='Weight overrides, e.g. "domain_trust=0.4,citation=0"')
+    parser.add_argument("--what-if", nargs="*", default=[], metavar="NAME=WEIGHTS",
+                        help='Extra weightings to compare, e.g. "no_citations=citation=0,similarity=0.4"')
+    parser.add_argument("--compute-missing", action="store_true", help="Score pairs that are not cached yet")
+    args = parser.parse_args()
+
+    weights = parse_weights(args.weights)
+    report = batch_report(pd.read_csv(args.csv), weights, compute_missing=args.compute_missing)
+    scored = report.dropna(subset=SIGNALS)
+    if args.what_if:
+        scenarios = {name: parse_weights(spec) for name, _, spec in (item.partition("=") for item in args.what_if)}
+        report = report.join(what_if(scored, scenarios))
+
+    report.to_csv(args.output, index=False)
+    print(f"Scored {len(scored)} of {len(report)} pairs ({len(report) - len(scored)} not cached) -> {args.output}")
+    if scored.empty:
+        sys.exit(1)
+    print(component_distributions(scored).round(2).to_string())
+    print("stars:", json.dumps({int(k): int(v) for k, v in scored["stars"].value_counts().sort_index().items()}))
+
+
+if __name__ == "__main__":
+    main()
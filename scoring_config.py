@@ -0,0 +1,27 @@
+from typing import Optional
+from domain_trust import default_index
+from validity_cache import ValidityCache, scoring_version
+
+# ============================ SCORING CONFIGURATION ============================
+# What rate_url_validity's cached signals depend on, kept apart from test.py so
+# that reading or pruning the result cache (scoring.py, validity_cache.py) does
+# not import the model libraries.
+
+# Models and the domain trust index behind the component signals; any change here
+# gives a new SCORING_VERSION, so cached signals from the old ones are no longer
+# returned. Weights only affect the final score, which is recomputed on every call.
+SIMILARITY_MODEL = "sentence-transformers/all-mpnet-base-v2"
+SENTIMENT_MODEL = "cardiffnlp/twitter-roberta-base-sentiment"
+SCORING_VERSION = scoring_version(
+    similarity=SIMILARITY_MODEL, sentiment=SENTIMENT_MODEL, domain_trust=default_index().version,
+)
+
+_result_cache: Optional[ValidityCache] = None
+
+
+def get_result_cache() -> ValidityCache:
+    """Shared on-disk result cache (see validity_cache.py)."""
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = ValidityCache()
+    return _result_cache
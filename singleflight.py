@@ -0,0 +1,107 @@
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+# ============================ SINGLE FLIGHT ============================
+
+
+class SingleFlight:
+    """
+    Collapses concurrent identical calls into one execution.
+
+    The first caller for a key runs the work; callers arriving while it is in
+    flight wait for the same result (or exception). Nothing is kept once the
+    call finishes, so unlike a cache there is no staleness to manage: the next
+    call after completion runs again.
+
+    In-flight calls are tracked with concurrent.futures.Future, so sync callers
+    on worker threads and async callers on different event loops (one per
+    Streamlit session) all share the same flight.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+        self.shared = 0      # Calls served by another caller's flight
+        self.executed = 0    # Calls that ran the work themselves
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def _join(self, key: Hashable) -> Tuple[concurrent.futures.Future, bool]:
+        """Return the flight for key and whether the caller leads it."""
+        with self._lock:
+            flight = self._calls.get(key)
+            if flight is not None:
+                self.shared += 1
+                return flight, False
+            flight = self._calls[key] = concurrent.futures.Future()
+            self.executed += 1
+            return flight, True
+
+    def _land(self, key: Hashable, flight: concurrent.futures.Future) -> None:
+        with self._lock:
+            if self._calls.get(key) is flight:
+                del self._calls[key]
+
+    def call(self, key: Hashable, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run func(*args) unless an identical call is already in flight, blocking until done.
+
+        Args:
+            key (Hashable): Identity of the call, e.g. a URL.
+            func (Callable[..., Any]): Work to run if this caller leads.
+            *args: Arguments for func.
+
+        Returns:
+            Any: The shared result.
+        """
+        while True:
+            flight, leader = self._join(key)
+            if not leader:
+                try:
+                    return flight.result()
+                except concurrent.futures.CancelledError:
+                    continue  # The leader gave up; run it again
+            try:
+                result = func(*args)
+            except BaseException as e:
+                self._land(key, flight)
+                flight.set_exception(e)
+                raise
+            self._land(key, flight)
+            flight.set_result(result)
+            return result
+
+    async def do(self, key: Hashable, func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """
+        Async form of call(): await func(*args) unless an identical call is in flight.
+
+        If the leading task is cancelled (e.g. its search was abandoned), waiting
+        callers are not failed; one of them takes over and runs the work.
+        """
+        while True:
+            flight, leader = self._join(key)
+            if not leader:
+                try:
+                    # shield: a cancelled follower must not cancel the shared flight
+                    return await asyncio.shield(asyncio.wrap_future(flight))
+                except asyncio.CancelledError:
+                    if flight.cancelled():
+                        continue
+                    raise
+            try:
+                result = await func(*args)
+            except asyncio.CancelledError:
+                self._land(key, flight)
+                flight.cancel()
+                raise
+            except BaseException as e:
+                self._land(key, flight)
+                flight.set_exception(e)
+                raise
+            self._land(key, flight)
+            flight.set_result(result)
+            return result
@@ -0,0 +1,176 @@
+import concurrent.futures
+import contextvars
+import hashlib
+import io
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, List, Optional
+from logger.app_logger import application_logger
+
+# ============================ SENTENCE CHUNKING ============================
+
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_sentences(text: str, max_chars: int = 300) -> List[str]:
+    """
+    Split text into sentence-aligned chunks of at most roughly max_chars characters.
+
+    Short sentences are grouped together so each synthesis request carries a
+    useful amount of text; a single sentence longer than max_chars is kept whole.
+
+    Args:
+        text (str): Text to split.
+        max_chars (int): Soft upper bound on chunk length.
+
+    Returns:
+        List[str]: Non-empty chunks in reading order.
+    """
+    chunks: List[str] = []
+    current = ""
+    for sentence in SENTENCE_BOUNDARY.split(text.strip()):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+# ============================ SYNTHESIS ============================
+
+
+def gtts_synthesize(text: str, lang: str = "en") -> bytes:
+    """Synthesise one chunk of text to MP3 bytes with gTTS."""
+    from gtts import gTTS
+
+    buffer = io.BytesIO()
+    with application_logger.span("tts", chars=len(text), lang=lang):
+        gTTS(text=text, lang=lang).write_to_fp(buffer)
+    return buffer.getvalue()
+
+
+class SpeechService:
+    """
+    Synthesises speech in a background worker pool and keeps the audio in memory.
+
+    Each request is split into sentence chunks that are synthesised concurrently
+    and concatenated back in order (MP3 frames can be joined directly). Finished
+    audio is kept in a bounded LRU cache keyed by a hash of the text, so repeated
+    answers are served without calling the synthesiser again. Nothing is written
+    to disk, so concurrent sessions cannot overwrite each other's audio.
+    """
+
+    def __init__(self, synthesize: Callable[[str, str], bytes] = gtts_synthesize, max_workers: int = 4,
+                 cache_size: int = 64, max_chunk_chars: int = 300) -> None:
+        """
+        Args:
+            synthesize (Callable[[str, str], bytes]): Function turning (text, lang) into audio bytes; pass a stub offline.
+            max_workers (int): Chunks synthesised in parallel across all requests.
+            cache_size (int): Number of finished answers kept in memory.
+            max_chunk_chars (int): Soft upper bound on the length of each synthesised chunk.
+        """
+        self.synthesize = synthesize
+        self.cache_size = cache_size
+        self.max_chunk_chars = max_chunk_chars
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tts")
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._pending: dict = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.max_workers = max_workers
+        self._active_chunks = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of chunks queued or being synthesised."""
+        return self._active_chunks
+
+    @staticmethod
+    def cache_key(text: str, lang: str) -> str:
+        return hashlib.sha256(f"{lang}\0{text}".encode("utf-8")).hexdigest()
+
+    def submit(self, text: str, lang: str = "en") -> concurrent.futures.Future:
+        """
+        Start synthesising text in the background.
+
+        Args:
+            text (str): Text to speak.
+            lang (str): gTTS language code.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the MP3 bytes for the whole text.
+        """
+        key = self.cache_key(text, lang)
+        with self._lock:
+            if key in self._cache:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                done: concurrent.futures.Future = concurrent.futures.Future()
+                done.set_result(self._cache[key])
+                return done
+            if key in self._pending:
+                return self._pending[key]
+            self.misses += 1
+
+            # Run each chunk in a copy of the caller's context so its trace id follows it
+            chunk_futures = [
+                self._executor.submit(contextvars.copy_context().run, self.synthesize, chunk, lang)
+                for chunk in split_sentences(text, self.max_chunk_chars)
+            ]
+            result: concurrent.futures.Future = concurrent.futures.Future()
+            self._pending[key] = result
+            self._active_chunks += len(chunk_futures)
+
+        self._collect(key, chunk_futures, result)
+        return result
+
+    def _collect(self, key: str, chunk_futures: List[concurrent.futures.Future],
+                 result: concurrent.futures.Future) -> None:
+        """Join chunk audio in order once every chunk has finished, then cache it."""
+        remaining = [len(chunk_futures)]
+
+        def finish() -> None:
+            try:
+                audio = b"".join(f.result() for f in chunk_futures)
+            except Exception as e:
+                with self._lock:
+                    self._pending.pop(key, None)
+                application_logger.log_error(f"Audio conversion error: {e}")
+                result.set_exception(e)
+                return
+            with self._lock:
+                self._cache[key] = audio
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+                self._pending.pop(key, None)
+            application_logger.log_info("Text successfully converted to audio", level="INFO")
+            result.set_result(audio)
+
+        def on_chunk_done(_: concurrent.futures.Future) -> None:
+            with self._lock:
+                remaining[0] -= 1
+                self._active_chunks -= 1
+                last = remaining[0] == 0
+            if last:
+                finish()
+
+        if not chunk_futures:
+            finish()
+            return
+        for future in chunk_futures:
+            future.add_done_callback(on_chunk_done)
+
+    def synthesize_now(self, text: str, lang: str = "en", timeout: Optional[float] = None) -> bytes:
+        """Blocking convenience wrapper around submit()."""
+        return self.submit(text, lang).result(timeout=timeout)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -2,6 +2,20 @@ import requests
 from bs4 import BeautifulSoup
 from sentence_transformers import SentenceTransformer, util
 from transformers import pipeline
+from singleflight import SingleFlight
+from domain_trust import domain_trust_score
+from scoring import DEFAULT_WEIGHTS, score_result
+from scoring_config import SCORING_VERSION, SENTIMENT_MODEL, SIMILARITY_MODEL, get_result_cache
+from validity_cache import sha256_text
+
+# External APIs used by the helper checks (overridable, e.g. by the replay benchmarks)
+FACT_CHECK_API_URL = "https://toolbox.google.com/factcheck/api/v1/claimsearch"
+SERPAPI_URL = "https://serpapi.com/search"
+SCORE_WEIGHTS = dict(DEFAULT_WEIGHTS)
+
+# Identical (query, URL) checks running at the same time are computed once
+_validity_checks = SingleFlight()
+
 
 def rate_url_validity(user_query: str, url: str) -> dict:
     """
@@ -15,6 +29,15 @@ def rate_url_validity(user_query: str, url: str) -> dict:
     Returns:
         dict: A dictionary containing scores for different validity aspects.
     """
+    return _validity_checks.call((user_query, url), _rate_url_validity, user_query, url)
+
+
+def _rate_url_validity(user_query: str, url: str) -> dict:
+    """Uncoalesced body of rate_url_validity."""
+    cache = get_result_cache()
+    cached = cache.get_recent(user_query, url, SCORING_VERSION)
+    if cached is not None:
+        return score_result(cached, SCORE_WEIGHTS)
 
     # === Step 1: Fetch Page Content ===
     try:
@@ -25,20 +48,24 @@ def rate_url_validity(user_query: str, url: str) -> dict:
     except Exception as e:
         return {"error": f"Failed to fetch content: {str(e)}"}
 
-    # === Step 2: Domain Authority Check (Moz API) ===
-    # Replace with actual Moz API call
-    domain_trust = 60  # Placeholder value (Scale: 0-100)
+    content_hash = sha256_text(page_text)
+    cached = cache.get(user_query, url, content_hash, SCORING_VERSION)
+    if cached is not None:
+        return score_result(cached, SCORE_WEIGHTS)
+
+    # === Step 2: Domain Authority Check (offline index, see domain_trust.py) ===
+    domain_trust = domain_trust_score(url)  # Scale: 0-100; unknown domains get DEFAULT_TRUST
 
     # === Step 3: Content Relevance (Semantic Similarity using Hugging Face) ===
     # I got the API Key from: Huggingface website > settings > access token
-    model = SentenceTransformer('sentence-transformers/all-mpnet-base-v2')
+    model = SentenceTransformer(SIMILARITY_MODEL)
     similarity_score = util.pytorch_cos_sim(model.encode(user_query), model.encode(page_text)).item() * 100
 
     # === Step 4: Fact-Checking (Google Fact Check API) ===
     fact_check_score = check_facts(page_text)
 
     # === Step 5: Bias Detection (NLP Sentiment Analysis) ===
-    sentiment_pipeline = pipeline("text-classification", model="cardiffnlp/twitter-roberta-base-sentiment")
+    sentiment_pipeline = pipeline("text-classification", model=SENTIMENT_MODEL)
     sentiment_result = sentiment_pipeline(page_text[:512])[0]  # Process first 512 characters
     bias_score = 100 if sentiment_result["label"] == "POSITIVE" else 50 if sentiment_result["label"] == "NEUTRAL" else 30
 
@@ -46,23 +73,16 @@ def rate_url_validity(user_query: str, url: str) -> dict:
     citation_count = check_google_scholar(url)
     citation_score = min(citation_count * 10, 100)  # Normalize
 
-    # === Step 7: Compute Final Validity Score ===
-    final_score = (
-        (0.3 * domain_trust) +
-        (0.3 * similarity_score) +
-        (0.2 * fact_check_score) +
-        (0.1 * bias_score) +
-        (0.1 * citation_score)
-    )
-
-    return {
+    # === Step 7: Compute Final Validity Score (weighted sum, see scoring.py) ===
+    result = score_result({
         "Domain Trust": domain_trust,
         "Content Relevance": similarity_score,
         "Fact-Check Score": fact_check_score,
         "Bias Score": bias_score,
         "Citation Score": citation_score,
-        "Final Validity Score": final_score
-    }
+    }, SCORE_WEIGHTS)
+    cache.put(user_query, url, content_hash, SCORING_VERSION, result)
+    return result
 
 
 # === Helper Function: Fact-Checking via Google API ===
@@ -71,7 +91,7 @@ def check_facts(text: str) -> int:
     Cross-checks text against Google Fact Check API.
     Returns a score between 0-100 indicating factual reliability.
     """
-    api_url = f"https://toolbox.google.com/factcheck/api/v1/claimsearch?query={text[:200]}"
+    api_url = f"{FACT_CHECK_API_URL}?query={text[:200]}"
     try:
         response = requests.get(api_url)
         data = response.json()
@@ -91,7 +111,7 @@ def check_google_scholar(url: str) -> int:
     serpapi_key = "Api key"
     params = {"q": url, "engine": "google_scholar", "api_key": serpapi_key}
     try:
-        response = requests.get("https://serpapi.com/search", params=params)
+        response = requests.get(SERPAPI_URL, params=params)
         data = response.json()
         return len(data.get("organic_results", []))
     except:
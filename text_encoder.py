@@ -0,0 +1,168 @@
+import argparse
+import itertools
+import json
+import pickle
+from typing import Dict, List, Any, Iterable, Optional
+import numpy as np
+
+# Same defaults as the Keras Tokenizer the vocabulary was fitted with
+DEFAULT_FILTERS: str = '!"#$%&()*+,-./:;<=>?@[\\]^_`{|}~\t\n'
+
+
+class _PickledTokenizer:
+    """Attribute holder standing in for keras' Tokenizer when reading tokenizer.pkl."""
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+
+
+class _TokenizerUnpickler(pickle.Unpickler):
+    """Unpickles tokenizer.pkl without importing Keras/TensorFlow."""
+
+    def find_class(self, module: str, name: str):
+        if name == "Tokenizer" and module.startswith("keras"):
+            return _PickledTokenizer
+        if module in ("collections", "builtins"):
+            return super().find_class(module, name)
+        raise pickle.UnpicklingError(f"Unexpected class in tokenizer pickle: {module}.{name}")
+
+
+def export_vocabulary(tokenizer_path: str, vocab_path: str) -> Dict[str, Any]:
+    """
+    Export the word index and text-splitting settings of a pickled Keras Tokenizer to JSON.
+
+    Args:
+        tokenizer_path (str): Path to the pickled tokenizer.
+        vocab_path (str): Destination JSON file.
+
+    Returns:
+        Dict[str, Any]: The exported vocabulary.
+    """
+    with open(tokenizer_path, "rb") as f:
+        tokenizer = _TokenizerUnpickler(f).load()
+
+    if getattr(tokenizer, "analyzer", None) is not None:
+        raise ValueError("Tokenizers with a custom analyzer cannot be exported")
+
+    vocabulary = {
+        "filters": tokenizer.filters,
+        "lower": tokenizer.lower,
+        "split": tokenizer.split,
+        "char_level": tokenizer.char_level,
+        "num_words": tokenizer.num_words,
+        "oov_token": tokenizer.oov_token,
+        "word_index": dict(tokenizer.word_index),
+    }
+    with open(vocab_path, "w", encoding="utf-8") as f:
+        json.dump(vocabulary, f, ensure_ascii=False, separators=(",", ":"))
+    return vocabulary
+
+
+class TextEncoder:
+    """
+    Dependency-light replacement for Tokenizer.texts_to_sequences plus pad_sequences.
+    """
+
+    def __init__(self, word_index: Dict[str, int], filters: str = DEFAULT_FILTERS, lower: bool = True,
+                 split: str = " ", char_level: bool = False, num_words: Optional[int] = None,
+                 oov_token: Optional[str] = None) -> None:
+        self.word_index = word_index
+        self.lower = lower
+        self.split = split
+        self.char_level = char_level
+        self.num_words = num_words
+        self.oov_token = oov_token
+        self.oov_index: Optional[int] = word_index.get(oov_token) if oov_token is not None else None
+        self._translate_map = str.maketrans({c: split for c in filters})
+
+    @classmethod
+    def from_json(cls, vocab_path: str) -> "TextEncoder":
+        """Load an encoder from a vocabulary file written by export_vocabulary."""
+        with open(vocab_path, "r", encoding="utf-8") as f:
+            vocabulary = json.load(f)
+        return cls(**vocabulary)
+
+    def _split_words(self, text: str) -> Iterable[str]:
+        if self.lower:
+            text = text.lower()
+        if self.char_level:
+            return text
+        return [w for w in text.translate(self._translate_map).split(self.split) if w]
+
+    def texts_to_sequences(self, texts: Iterable[str]) -> List[List[int]]:
+        """
+        Convert texts to lists of word ids exactly as the Keras Tokenizer does.
+
+        Args:
+            texts (Iterable[str]): Input texts.
+
+        Returns:
+            List[List[int]]: One id sequence per text; unknown words are dropped unless an OOV token is set.
+        """
+        sequences: List[List[int]] = []
+        for text in texts:
+            ids: List[int] = []
+            for word in self._split_words(text):
+                i = self.word_index.get(word)
+                if i is not None:
+                    if self.num_words and i >= self.num_words:
+                        if self.oov_index is not None:
+                            ids.append(self.oov_index)
+                    else:
+                        ids.append(i)
+                elif self.oov_token is not None:
+                    ids.append(self.oov_index)
+            sequences.append(ids)
+        return sequences
+
+    def encode(self, texts: List[str], maxlen: int, padding: str = "post", truncating: str = "pre") -> np.ndarray:
+        """Tokenize and pad texts into the (num_texts, maxlen) int32 matrix the model expects."""
+        return pad_sequences(self.texts_to_sequences(texts), maxlen=maxlen, padding=padding, truncating=truncating)
+
+
+def pad_sequences(sequences: List[List[int]], maxlen: Optional[int] = None, dtype: str = "int32",
+                  padding: str = "pre", truncating: str = "pre", value: int = 0) -> np.ndarray:
+    """
+    NumPy equivalent of keras.utils.pad_sequences for 1-D integer sequences.
+
+    All sequences are scattered into the output with a single fancy-indexing
+    assignment instead of one slice assignment per row.
+    """
+    if padding not in ("pre", "post"):
+        raise ValueError(f'Padding type "{padding}" not understood')
+    if truncating not in ("pre", "post"):
+        raise ValueError(f'Truncating type "{truncating}" not understood')
+
+    num_samples = len(sequences)
+    lengths = np.fromiter((len(s) for s in sequences), dtype=np.int64, count=num_samples)
+    if maxlen is None:
+        maxlen = int(lengths.max()) if num_samples else 0
+
+    padded = np.full((num_samples, maxlen), value, dtype=dtype)
+    kept = np.minimum(lengths, maxlen)
+    if not kept.sum():
+        return padded
+
+    flat = np.fromiter(itertools.chain.from_iterable(sequences), dtype=dtype, count=int(lengths.sum()))
+    seq_starts = np.cumsum(lengths) - lengths
+    src_starts = seq_starts + (lengths - kept) if truncating == "pre" else seq_starts
+    dst_starts = np.zeros_like(kept) if padding == "post" else maxlen - kept
+
+    rows = np.repeat(np.arange(num_samples), kept)
+    offsets = np.arange(int(kept.sum())) - np.repeat(np.cumsum(kept) - kept, kept)
+    padded[rows, np.repeat(dst_starts, kept) + offsets] = flat[np.repeat(src_starts, kept) + offsets]
+    return padded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export tokenizer.pkl to a JSON vocabulary for TextEncoder.")
+    parser.add_argument("--tokenizer", default="tokenizer.pkl")
+    parser.add_argument("--output", default="tokenizer_vocab.json")
+    args = parser.parse_args()
+
+    vocabulary = export_vocabulary(args.tokenizer, args.output)
+    print(f"Exported {len(vocabulary['word_index'])} words to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Any, Dict, List, Optional, Tuple
+
+# ============================ RESULT STORE ============================
+# rate_url_validity results keyed on (query hash, URL, content hash, scoring
+# version). The scoring version fingerprints the models, so any change to them
+# makes old rows unreachable; prune() then deletes them. Weights are not part of
+# the key: the final score is recomputed from the stored signals (see scoring.py).
+# SQLite in WAL mode lets several evaluation processes share one file.
+
+DEFAULT_CACHE_PATH: str = os.environ.get(
+    "VALIDITY_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".validity_cache.sqlite3"),
+)
+DEFAULT_CONTENT_TTL_SECONDS: float = 3600.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS validity_results (
+    query_hash TEXT NOT NULL,
+    url TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    scoring_version TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (query_hash, url, content_hash, scoring_version)
+);
+CREATE INDEX IF NOT EXISTS validity_results_recent
+    ON validity_results (query_hash, url, scoring_version, created_at);
+"""
+
+
+def sha256_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def scoring_version(**components: Any) -> str:
+    """
+    Fingerprint of everything that affects a score (model ids, weights, constants).
+
+    Args:
+        **components: JSON-serialisable values, e.g. model names and the weight dict.
+
+    Returns:
+        str: Short stable hash; changes whenever any component changes.
+    """
+    return sha256_text(json.dumps(components, sort_keys=True, default=str))[:16]
+
+
+class ValidityCache:
+    """SQLite-backed store of full rate_url_validity result dicts."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, content_ttl: float = DEFAULT_CONTENT_TTL_SECONDS) -> None:
+        """
+        Args:
+            path (str): SQLite database file, created if missing.
+            content_ttl (float): How long a page is assumed unchanged, letting
+                get_recent() answer without re-downloading it. 0 always re-checks content.
+        """
+        self.path = path
+        self.content_ttl = content_ttl
+        self.hits = 0
+        self.misses = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per operation: sqlite3 connections are bound to
+        # the thread that created them, and opening one is cheap.
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _record(self, row: Optional[tuple]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def get(self, query: str, url: str, content_hash: str, version: str) -> Optional[Dict[str, Any]]:
+        """Result for this exact page content, or None."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT result FROM validity_results"
+                " WHERE query_hash = ? AND url = ? AND content_hash = ? AND scoring_version = ?",
+                (sha256_text(query), url, content_hash, version),
+            ).fetchone()
+        return self._record(row)
+
+    def get_recent(self, query: str, url: str, version: str) -> Optional[Dict[str, Any]]:
+        """Newest result scored within content_ttl, without needing the page content."""
+        if self.content_ttl <= 0:
+            return None
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT result FROM validity_results"
+                " WHERE query_hash = ? AND url = ? AND scoring_version = ? AND created_at >= ?"
+                " ORDER BY created_at DESC LIMIT 1",
+                (sha256_text(query), url, version, time.time() - self.content_ttl),
+            ).fetchone()
+        if row is None:
+            return None  # Not a miss yet: the caller falls back to get() after fetching
+        self.hits += 1
+        return json.loads(row[0])
+
+    def latest_results(self, version: str) -> List[Tuple[str, str, Dict[str, Any]]]:
+        """Newest (query_hash, url, result) per query and URL for a scoring version."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT query_hash, url, result FROM validity_results WHERE scoring_version = ? ORDER BY created_at",
+                (version,),
+            ).fetchall()
+        latest = {(query_hash, url): result for query_hash, url, result in rows}
+        return [(query_hash, url, json.loads(result)) for (query_hash, url), result in latest.items()]
+
+    def put(self, query: str, url: str, content_hash: str, version: str, result: Dict[str, Any]) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO validity_results VALUES (?, ?, ?, ?, ?, ?)",
+                (sha256_text(query), url, content_hash, version, json.dumps(result), time.time()),
+            )
+
+    def invalidate(self, url: Optional[str] = None) -> int:
+        """Delete every result, or only those for one URL. Returns the number of rows removed."""
+        with closing(self._connect()) as conn, conn:
+            if url is None:
+                return conn.execute("DELETE FROM validity_results").rowcount
+            return conn.execute("DELETE FROM validity_results WHERE url = ?", (url,)).rowcount
+
+    def prune(self, current_version: str) -> int:
+        """Delete results computed with any other scoring version (older models)."""
+        with closing(self._connect()) as conn, conn:
+            return conn.execute(
+                "DELETE FROM validity_results WHERE scoring_version != ?", (current_version,)
+            ).rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT scoring_version, COUNT(*) FROM validity_results GROUP BY scoring_version"
+            ).fetchall()
+        return {"path": self.path, "rows_by_version": dict(rows), "hits": self.hits, "misses": self.misses}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Inspect or invalidate the rate_url_validity result cache.")
+    parser.add_argument("--path", default=DEFAULT_CACHE_PATH)
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--clear", action="store_true", help="Delete every cached result")
+    action.add_argument("--url", help="Delete cached results for one URL")
+    action.add_argument("--prune", action="store_true", help="Delete results from older models")
+    args = parser.parse_args()
+
+    cache = ValidityCache(args.path)
+    if args.clear:
+        print(f"Removed {cache.invalidate()} results")
+    elif args.url:
+        print(f"Removed {cache.invalidate(args.url)} results")
+    elif args.prune:
+        from scoring_config import SCORING_VERSION
+
+        print(f"Removed {cache.prune(SCORING_VERSION)} results")
+    print(json.dumps(cache.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()